@@ -5,7 +5,7 @@ import re
 from typing import Optional, Dict, Any, List
 
 from infra.config import SETTINGS
-from infra.db import run_sql
+from infra.db import iter_sql
 
 # ---------- Whitelist de tablas/columnas permitidas ----------
 _ALLOWED: Dict[str, List[str]] = {
@@ -121,9 +121,8 @@ def try_sql_answer(question: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        rows = run_sql(sql) or []
-        # Reducimos filas a 50 para evitar respuestas enormes
-        rows = rows[:50]
+        # Máximo 50 filas, leídas en streaming para evitar respuestas enormes
+        rows = list(iter_sql(sql, max_rows=50))
         return {"sql": sql, "rows": rows}
     except Exception:
         return None
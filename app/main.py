@@ -1,10 +1,17 @@
 # app/main.py
+import asyncio
 import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+from infra.config import SETTINGS
 from infra.db import db_health
+from app.strands.infrastructure.database.async_connection import async_db
+from app.strands.infrastructure.database.connection import db
+from app.strands.infrastructure.warmup import readiness, start_warm_up
 from app.supervisor import handle_query
 
 # --- Routers ---
@@ -18,7 +25,17 @@ from app.strands.routes import router as strands_router
 # -----------------------------------------------------------------------------
 # FastAPI App
 # -----------------------------------------------------------------------------
-app = FastAPI(title="Origin Insights LLM")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pools y secretos se abren en segundo plano: el puerto queda disponible ya.
+    warm_up_task = start_warm_up()
+    yield
+    warm_up_task.cancel()
+    await async_db.close()
+    if db.initialized:
+        await asyncio.to_thread(db.close_all)
+
+app = FastAPI(title="Origin Insights LLM", lifespan=lifespan)
 
 # --- CORS configurable ---
 _allow = (os.getenv("ALLOW_ORIGINS") or "*").split(",")
@@ -47,7 +64,10 @@ def root():
 
 @app.get("/healthz")
 def health():
-    return {"ok": True, "db": db_health()}
+    ready = readiness()
+    # Mientras el warm-up no abrió el pool, no forzamos una conexión aquí.
+    db_ok = db_health() if (SETTINGS.offline_mode or ready["db_initialized"]) else None
+    return {"ok": True, "db": db_ok, "ready": ready}
 
 BUILD_META = {
     "sha": os.getenv("BUILD_SHA", "unknown"),
@@ -3,79 +3,9 @@ import re
 import datetime as dt
 from typing import Optional, Tuple, List, Dict, Any
 
-# ===================== DB connector shim =====================
-# Se adapta a distintos helpers posibles en infra/db.py.
-# Si no existiera ninguno, usa DATABASE_URL (psycopg 3).
-def _build_db_conn():
-    # intenta varias firmas comunes
-    try:
-        from infra.db import get_conn as _gc  # pragma: no cover
-        return _gc
-    except Exception:
-        pass
-    try:
-        from infra.db import get_connection as _gc  # pragma: no cover
-        return _gc
-    except Exception:
-        pass
-    try:
-        from infra.db import get_pg as _gp  # pragma: no cover
-        return _gp
-    except Exception:
-        pass
-    try:
-        from infra.db import connect as _cx  # pragma: no cover
-        return _cx
-    except Exception:
-        pass
-    try:
-        from infra.db import pool as _pool  # pragma: no cover
-        def _from_pool():
-            # asume psycopg3 pool (pool.connection()) o simple callable
-            try:
-                return _pool.connection()
-            except Exception:
-                return _pool()
-        return _from_pool
-    except Exception:
-        pass
-
-    # Fallback: conectar con psycopg usando env vars
-    def _dsn():
-        dsn = (
-            os.getenv("DATABASE_URL")
-            or os.getenv("PG_DSN")
-            or (
-                "dbname={dbname} user={user} password={password} host={host} port={port}".format(
-                    dbname=os.getenv("PGDATABASE", "postgres"),
-                    user=os.getenv("PGUSER", "postgres"),
-                    password=os.getenv("PGPASSWORD", ""),
-                    host=os.getenv("PGHOST", "localhost"),
-                    port=os.getenv("PGPORT", "5432"),
-                )
-            )
-        )
-        return dsn
-
-    def _fallback_connect():
-        try:
-            import psycopg  # psycopg3
-            return psycopg.connect(_dsn())
-        except Exception:
-            # último intento psycopg2
-            import psycopg2  # type: ignore
-            return psycopg2.connect(_dsn())
-
-    return _fallback_connect
-
-_get_conn = _build_db_conn()
-
-def get_conn():
-    """
-    Devuelve un objeto conexión que soporta el protocolo context manager:
-    with get_conn() as conn, conn.cursor() as cur: ...
-    """
-    return _get_conn()
+# ===================== DB =====================
+# Pool compartido (infra.db -> gateway de strands); filas como dicts.
+from infra.db import run_sql
 
 # ===================== Metadatos =====================
 from app.modules import metadata as m_meta
@@ -137,12 +67,10 @@ def get_hits_by_uid(
     # En Postgres usa posición en GROUP BY (no alias)
     sql += " GROUP BY 1 ORDER BY 1 DESC"
 
-    out: List[Dict[str, Any]] = []
-    with get_conn() as conn, conn.cursor() as cur:
-        cur.execute(sql, params)
-        for d, s in cur.fetchall():
-            out.append({"date_hits": d, "hits": float(s or 0.0)})
-    return out
+    return [
+        {"date_hits": r["d"], "hits": float(r["s"] or 0.0)}
+        for r in run_sql(sql, params)
+    ]
 
 def get_title_hits_sum(
     uid: Optional[str] = None,
@@ -170,7 +98,7 @@ def get_title_hits_sum(
     params: List[Any]
     if country_iso2:
         sql = """
-            SELECT COALESCE(SUM(hits),0)
+            SELECT COALESCE(SUM(hits),0) AS total
             FROM ms.hits_presence_2
             WHERE uid = %s
               AND country = %s
@@ -180,7 +108,7 @@ def get_title_hits_sum(
     else:
         if global_table:
             sql = f"""
-                SELECT COALESCE(SUM(hits),0)
+                SELECT COALESCE(SUM(hits),0) AS total
                 FROM {global_table}
                 WHERE uid = %s
                   AND date_hits BETWEEN %s AND %s
@@ -188,17 +116,15 @@ def get_title_hits_sum(
             params = [the_uid, df, dtf]
         else:
             sql = """
-                SELECT COALESCE(SUM(hits),0)
+                SELECT COALESCE(SUM(hits),0) AS total
                 FROM ms.hits_presence_2
                 WHERE uid = %s
                   AND date_hits BETWEEN %s AND %s
             """
             params = [the_uid, df, dtf]
 
-    with get_conn() as conn, conn.cursor() as cur:
-        cur.execute(sql, params)
-        row = cur.fetchone()
-        return float(row[0] or 0.0)
+    rows = run_sql(sql, params)
+    return float(rows[0]["total"] or 0.0) if rows else 0.0
 
 def get_top_hits_by_period(
     country_iso2: Optional[str],
@@ -247,18 +173,9 @@ def get_top_hits_by_period(
     params.append(limit)
 
     out: List[Dict[str, Any]] = []
-    with get_conn() as conn, conn.cursor() as cur:
-        cur.execute(sql, params)
-        for row in cur.fetchall():
-            out.append({
-                "uid": row[0],
-                "hits_sum": float(row[1] or 0.0),
-                "title": row[2],
-                "year": row[3],
-                "type": row[4],
-                "directors": row[5],
-                "imdb_id": row[6],
-            })
+    for row in run_sql(sql, params):
+        row["hits_sum"] = float(row["hits_sum"] or 0.0)
+        out.append(row)
     return out
 
 # ===================== Render helpers =====================
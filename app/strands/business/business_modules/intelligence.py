@@ -11,13 +11,14 @@ from app.strands.core.shared_imports import *
 from app.strands.infrastructure.database.utils import *
 from app.strands.infrastructure.database.constants import *
 from app.strands.infrastructure.validators.shared import *
-from app.strands.infrastructure.cache.query_cache import intelligence_cache
+from app.strands.infrastructure.cache.query_cache import cached_query, intelligence_cache
 from app.strands.business.business_queries.intelligence_queries import *
 from strands import tool
 
 
 @tool
-def get_platform_exclusivity_by_country(
+@cached_query(intelligence_cache, normalize=TOOL_ARG_NORMALIZERS)
+async def get_platform_exclusivity_by_country(
     platform_name: str,
     country: str,
     limit: int = 50,
@@ -47,17 +48,6 @@ def get_platform_exclusivity_by_country(
         return [{"error": f"Invalid country: '{country}'. Could not resolve to a valid ISO-2 code."}]
     
     limit_norm = validate_limit(limit, default=20, max_limit=50)
-    
-    cache_key = intelligence_cache.get_cache_key(
-        'get_platform_exclusivity_by_country',
-        resolved_platform, resolved_country, limit_norm
-    )
-    
-    cached_result = intelligence_cache.get(cache_key)
-    if cached_result is not None:
-        ident = f"{resolved_platform} @ {resolved_country} limit={limit_norm}"
-        logger.info(f"get_platform_exclusivity_by_country → {ident} ⇒ CACHE HIT")
-        return cached_result
 
     sql = (SQL_PLATFORM_EXCLUSIVITY_BY_COUNTRY
            .replace("{PRES_TBL}", PRES_TBL)
@@ -68,20 +58,20 @@ def get_platform_exclusivity_by_country(
         'country': resolved_country,
         'limit': limit_norm
     }
-    rows = db.execute_query(sql, params)
+    rows = await async_db.execute_query(sql, params)
     
     ident = f"{resolved_platform} @ {resolved_country} limit={limit_norm}"
     logger.info(f"get_platform_exclusivity_by_country → {ident} ⇒ {len(rows) if rows else 0} rows")
     
-    result = handle_query_result(rows, "platform exclusivity (country)", ident)
-    
-    intelligence_cache.set(cache_key, result)
-    
-    return result
+    return handle_query_result(rows, "platform exclusivity (country)", ident)
 
 
 @tool
-def catalog_similarity_for_platform(
+@cached_query(
+    intelligence_cache,
+    normalize={**TOOL_ARG_NORMALIZERS, "iso_a": resolve_country_iso, "iso_b": resolve_country_iso},
+)
+async def catalog_similarity_for_platform(
     platform: str,
     iso_a: str,
     iso_b: str
@@ -112,19 +102,10 @@ def catalog_similarity_for_platform(
     resolved_iso_b = resolve_country_iso(iso_b)
     if not resolved_iso_b:
         return {"error": f"Invalid country B: '{iso_b}'. Could not resolve to a valid ISO-2 code."}
-    
-    cache_key = intelligence_cache.get_cache_key(
-        'catalog_similarity_for_platform',
-        resolved_platform, resolved_iso_a, resolved_iso_b
-    )
-    
-    cached_result = intelligence_cache.get(cache_key)
-    if cached_result is not None:
-        logger.info(f"catalog_similarity_for_platform → {resolved_platform} @ {resolved_iso_a} vs {resolved_iso_b} ⇒ CACHE HIT")
-        return cached_result
+
 
     sql = SQL_CATALOG_SIMILARITY_FOR_PLATFORM.replace("{PRES_TBL}", PRES_TBL)
-    result = db.execute_query(
+    result = await async_db.execute_query(
         sql, (resolved_iso_a, resolved_iso_b, resolved_platform, 
               resolved_iso_a, resolved_iso_b)) or []
 
@@ -145,7 +126,7 @@ def catalog_similarity_for_platform(
 
     logger.info(f"catalog_similarity_for_platform → {resolved_platform} @ {resolved_iso_a} vs {resolved_iso_b} ⇒ {round(similarity_percentage, 2)}% similarity")
     
-    result_dict = {
+    return {
         'platform': resolved_platform,
         'country_a': resolved_iso_a,
         'country_b': resolved_iso_b,
@@ -156,10 +137,6 @@ def catalog_similarity_for_platform(
         'unique_to_a': unique_a,
         'unique_to_b': unique_b
     }
-    
-    intelligence_cache.set(cache_key, result_dict)
-    
-    return result_dict
 
 def _build_pin_pout_filters(platform: Optional[str]) -> Tuple[str, List[str], str, List[str]]:
     """Build platform filters for IN/OUT queries.
@@ -178,7 +155,8 @@ def _build_pin_pout_filters(platform: Optional[str]) -> Tuple[str, List[str], st
     )
 
 @tool
-def titles_in_A_not_in_B_sql(
+@cached_query(intelligence_cache, normalize=TOOL_ARG_NORMALIZERS)
+async def titles_in_A_not_in_B_sql(
     *,
     country_in: str,
     country_not_in: str,
@@ -244,7 +222,7 @@ def titles_in_A_not_in_B_sql(
     params = list(isos_in) + pin_params + list(isos_out) + \
         pout_params + [limit_norm]
 
-    rows = db.execute_query(sql, tuple(params))
+    rows = await async_db.execute_query(sql, tuple(params))
 
     region_in = f"{country_in}({len(isos_in)})" if len(
         isos_in) > 1 else isos_in[0]
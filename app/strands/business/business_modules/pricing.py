@@ -15,8 +15,12 @@ from app.strands.core.shared_imports import *
 from app.strands.business.business_queries.pricing_queries import *
 from app.strands.infrastructure.validators.shared import *
 from app.strands.content.content_modules.metadata import _validate_select
+from app.strands.infrastructure.cache.query_cache import cached_query, pricing_cache
 from strands import tool
 
+# Keyed on the prices watermark (MAX(created_at)), so TTL is only a safety net.
+PRICES_TTL_SECONDS = 6 * 3600
+
 def _resolve_definition(values: Optional[List[str]]) -> Optional[List[str]]:
     """Normalize and validate video definitions.
     
@@ -381,6 +385,7 @@ def query_presence_with_price(**kwargs) -> List[Dict[str, Any]]:
     return rows
 
 @tool
+@cached_query(pricing_cache, ttl_seconds=PRICES_TTL_SECONDS, normalize=TOOL_ARG_NORMALIZERS, watermarks=("prices",))
 def tool_prices_latest(
     platform_name: str = None,
     country: str = None,
@@ -603,7 +608,7 @@ def tool_prices_history(*args, **kwargs):
         .replace("{WHERE_CLAUSE}", " AND ".join(where_parts))
     )
 
-    rows = db.execute_query(sql, tuple(params + [limit])) or []
+    rows = db.execute_query(sql, tuple(params + [limit]), max_rows=limit) or []
     return handle_query_result(
         rows,
         "presence_prices.history",
@@ -700,6 +705,7 @@ def tool_prices_changes_last_n_days(*args, **kwargs):
     )
 
 @tool
+@cached_query(pricing_cache, ttl_seconds=PRICES_TTL_SECONDS, normalize=TOOL_ARG_NORMALIZERS, watermarks=("prices",))
 def tool_prices_stats(*args, **kwargs):
     """Estadísticas de precio (min/max/avg/medianas/pXX) con filtros comunes."""
     kwargs = normalize_args_kwargs(args, kwargs)
@@ -766,6 +772,7 @@ def tool_prices_stats(*args, **kwargs):
     )
 
 @tool
+@cached_query(pricing_cache, ttl_seconds=PRICES_TTL_SECONDS, normalize=TOOL_ARG_NORMALIZERS, watermarks=("prices",))
 def tool_prices_stats_fast(*args, **kwargs):
     """Estadísticas de precio ULTRA-RÁPIDAS (aproximadas) para datasets grandes (>100k).
     
@@ -974,7 +981,7 @@ def tool_prices_history_light(*args, **kwargs):
         .replace("{WHERE_CLAUSE}", " AND ".join(where_parts))
     )
 
-    rows = db.execute_query(sql, tuple(params + [limit])) or []
+    rows = db.execute_query(sql, tuple(params + [limit]), max_rows=limit) or []
     return handle_query_result(
         rows,
         "presence_prices.history_light",
@@ -118,8 +118,12 @@ def detect_id_kind(value: str) -> Tuple[IdKind, Optional[str]]:
     if not value:
         return "none", None
 
-    exists_hash = bool(db.execute_query(SQL_DETECT_HASH_EXISTS, (value,)))
-    exists_uid = bool(db.execute_query(SQL_DETECT_UID_EXISTS, (value,)))
+    hash_rows, uid_rows = db.execute_batch([
+        (SQL_DETECT_HASH_EXISTS, (value,)),
+        (SQL_DETECT_UID_EXISTS, (value,)),
+    ], "detect_id_kind")
+    exists_hash = bool(hash_rows)
+    exists_uid = bool(uid_rows)
 
     if exists_hash and exists_uid:
         return "both", value
@@ -166,8 +170,8 @@ def get_hashes_by_uid(
         " AND ".join(where)
     )
     
-    rows = db.execute_query(sql, tuple(params)) or []
-    return [r["hash_unique"] for r in rows if r.get("hash_unique")]
+    rows = db.execute_query(sql, tuple(params), row_format="tuple") or []
+    return [r[0] for r in rows if r[0]]
 
 
 def get_hash_by_uid(
@@ -13,16 +13,17 @@ from app.strands.infrastructure.database.utils import *
 from app.strands.core.shared_imports import *
 from app.strands.infrastructure.validators.shared import *
 from app.strands.business.business_queries.rankings_queries import *
+from app.strands.infrastructure.cache.query_cache import cached_query, rankings_cache
+from app.strands.infrastructure.cache.watermarks import watermarks
 from strands import tool
 
+# Results are keyed on the hits watermarks, so TTL is only a safety net.
+RANKINGS_TTL_SECONDS = 12 * 3600
+
 def compute_window_anchored_to_table(days_back: int) -> Optional[Tuple[str, str]]:
     logger.debug(f"Computing window anchored to table with days_back={days_back}")
 
-    rows = db.execute_query(QUERY_MAX_DATE)
-    if not rows:
-        return None
-
-    max_dt = rows[0]["max_date"] if isinstance(rows[0], dict) else rows[0][0]
+    max_dt = watermarks.get("hits_presence")
     if not max_dt:
         return None
 
@@ -37,9 +38,7 @@ def compute_window_anchored_to_table(days_back: int) -> Optional[Tuple[str, str]
     return (date_from, date_to)
 
 def max_date_hits() -> date:
-    row = db.execute_query(
-        f"SELECT MAX(date_hits)::date AS mx FROM {HITS_PRESENCE_TBL};", []) or []
-    return row[0]["mx"] or datetime.now().date()
+    return watermarks.get("hits_presence") or datetime.now().date()
 
 def _clamp_rolling(max_d: date, days: int, prev_days: int) -> Tuple[date, date, date, date]:
     cur_to = max_d
@@ -49,6 +48,8 @@ def _clamp_rolling(max_d: date, days: int, prev_days: int) -> Tuple[date, date,
     return (cur_from, cur_to, prev_from, prev_to)
 
 @tool
+@cached_query(rankings_cache, ttl_seconds=RANKINGS_TTL_SECONDS, normalize=TOOL_ARG_NORMALIZERS,
+              watermarks=("hits_presence",))
 def get_genre_momentum(
     country: Optional[str] = None,
     content_type: Optional[str] = None,
@@ -117,6 +118,8 @@ def get_genre_momentum(
     return handle_query_result(rows, "genre_momentum", ident)
 
 @tool
+@cached_query(rankings_cache, ttl_seconds=RANKINGS_TTL_SECONDS, normalize=TOOL_ARG_NORMALIZERS,
+              watermarks=("hits_global",))
 def get_top_by_uid(uid: str) -> List[Dict]:
     """Get top/rating information for a specific title UID.
 
@@ -124,12 +127,14 @@ def get_top_by_uid(uid: str) -> List[Dict]:
     if not uid:
         return [{"error": "UID required"}]
 
-    rows = db.execute_query(UID_RATING_SQL, (uid,))
+    rows = db.execute_query(UID_RATING_SQL, (uid,), prepared=True)
     logger.info(f"get_top_by_uid → {uid} ⇒ {len(rows) if rows else 0} rows")
     
     return handle_query_result(rows, "Rating by uid", f"{uid}")
 
 @tool
+@cached_query(rankings_cache, ttl_seconds=RANKINGS_TTL_SECONDS, normalize=TOOL_ARG_NORMALIZERS,
+              watermarks=("hits_presence", "hits_global"))
 def get_top_generic(
     country: Optional[str] = None,
     platform: Optional[str] = None,
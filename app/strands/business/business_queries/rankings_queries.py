@@ -1,11 +1,6 @@
 from app.strands.infrastructure.database.constants import *
 
 
-QUERY_MAX_DATE = f"""
-SELECT MAX(date_hits)::date AS max_date
-FROM {HITS_PRESENCE_TBL}
-"""
-
 QUERY_GENRE_MOMENTUM = """
 WITH base AS (
   SELECT
@@ -1,4 +1,5 @@
 from langgraph.graph import StateGraph, END
+from app.strands.core.graph_registry import compiled_graph
 from .state import State, create_initial_state
 from .supervisor import business_classifier, main_supervisor, route_from_main_supervisor
 from app.strands.business.nodes.intelligence import intelligence_node
@@ -15,7 +16,7 @@ def _route_from_classifier(state: State) -> str:
     return "intelligence_node"
 
 
-def create_streaming_graph():
+def _build_graph() -> StateGraph:
     """Create business graph without validation node."""
     print("\n" + "="*80)
     print(" CREATING BUSINESS GRAPH - NO VALIDATION NODE")
@@ -57,7 +58,12 @@ def create_streaming_graph():
     graph.add_edge("pricing_node", "main_supervisor")
     graph.add_edge("intelligence_node", "main_supervisor")
 
-    return graph.compile()
+    return graph
+
+
+def create_streaming_graph():
+    """Compiled business graph, built once per process."""
+    return compiled_graph("business", _build_graph)
 
 
 async def process_question(question: str, max_iterations: int = 3, validated_entities: dict = None) -> State:
@@ -4,7 +4,8 @@ from app.strands.business.graph_core.state import State
 from app.strands.business.nodes.prompt_business import INTELLIGENCE_PROMPT
 from app.strands.business.nodes.router_configs import (
     INTELLIGENCE_TOOLS,
-    INTELLIGENCE_ROUTER_PROMPT
+    INTELLIGENCE_ROUTER_PROMPT,
+    INTELLIGENCE_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -28,7 +29,10 @@ _intelligence_executor = BaseExecutorNode(
     tools_map=INTELLIGENCE_TOOLS_MAP,
     router_fn=create_router(
         prompt=INTELLIGENCE_ROUTER_PROMPT,
-        valid_tools=INTELLIGENCE_TOOLS
+        valid_tools=INTELLIGENCE_TOOLS,
+        name="intelligence",
+        fast_rules=INTELLIGENCE_FAST_RULES,
+        tools=INTELLIGENCE_TOOLS_MAP
     ),
     system_prompt=INTELLIGENCE_PROMPT,
     model=MODEL_NODE_EXECUTOR
@@ -111,10 +111,11 @@ def detect_id_kind(value: str) -> Tuple[IdKind, Optional[str]]:
         return "none", None
 
     q_hash = f"SELECT 1 FROM {PRICES_TBL} WHERE hash_unique = %s LIMIT 1"
-    exists_hash = bool(db.execute_query(q_hash, (value,)))
-
     q_uid = f"SELECT 1 FROM {PRES_TBL} WHERE uid = %s LIMIT 1"
-    exists_uid = bool(db.execute_query(q_uid, (value,)))
+    hash_rows, uid_rows = db.execute_batch(
+        [(q_hash, (value,)), (q_uid, (value,))], "detect_id_kind")
+    exists_hash = bool(hash_rows)
+    exists_uid = bool(uid_rows)
 
     if exists_hash and exists_uid:
         return "both", value
@@ -142,8 +143,8 @@ def get_hashes_by_uid(uid: str, *, iso: Optional[str] = None, platform_name: Opt
         FROM {PRES_TBL} p
         WHERE {" AND ".join(where)}
     """
-    rows = db.execute_query(sql, tuple(params)) or []
-    return [r["hash_unique"] for r in rows if r.get("hash_unique")]
+    rows = db.execute_query(sql, tuple(params), row_format="tuple") or []
+    return [r[0] for r in rows if r[0]]
 
 def get_hash_by_uid(uid: str, *, iso: Optional[str] = None, platform_name: Optional[str] = None) -> Optional[str]:
     """
@@ -4,7 +4,8 @@ from app.strands.business.graph_core.state import State
 from app.strands.business.nodes.prompt_business import PRICING_PROMPT
 from app.strands.business.nodes.router_configs import (
     PRICING_TOOLS,
-    PRICING_ROUTER_PROMPT
+    PRICING_ROUTER_PROMPT,
+    PRICING_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -37,7 +38,10 @@ _pricing_executor = BaseExecutorNode(
     tools_map=PRICING_TOOLS_MAP,
     router_fn=create_router(
         prompt=PRICING_ROUTER_PROMPT,
-        valid_tools=PRICING_TOOLS
+        valid_tools=PRICING_TOOLS,
+        name="pricing",
+        fast_rules=PRICING_FAST_RULES,
+        tools=PRICING_TOOLS_MAP
     ),
     system_prompt=PRICING_PROMPT,
     model=MODEL_NODE_EXECUTOR
@@ -4,7 +4,8 @@ from app.strands.business.graph_core.state import State
 from app.strands.business.nodes.prompt_business import RANKINGS_PROMPT
 from app.strands.business.nodes.router_configs import (
     RANKINGS_TOOLS,
-    RANKINGS_ROUTER_PROMPT
+    RANKINGS_ROUTER_PROMPT,
+    RANKINGS_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -37,7 +38,10 @@ _rankings_executor = BaseExecutorNode(
     tools_map=RANKINGS_TOOLS_MAP,
     router_fn=create_router(
         prompt=RANKINGS_ROUTER_PROMPT,
-        valid_tools=RANKINGS_TOOLS
+        valid_tools=RANKINGS_TOOLS,
+        name="rankings",
+        fast_rules=RANKINGS_FAST_RULES,
+        tools=RANKINGS_TOOLS_MAP
     ),
     system_prompt=RANKINGS_PROMPT,
     model=MODEL_NODE_EXECUTOR
@@ -37,3 +37,70 @@ INTELLIGENCE_TOOLS = {
     "catalog_similarity_for_platform",
     "titles_in_A_not_in_B_sql"
 }
+
+
+# Fast-path rules (core/factories/fast_router): keywords match whole words on
+# the casefolded, accent-free question, so list every inflection.
+RANKINGS_FAST_RULES = {
+    "get_genre_momentum": {
+        "keywords": ("momentum", "generos en tendencia", "generos populares", "trending genre", "genre trend",
+                     "tendencia de genero", "tendencias de genero"),
+    },
+    "get_top_by_uid": {
+        "keywords": ("posicion", "posiciones", "position", "positions", "en que puesto", "what rank",
+                     "ranking de", "ranking of"),
+        "entities": ("uid",),
+        "excludes": ("genero", "generos", "genre", "genres"),
+    },
+    "get_top_generic": {
+        "keywords": ("top", "ranking", "rankings", "mas visto", "mas vista", "mas vistos", "mas vistas",
+                     "mas popular", "mas populares", "most watched", "most popular", "mejores", "best"),
+        "excludes": ("momentum", "tendencia de genero", "generos en tendencia", "posicion", "posiciones",
+                     "position", "positions"),
+    },
+}
+
+PRICING_FAST_RULES = {
+    "tool_prices_latest": {
+        "keywords": ("precio actual", "current price", "cuanto cuesta", "how much", "cuanto vale",
+                     "ultimo precio", "latest price", "precio de", "price of"),
+        "excludes": ("historico", "historica", "historicos", "historial", "historic", "historical", "history",
+                     "cambio", "cambios", "cambiaron", "cambiado", "change", "changes", "changed",
+                     "estadistica", "estadisticas", "estadistico", "estadisticos", "statistic", "statistics",
+                     "promedio", "promedios", "average", "media", "hits"),
+    },
+    "tool_prices_history_light": {
+        "keywords": ("historico", "historica", "historicos", "historial", "historic", "historical", "history",
+                     "evolucion", "evolution"),
+    },
+    "tool_prices_changes_last_n_days": {
+        "keywords": ("cambio", "cambios", "cambiaron", "cambiado", "change", "changes", "changed", "subio",
+                     "subieron", "bajo", "bajaron", "aumento", "aumentos", "aumentaron", "aumentado",
+                     "increase", "increases", "increased", "decrease", "decreases", "decreased"),
+        "excludes": ("historico", "historica", "historicos", "historial", "historic", "historical",
+                     "history"),
+    },
+    "tool_prices_stats": {
+        "keywords": ("estadistica", "estadisticas", "estadistico", "estadisticos", "statistic", "statistics",
+                     "promedio", "promedios", "average", "mediana", "median", "minimo", "minima", "maximo",
+                     "maxima"),
+    },
+    "tool_hits_with_quality": {
+        "keywords": ("hits", "calidad", "quality", "4k", "uhd"),
+    },
+}
+
+INTELLIGENCE_FAST_RULES = {
+    "get_platform_exclusivity_by_country": {
+        "keywords": ("exclusivo", "exclusiva", "exclusivos", "exclusivas", "exclusividad", "exclusive",
+                     "exclusives", "exclusivity", "solo en", "only on"),
+        "excludes": ("similar", "similares", "pero no en", "but not in", "not in"),
+    },
+    "catalog_similarity_for_platform": {
+        "keywords": ("similar", "similares", "parecido", "parecida", "parecidos", "parecidas",
+                     "compare catalog", "comparar catalogo"),
+    },
+    "titles_in_A_not_in_B_sql": {
+        "keywords": ("pero no en", "but not in", "y no en", "and not in", "no estan en", "not available in"),
+    },
+}
@@ -1,12 +1,17 @@
 from __future__ import annotations
+import copy
+import os
 from app.strands.core.shared_imports import *
 from app.strands.infrastructure.database.utils import *
+from app.strands.infrastructure.cache.query_cache import validation_cache
 from app.strands.common.common_queries.queries_validation import *
 from strands import tool
 
 MAX_OPTIONS_DISPLAY = 8
 MAX_VALIDATION_OPTIONS = 5
 DEFAULT_FALLBACK_THRESHOLDS = [0.3, 0.2]
+# not_found is cached briefly so newly loaded titles/people show up soon.
+NOT_FOUND_TTL_SECONDS = float(os.getenv("VALIDATION_NOT_FOUND_TTL_SECONDS", "300"))
 
 def _build_title_result(row: Dict, is_fuzzy: bool = False) -> Dict[str, Any]:
     """Builds a standardized title result dictionary."""
@@ -66,13 +71,36 @@ def _normalize_and_validate_input(input_data: Union[str, List[str], Any]) -> Opt
     cleaned = clean_text(normalized)
     return cleaned if cleaned else None
 
+def _cached_validation(
+    entity_type: str,
+    normalized_query: str,
+    threshold: Optional[float],
+    resolve: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Returns the cached outcome for (entity, normalized input, threshold), resolving it once on a miss."""
+    # Matching is case-insensitive (ILIKE / LOWER / pg_trgm), so is the key.
+    cache_key = validation_cache.get_cache_key(
+        entity_type, " ".join(normalized_query.casefold().split()), normalize_threshold(threshold))
+    outcome = validation_cache.get(cache_key)
+    if outcome is None:
+        def load() -> Dict[str, Any]:
+            result = resolve()
+            ttl = NOT_FOUND_TTL_SECONDS if result.get("status") == "not_found" else None
+            validation_cache.set(cache_key, result, ttl_seconds=ttl)
+            return result
+
+        outcome = validation_cache.flight.do(cache_key, load)
+    # Callers enrich the dict (entity ids, options); never hand out the cached one.
+    return copy.deepcopy(outcome)
+
 def _perform_exact_search(sql_query: str, params: tuple, search_type: str) -> List[Dict]:
     """Performs exact search with given SQL and parameters."""
-    return db.execute_query(sql_query, params, f"{search_type} exact search")
+    return db.execute_query(sql_query, params, f"{search_type} exact search", prepared=True)
 
 def _perform_fuzzy_search(sql_query: str, params: tuple, search_type: str, threshold: float) -> List[Dict]:
     """Performs fuzzy search with given SQL and parameters."""
-    return db.execute_query(sql_query, params, f"{search_type} fuzzy search (threshold {threshold})")
+    return db.execute_query(
+        sql_query, params, f"{search_type} fuzzy search (threshold {threshold})", prepared=True)
 
 def _try_exact_title_search(normalized_title: str) -> Optional[Dict[str, Any]]:
     """Attempts exact title search and returns appropriate response."""
@@ -88,18 +116,27 @@ def _try_exact_title_search(normalized_title: str) -> Optional[Dict[str, Any]]:
     return {"status": "ambiguous", "options": _build_title_options(exact_results)}
 
 def _try_fuzzy_title_search(normalized_title: str, threshold: Optional[float]) -> Dict[str, Any]:
-    """Attempts fuzzy title search with fallback thresholds."""
+    """Attempts fuzzy title search with fallback thresholds.
+
+    One query at the lowest threshold; each fallback pass is a filter over
+    it (results are ordered by similarity, so the top rows above a higher
+    threshold are the same ones the stricter query would return).
+    """
     threshold = normalize_threshold(threshold)
+    thresholds = [threshold] + DEFAULT_FALLBACK_THRESHOLDS
+    lowest = min(thresholds)
 
-    for current_threshold in [threshold] + DEFAULT_FALLBACK_THRESHOLDS:
+    params = (normalized_title, lowest, lowest, lowest, DEFAULT_FUZZY_LIMIT)
+    all_results = _perform_fuzzy_search(FUZZY_SEARCH_SQL, params, "title", lowest)
+
+    for current_threshold in thresholds:
         logger.debug(
             f"Trying title fuzzy search with threshold {current_threshold}")
 
-        params = (normalized_title, current_threshold,
-                  current_threshold, current_threshold, DEFAULT_FUZZY_LIMIT)
-        fuzzy_results = _perform_fuzzy_search(
-            FUZZY_SEARCH_SQL, params, "title", current_threshold)
-
+        fuzzy_results = [
+            r for r in all_results
+            if safe_cast_float(r.get('title_similarity')) >= current_threshold
+        ]
         if fuzzy_results:
             return _process_fuzzy_title_results(fuzzy_results, normalized_title, current_threshold)
 
@@ -168,6 +205,21 @@ def _validate_person_entity(
     if not normalized_query:
         return {"status": "not_found"}
 
+    return _cached_validation(
+        entity_type, normalized_query, threshold,
+        lambda: _resolve_person_entity(
+            normalized_query, exact_sql, fuzzy_sql, entity_type, threshold, sort_by_titles),
+    )
+
+def _resolve_person_entity(
+    normalized_query: str,
+    exact_sql: str,
+    fuzzy_sql: str,
+    entity_type: str,
+    threshold: Optional[float],
+    sort_by_titles: bool
+) -> Dict[str, Any]:
+    """Exact search, then fuzzy search with fallback thresholds (uncached)."""
     threshold = normalize_threshold(threshold)
     logger.debug(
         f"Validating {entity_type}: '{normalized_query}' with threshold {threshold}")
@@ -187,13 +239,16 @@ def _validate_person_entity(
 
         return {"status": "ambiguous", "options": exact_options}
 
+    # The ILIKE candidate query does not depend on the threshold; fetch it
+    # once and only re-score per fallback threshold.
+    fuzzy_results = _perform_fuzzy_search(
+        fuzzy_sql, (normalized_query,), entity_type, threshold)
+    if not fuzzy_results:
+        return {"status": "not_found"}
+
     for current_threshold in [threshold] + DEFAULT_FALLBACK_THRESHOLDS:
         logger.debug(
             f"Trying {entity_type} fuzzy search with threshold {current_threshold}")
-        fuzzy_results = _perform_fuzzy_search(
-            fuzzy_sql, (normalized_query,), entity_type, current_threshold)
-        if not fuzzy_results:
-            continue
 
         valid_results = _filter_results_by_similarity(
             fuzzy_results, normalized_query, current_threshold)
@@ -220,7 +275,7 @@ def search_title_exact(title: str) -> List[Dict[str, Any]]:
     if not normalized_title:
         return []
 
-    return db.execute_query(EXACT_SEARCH_SQL, (normalized_title,), "exact search")
+    return db.execute_query(EXACT_SEARCH_SQL, (normalized_title,), "exact search", prepared=True)
 
 def search_title_fuzzy(
     title: str,
@@ -236,7 +291,7 @@ def search_title_fuzzy(
         return []
 
     params = (normalized_title, threshold, threshold, threshold, limit)
-    return db.execute_query(FUZZY_SEARCH_SQL, params, "fuzzy search")
+    return db.execute_query(FUZZY_SEARCH_SQL, params, "fuzzy search", prepared=True)
     
 def search_title(title: str, *, threshold: float = DEFAULT_FUZZY_THRESHOLD) -> Dict[str, Any]:
     """Searches for a title with validation."""
@@ -264,12 +319,11 @@ def validate_title(title: str, threshold: Optional[float] = None) -> Dict[str, A
     logger.debug(
         f"Validating title: '{title}' (normalized: '{normalized_query}')")
 
-    exact_result = _try_exact_title_search(normalized_query)
-    if exact_result:
-        return exact_result
-
-    result = _try_fuzzy_title_search(normalized_query, threshold)
-    return result
+    return _cached_validation(
+        "title", normalized_query, threshold,
+        lambda: _try_exact_title_search(normalized_query)
+        or _try_fuzzy_title_search(normalized_query, threshold),
+    )
 
 @tool
 def validate_actor(name: Union[str, List[str], Any], threshold: Optional[float] = None) -> Dict[str, Any]:
@@ -1,4 +1,5 @@
 from langgraph.graph import StateGraph, END
+from app.strands.core.graph_registry import compiled_graph
 from .state import State, create_initial_state
 from .supervisor import governance_classifier, main_supervisor, route_from_main_supervisor, format_response
 from app.strands.common.nodes.validation import validation_node
@@ -12,7 +13,7 @@ def _route_from_classifier(state: State) -> str:
     return "admin_node"
 
 
-def create_streaming_graph():
+def _build_graph() -> StateGraph:
     graph = StateGraph(State)
 
     graph.add_node("main_supervisor", main_supervisor)
@@ -46,7 +47,12 @@ def create_streaming_graph():
     graph.add_edge("admin_node", "main_supervisor")
     graph.add_edge("format_response", END)
 
-    return graph.compile()
+    return graph
+
+
+def create_streaming_graph():
+    """Compiled common graph, built once per process."""
+    return compiled_graph("common", _build_graph)
 
 
 async def process_question(question: str, max_iterations: int = 3, validated_entities: dict = None) -> State:
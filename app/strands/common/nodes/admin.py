@@ -2,7 +2,8 @@ from app.strands.common.graph_core.state import State
 from app.strands.common.nodes.prompt_common import ADMIN_PROMPT
 from app.strands.common.nodes.router_configs import (
     ADMIN_TOOLS,
-    ADMIN_ROUTER_PROMPT
+    ADMIN_ROUTER_PROMPT,
+    ADMIN_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -27,7 +28,10 @@ _admin_executor = BaseExecutorNode(
     tools_map=ADMIN_TOOLS_MAP,
     router_fn=create_router(
         prompt=ADMIN_ROUTER_PROMPT,
-        valid_tools=ADMIN_TOOLS
+        valid_tools=ADMIN_TOOLS,
+        name="admin",
+        fast_rules=ADMIN_FAST_RULES,
+        tools=ADMIN_TOOLS_MAP
     ),
     system_prompt=ADMIN_PROMPT,
     model=MODEL_NODE_EXECUTOR
@@ -20,3 +20,31 @@ ADMIN_TOOLS = {
     "run_sql_adapter",
     "validate_intent"
 }
+
+
+# Fast-path rules (core/factories/fast_router): keywords match whole words on
+# the casefolded, accent-free question, so list every inflection.
+VALIDATION_FAST_RULES = {
+    "validate_title": {
+        "keywords": ("valida el titulo", "validate title", "validar titulo", "existe la pelicula",
+                     "existe la serie", "does the movie", "does the show"),
+    },
+    "validate_actor": {
+        "keywords": ("valida el actor", "validate actor", "validar actor", "existe el actor",
+                     "is there an actor"),
+    },
+    "validate_director": {
+        "keywords": ("valida el director", "validate director", "validar director", "existe el director"),
+    },
+}
+
+ADMIN_FAST_RULES = {
+    "validate_intent": {
+        "keywords": ("valida el intent", "validate intent", "validar intent"),
+    },
+    "build_sql": {
+        "keywords": ("construye", "construir", "build sql", "genera sql", "generate sql", "arma la query",
+                     "build query"),
+        "excludes": ("ejecuta", "ejecutar", "run", "execute", "executes"),
+    },
+}
@@ -2,7 +2,8 @@ from app.strands.common.graph_core.state import State
 from app.strands.common.nodes.prompt_common import VALIDATION_PROMPT
 from app.strands.common.nodes.router_configs import (
     VALIDATION_TOOLS,
-    VALIDATION_ROUTER_PROMPT
+    VALIDATION_ROUTER_PROMPT,
+    VALIDATION_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -27,7 +28,10 @@ _validation_executor = BaseExecutorNode(
     tools_map=VALIDATION_TOOLS_MAP,
     router_fn=create_router(
         prompt=VALIDATION_ROUTER_PROMPT,
-        valid_tools=VALIDATION_TOOLS
+        valid_tools=VALIDATION_TOOLS,
+        name="validation",
+        fast_rules=VALIDATION_FAST_RULES,
+        tools=VALIDATION_TOOLS_MAP
     ),
     system_prompt=VALIDATION_PROMPT,
     model=MODEL_NODE_EXECUTOR
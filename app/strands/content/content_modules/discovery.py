@@ -1,12 +1,12 @@
 from app.strands.core.shared_imports import *
 from app.strands.infrastructure.database.constants import *
 from app.strands.content.content_queries.queries_discovery import *
-from app.strands.infrastructure.database.connection import db
+from app.strands.infrastructure.database.async_connection import async_db
 from app.strands.infrastructure.validators.shared import *
 from strands import tool
 
 @tool
-def get_filmography_by_uid(uid: str) -> List[Dict[str, Any]]:
+async def get_filmography_by_uid(uid: str) -> List[Dict[str, Any]]:
     """Get complete filmography and profile information for a specific title using its UID.
     
     Returns detailed metadata including title, type, year, duration, and countries.
@@ -28,7 +28,7 @@ def get_filmography_by_uid(uid: str) -> List[Dict[str, Any]]:
    
     logger.debug(f"Getting filmography for UID: {uid}")
     
-    results = db.execute_query(FILMOGRAPHY_SQL, (uid,))
+    results = await async_db.execute_query(FILMOGRAPHY_SQL, (uid,))
     
     if results is None:
         logger.error(f"Database query failed for filmography UID: {uid}")
@@ -37,7 +37,7 @@ def get_filmography_by_uid(uid: str) -> List[Dict[str, Any]]:
     return handle_query_result(results, "filmography", uid)
 
 @tool
-def get_title_rating(uid: str, country: Optional[str] = None) -> List[Dict[str, Any]]:
+async def get_title_rating(uid: str, country: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get rating and popularity metrics for a title by UID.
     
     Supports global ratings or country/region-specific ratings (provide ISO-2 country code OR region name like 'LATAM', 'EU').
@@ -63,7 +63,7 @@ def get_title_rating(uid: str, country: Optional[str] = None) -> List[Dict[str,
     logger.debug(f"Querying rating for UID: {uid}, country: {country or 'global'}")
 
     if not country:
-        results = db.execute_query(RATING_QUERY_GLOBAL, (uid,))
+        results = await async_db.execute_query(RATING_QUERY_GLOBAL, (uid,))
         
         if results is None:
             logger.error(f"Database query failed for global rating UID: {uid}")
@@ -77,7 +77,7 @@ def get_title_rating(uid: str, country: Optional[str] = None) -> List[Dict[str,
     region_isos = get_region_iso_list(country)
     if region_isos:
         if len(region_isos) == 1:
-            results = db.execute_query(RATING_QUERY_COUNTRY, (uid, region_isos[0]))
+            results = await async_db.execute_query(RATING_QUERY_COUNTRY, (uid, region_isos[0]))
             if results is None:
                 logger.error(f"Database query failed for country rating UID: {uid}, country: {region_isos[0]}")
                 return [{"error": "Database query failed"}]
@@ -86,7 +86,7 @@ def get_title_rating(uid: str, country: Optional[str] = None) -> List[Dict[str,
         else:
             all_results = []
             for iso in region_isos:
-                results = db.execute_query(RATING_QUERY_COUNTRY, (uid, iso))
+                results = await async_db.execute_query(RATING_QUERY_COUNTRY, (uid, iso))
                 if results:
                     for r in results:
                         r['queried_country'] = iso
@@ -105,7 +105,7 @@ def get_title_rating(uid: str, country: Optional[str] = None) -> List[Dict[str,
         logger.warning(f"Invalid country code or region provided: {country}")
         return [{"error": f"Invalid country code or region: {country}"}]
     
-    results = db.execute_query(RATING_QUERY_COUNTRY, (uid, resolved_country_iso))
+    results = await async_db.execute_query(RATING_QUERY_COUNTRY, (uid, resolved_country_iso))
     
     if results is None:
         logger.error(f"Database query failed for country rating UID: {uid}, country: {resolved_country_iso}")
@@ -115,7 +115,7 @@ def get_title_rating(uid: str, country: Optional[str] = None) -> List[Dict[str,
     return handle_query_result(results, "title rating by country", uid)
 
 @tool
-def get_multiple_titles_info(uids: List[str]) -> List[Dict[str, Any]]:
+async def get_multiple_titles_info(uids: List[str]) -> List[Dict[str, Any]]:
     """
     Obtiene información básica para múltiples UIDs de una vez.
     
@@ -145,7 +145,7 @@ def get_multiple_titles_info(uids: List[str]) -> List[Dict[str, Any]]:
         ORDER BY title
     """
     
-    results = db.execute_query(sql, params)
+    results = await async_db.execute_query(sql, params)
     
     if results is None:
         logger.error("Database query failed for multiple UIDs")
@@ -9,10 +9,12 @@ from app.strands.content.content_utils.filter_helpers import (
     build_filters_common,
     NO_FILTER_KEYWORDS
 )
+from app.strands.infrastructure.cache.query_cache import cached_query, general_cache
 from strands import tool
 
 
 @tool
+@cached_query(general_cache, normalize=TOOL_ARG_NORMALIZERS)
 def metadata_simple_all_count(*args, **kwargs):
     """Count titles in catalog with optional filters (type, country, year range)."""
     kwargs = normalize_args_kwargs(args, kwargs)
@@ -39,6 +41,7 @@ def metadata_simple_all_count(*args, **kwargs):
 
 
 @tool
+@cached_query(general_cache, normalize=TOOL_ARG_NORMALIZERS)
 def metadata_simple_all_list(*args, **kwargs):
     """List distinct values for a specific column (genre, country, language, etc.)."""
     kwargs = normalize_args_kwargs(args, kwargs)
@@ -78,6 +81,7 @@ def metadata_simple_all_list(*args, **kwargs):
 
 
 @tool
+@cached_query(general_cache, normalize=TOOL_ARG_NORMALIZERS)
 def metadata_simple_all_stats(*args, **kwargs):
     """Get statistics (count, year range, avg duration) with optional filters."""
     kwargs = normalize_args_kwargs(args, kwargs)
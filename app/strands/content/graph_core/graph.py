@@ -1,4 +1,5 @@
 from langgraph.graph import StateGraph, END
+from app.strands.core.graph_registry import compiled_graph
 from .state import State, create_initial_state
 from .supervisor import main_supervisor, content_classifier
 from app.strands.content.nodes.discovery import discovery_node
@@ -38,7 +39,7 @@ def _route_from_classifier(state: State) -> str:
     return "metadata_node"
 
 
-def create_streaming_graph():
+def _build_graph() -> StateGraph:
     """Create content graph with classifier and both metadata/discovery nodes."""
     graph = StateGraph(State)
 
@@ -73,7 +74,12 @@ def create_streaming_graph():
     graph.add_edge("metadata_node", "main_supervisor")
     graph.add_edge("discovery_node", "main_supervisor")
 
-    return graph.compile()
+    return graph
+
+
+def create_streaming_graph():
+    """Compiled content graph, built once per process."""
+    return compiled_graph("content", _build_graph)
 
 
 async def process_question(question: str, max_iterations: int = 3, validated_entities: dict = None) -> State:
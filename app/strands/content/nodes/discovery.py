@@ -2,7 +2,8 @@ from app.strands.content.graph_core.state import State
 from app.strands.content.nodes.prompt_content import DISCOVERY_PROMPT
 from app.strands.content.nodes.router_configs import (
     DISCOVERY_TOOLS,
-    DISCOVERY_ROUTER_PROMPT
+    DISCOVERY_ROUTER_PROMPT,
+    DISCOVERY_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -27,7 +28,10 @@ _discovery_executor = BaseExecutorNode(
     tools_map=DISCOVERY_TOOLS_MAP,
     router_fn=create_router(
         prompt=DISCOVERY_ROUTER_PROMPT,
-        valid_tools=DISCOVERY_TOOLS
+        valid_tools=DISCOVERY_TOOLS,
+        name="discovery",
+        fast_rules=DISCOVERY_FAST_RULES,
+        tools=DISCOVERY_TOOLS_MAP
     ),
     system_prompt=DISCOVERY_PROMPT,
     model=MODEL_NODE_EXECUTOR
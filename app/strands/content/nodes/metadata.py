@@ -2,7 +2,8 @@ from app.strands.content.graph_core.state import State
 from app.strands.content.nodes.prompt_content import METADATA_PROMPT
 from app.strands.content.nodes.router_configs import (
     METADATA_TOOLS,
-    METADATA_ROUTER_PROMPT
+    METADATA_ROUTER_PROMPT,
+    METADATA_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -29,7 +30,10 @@ _metadata_executor = BaseExecutorNode(
     tools_map=METADATA_TOOLS_MAP,
     router_fn=create_router(
         prompt=METADATA_ROUTER_PROMPT,
-        valid_tools=METADATA_TOOLS
+        valid_tools=METADATA_TOOLS,
+        name="metadata",
+        fast_rules=METADATA_FAST_RULES,
+        tools=METADATA_TOOLS_MAP
     ),
     system_prompt=METADATA_PROMPT,
     model=MODEL_NODE_EXECUTOR
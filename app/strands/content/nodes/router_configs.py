@@ -21,3 +21,39 @@ DISCOVERY_TOOLS = {
     "get_title_rating",
     "multiple_titles_info"
 }
+
+
+# Fast-path rules (core/factories/fast_router): keywords match whole words on
+# the casefolded, accent-free question, so list every inflection.
+METADATA_FAST_RULES = {
+    "simple_all_count": {
+        "keywords": ("cuantos", "cuantas", "how many", "numero de", "number of", "cantidad de", "count",
+                     "contar", "conteo"),
+        "excludes": ("estadistica", "estadisticas", "estadistico", "estadisticos", "statistic", "statistics",
+                     "promedio", "promedios", "average"),
+    },
+    "simple_all_list": {
+        "keywords": ("que generos", "which genres", "what genres", "lista de generos", "list of genres",
+                     "que idiomas", "which languages", "valores distintos", "distinct values"),
+    },
+    "simple_all_stats": {
+        "keywords": ("estadistica", "estadisticas", "estadistico", "estadisticos", "statistic", "statistics",
+                     "promedio", "promedios", "average", "duracion media", "average duration"),
+    },
+}
+
+DISCOVERY_FAST_RULES = {
+    "filmography_by_uid": {
+        "keywords": ("de que trata", "what is it about", "sinopsis", "synopsis", "trama", "plot", "ficha",
+                     "informacion", "information", "detail", "details", "detalle", "detalles",
+                     "duracion", "duration"),
+        "entities": ("uid",),
+        "excludes": ("rating", "ratings", "calificacion", "calificaciones", "puntuacion", "puntuaciones",
+                     "score", "scores", "popularidad", "popularity"),
+    },
+    "title_rating": {
+        "keywords": ("rating", "ratings", "calificacion", "calificaciones", "puntuacion", "puntuaciones",
+                     "score", "scores", "popularidad", "popularity", "nota"),
+        "entities": ("uid",),
+    },
+}
@@ -15,8 +15,8 @@ This factory encapsulates that pattern.
 """
 
 from typing import List, TypedDict, Dict, Any
-from strands import Agent
 from app.strands.config.llm_models import MODEL_CLASSIFIER
+from app.strands.infrastructure.cache.llm_cache import invoke_llm_cached
 
 
 def create_classifier(
@@ -75,16 +75,8 @@ def create_classifier(
             print(f"[{name.upper()} CLASSIFIER] Llamando al Agent con MODEL_CLASSIFIER: {MODEL_CLASSIFIER}")
             print(f"[{name.upper()} CLASSIFIER] Prompt: {prompt[:100]}...")
         
-        agent = Agent(model=MODEL_CLASSIFIER, system_prompt=prompt)
-        response = await agent.invoke_async(state['question'])
-        
-        if verbose:
-            print(f"[{name.upper()} CLASSIFIER] Response type: {type(response)}")
-        
-        if isinstance(response, dict):
-            decision = str(response.get('message', response)).strip().upper()
-        else:
-            decision = str(getattr(response, "message", response)).strip().upper()
+        response = await invoke_llm_cached(MODEL_CLASSIFIER, prompt, state['question'])
+        decision = response.strip().upper()
         
         if verbose:
             print(f"[{name.upper()} CLASSIFIER] Decision raw: '{decision}'")
@@ -0,0 +1,140 @@
+"""Fast Router
+
+Deterministic, score-based tool selection ahead of ``route_with_llm``.
+
+Each node declares keyword rules per tool (see the domain ``router_configs``):
+
+    {"tool_name": {"keywords": ("donde ver", "where to watch"),
+                   "entities": ("uid",),
+                   "excludes": ("compara", "compare")}}
+
+Keywords and excludes match whole words / phrases on the casefolded,
+accent-free question ("top" does not match "topic"): list each inflection.
+A single keyword hit nearly clears the threshold on its own, so a stem that
+over-matches would misroute without any error. ``entities`` are
+``validated_entities`` keys the tool needs; without them the tool is skipped.
+Every tool in the node also gets a rapidfuzz score against its description,
+so ambiguous questions do not clear the margin. The LLM is only called when
+the best score is below ``FAST_ROUTER_THRESHOLD`` or within
+``FAST_ROUTER_MARGIN`` of the runner-up.
+"""
+
+import os
+import re
+import threading
+import unicodedata as ud
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from rapidfuzz import fuzz
+
+FAST_ROUTER_ENABLED = os.getenv("FAST_ROUTER_ENABLED", "1").strip().lower() not in ("0", "false", "no", "off")
+FAST_ROUTER_THRESHOLD = float(os.getenv("FAST_ROUTER_THRESHOLD", "0.75"))
+FAST_ROUTER_MARGIN = float(os.getenv("FAST_ROUTER_MARGIN", "0.10"))
+
+KEYWORD_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.3
+ENTITY_BONUS = 0.10
+
+
+def normalize_text(text: str) -> str:
+    text = ud.normalize("NFKD", str(text or "").casefold())
+    return " ".join("".join(ch for ch in text if not ud.combining(ch)).split())
+
+
+def _compile(words) -> Optional["re.Pattern"]:
+    words = [normalize_text(w) for w in words or () if w]
+    if not words:
+        return None
+    return re.compile(r"\b(?:" + "|".join(re.escape(w) for w in words) + r")\b")
+
+
+def _tool_description(name: str, tool: Any) -> str:
+    spec = getattr(tool, "tool_spec", None) or {}
+    description = spec.get("description") or getattr(tool, "__doc__", None) or ""
+    # First paragraph only; the rest is parameter documentation.
+    first = description.strip().split("\n\n")[0]
+    return normalize_text(f"{name.replace('_', ' ')} {first}")
+
+
+class FastRouter:
+    def __init__(self, name: str, rules: Dict[str, dict], tools: Dict[str, Callable]):
+        unknown = set(rules) - set(tools)
+        if unknown:
+            raise ValueError(f"Fast router '{name}': rules for unknown tools {sorted(unknown)}")
+        self.name = name
+        self._tools = []
+        for tool_name, tool in tools.items():
+            rule = rules.get(tool_name, {})
+            self._tools.append((
+                tool_name,
+                _compile(rule.get("keywords")),
+                _compile(rule.get("excludes")),
+                tuple(rule.get("entities", ())),
+                _tool_description(tool_name, tool),
+            ))
+
+    def _score(self, text: str, entities: dict, keywords, excludes, required, description) -> float:
+        if excludes is not None and excludes.search(text):
+            return 0.0
+        if any(not entities.get(key) for key in required):
+            return 0.0
+        hit = keywords is not None and keywords.search(text) is not None
+        score = KEYWORD_WEIGHT * hit + FUZZY_WEIGHT * fuzz.token_set_ratio(text, description) / 100
+        if hit and required:
+            score += ENTITY_BONUS
+        return min(score, 1.0)
+
+    def route(self, state: dict) -> Tuple[Optional[str], float]:
+        """Return ``(tool, score)``; ``tool`` is None when the LLM should decide."""
+        text = normalize_text(state.get("question", ""))
+        entities = state.get("validated_entities") or {}
+        if entities.get("status") == "skipped":
+            entities = {}
+
+        ranked = sorted(
+            ((self._score(text, entities, *spec[1:]), spec[0]) for spec in self._tools),
+            reverse=True,
+        )
+        if not ranked:
+            return None, 0.0
+        best_score, best_tool = ranked[0]
+        runner_up = ranked[1][0] if len(ranked) > 1 else 0.0
+        if best_score >= FAST_ROUTER_THRESHOLD and best_score - runner_up >= FAST_ROUTER_MARGIN:
+            return best_tool, best_score
+        return None, best_score
+
+
+class RoutingStats:
+    """Per-router counters: fast-path hits, LLM calls and decision latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routers: Dict[str, Dict[str, float]] = {}
+
+    def record(self, router: str, source: str, elapsed_ms: float) -> None:
+        with self._lock:
+            stats = self._routers.setdefault(router, {"fast": 0, "llm": 0, "fast_ms": 0.0, "llm_ms": 0.0})
+            stats[source] += 1
+            stats[f"{source}_ms"] += elapsed_ms
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            result = {}
+            for router, s in self._routers.items():
+                total = s["fast"] + s["llm"]
+                result[router] = {
+                    "decisions": total,
+                    "fast_hits": s["fast"],
+                    "llm_calls": s["llm"],
+                    "fast_hit_rate": f"{(s['fast'] / total * 100) if total else 0:.1f}%",
+                    "avg_fast_ms": round(s["fast_ms"] / s["fast"], 3) if s["fast"] else None,
+                    "avg_llm_ms": round(s["llm_ms"] / s["llm"], 1) if s["llm"] else None,
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routers.clear()
+
+
+routing_stats = RoutingStats()
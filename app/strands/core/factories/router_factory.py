@@ -5,20 +5,27 @@ Simplifies router creation using configuration instead of wrapper functions.
 Usage:
     router_fn = create_router(
         prompt=PRICING_ROUTER_PROMPT,
-        valid_tools=PRICING_TOOLS
+        valid_tools=PRICING_TOOLS,
+        name="pricing",
+        fast_rules=PRICING_FAST_RULES,
+        tools=PRICING_TOOLS_MAP
     )
 """
 
-from typing import Set, Callable
+from typing import Dict, Set, Callable
 from functools import partial
-from app.strands.core.factories.router_helpers import route_with_llm
+from app.strands.core.factories.fast_router import FastRouter
+from app.strands.core.factories.router_helpers import route_tool
 from app.strands.config.llm_models import MODEL_CLASSIFIER
 
 
 def create_router(
     prompt: str,
     valid_tools: Set[str],
-    model: str = None
+    model: str = None,
+    name: str = "default",
+    fast_rules: Dict[str, dict] = None,
+    tools: Dict[str, Callable] = None
 ) -> Callable:
     """Create a router function from parameters.
     
@@ -26,13 +33,19 @@ def create_router(
         prompt: System prompt for the router
         valid_tools: Set of valid tool names
         model: Model to use (defaults to MODEL_CLASSIFIER)
+        name: Router name for routing stats
+        fast_rules: Keyword rules per tool for the fast router (see fast_router)
+        tools: Tools map of the node; required with fast_rules
         
     Returns:
         Async function that takes state and returns tool name
     """
+    fast_router = FastRouter(name, fast_rules, tools) if fast_rules and tools else None
     return partial(
-        route_with_llm,
+        route_tool,
         model=model or MODEL_CLASSIFIER,
         prompt=prompt,
-        valid_tools=valid_tools
+        valid_tools=valid_tools,
+        fast_router=fast_router,
+        name=name
     )
@@ -1,33 +1,12 @@
 """Router Helpers
 
-Utilities for LLM-based routing between tools.
+Utilities for routing between tools: deterministic fast path first, LLM otherwise.
 """
 
 import time
 from typing import Set, Optional, Any
-from strands import Agent
-
-
-def extract_agent_response(result) -> str:
-    """Extract text response from various Agent result formats."""
-    if not isinstance(result, dict):
-        message_attr = getattr(result, "message", None)
-        if message_attr:
-            result = message_attr
-        else:
-            return str(result)
-    
-    if isinstance(result, dict):
-        if 'role' in result and 'content' in result:
-            content = result['content']
-            if isinstance(content, list) and len(content) > 0:
-                first_block = content[0]
-                if isinstance(first_block, dict) and 'text' in first_block:
-                    return first_block['text']
-        if 'message' in result:
-            return str(result['message'])
-    
-    return str(result)
+from app.strands.core.factories.fast_router import FAST_ROUTER_ENABLED, FastRouter, routing_stats
+from app.strands.infrastructure.cache.llm_cache import invoke_llm_cached
 
 
 async def route_with_llm(
@@ -52,12 +31,11 @@ async def route_with_llm(
     print("   Router LLM analizando pregunta...")
     print(f"   Tools disponibles: {', '.join(sorted(valid_tools))}")
     
-    agent = Agent(model=model, system_prompt=prompt)
     start_time = time.time()
-    result = await agent.invoke_async(state['question'])
+    result = await invoke_llm_cached(model, prompt, state['question'])
     elapsed_time = time.time() - start_time
     
-    response = extract_agent_response(result).strip().lower()
+    response = result.strip().lower()
     print(f"   LLM sugiere: {response}")
     print(f"   Tiempo de respuesta: {elapsed_time:.2f}s")
     
@@ -78,4 +56,31 @@ async def route_with_llm(
         return fallback_tool
     
     print(f"   Tool no encontrada, retornando None")
-    return None
\ No newline at end of file
+    return None
+
+
+async def route_tool(
+    state: dict[str, Any],
+    model: str,
+    prompt: str,
+    valid_tools: Set[str],
+    fast_router: Optional[FastRouter] = None,
+    fallback_tool: Optional[str] = None,
+    name: str = "default"
+) -> Optional[str]:
+    """Select a tool with the fast router when it is confident, else with the LLM.
+
+    Decision latency and fast-path hit rate are recorded in ``routing_stats``.
+    """
+    start_time = time.perf_counter()
+    if fast_router is not None and FAST_ROUTER_ENABLED:
+        tool_name, score = fast_router.route(state)
+        if tool_name:
+            routing_stats.record(name, "fast", (time.perf_counter() - start_time) * 1000)
+            print(f"   Fast router: {tool_name} (score={score:.2f})")
+            return tool_name
+        print(f"   Fast router sin decisión (score={score:.2f}), usando LLM")
+
+    tool_name = await route_with_llm(state, model, prompt, valid_tools, fallback_tool)
+    routing_stats.record(name, "llm", (time.perf_counter() - start_time) * 1000)
+    return tool_name
\ No newline at end of file
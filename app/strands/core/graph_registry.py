@@ -0,0 +1,56 @@
+"""Process-wide registry of compiled LangGraph graphs.
+
+Building a ``StateGraph`` and compiling it on every request costs
+milliseconds per graph (more with re-routing and parallel execution). A
+compiled graph holds no per-run state, so each graph is compiled once per
+process and shared by concurrent invocations. Checkpointers are injected per
+call: the compiled graph is copied with the checkpointer bound (no
+recompilation) and the copy is reused for that checkpointer.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from langgraph.graph import StateGraph
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_compiled: Dict[str, Any] = {}
+# (name, id(checkpointer)) -> (checkpointer, graph); the strong reference keeps the id valid.
+_bound: Dict[Tuple[str, int], Tuple[Any, Any]] = {}
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+def compiled_graph(name: str, build: Callable[[], StateGraph], checkpointer: Optional[Any] = None):
+    """Compiled graph ``name`` (built with ``build()`` on first use), bound to ``checkpointer``."""
+    with _lock:
+        base = _compiled.get(name)
+        if base is None:
+            start = time.perf_counter()
+            base = _compiled[name] = build().compile()
+            _stats[name] = {"compile_ms": round((time.perf_counter() - start) * 1000, 2), "uses": 0}
+            logger.info(f" Grafo '{name}' compilado en {_stats[name]['compile_ms']}ms")
+        _stats[name]["uses"] += 1
+        if checkpointer is None:
+            return base
+
+        bound = _bound.get((name, id(checkpointer)))
+        if bound is None:
+            bound = _bound[(name, id(checkpointer))] = (checkpointer, base.copy(update={"checkpointer": checkpointer}))
+        return bound[1]
+
+
+def clear_graph_registry() -> None:
+    """Drop compiled graphs (e.g. after reloading node modules in a notebook)."""
+    with _lock:
+        _compiled.clear()
+        _bound.clear()
+        _stats.clear()
+
+
+def graph_registry_stats() -> Dict[str, Dict[str, float]]:
+    with _lock:
+        return {name: dict(stats) for name, stats in _stats.items()}
@@ -0,0 +1,160 @@
+"""Cheap, deterministic argument extraction for direct tool calls.
+
+Only exact matches: a country named by name / alias (or an ISO code right
+after "en"/"in"), a time window ("últimos 30 días", "last 2 weeks") and a
+"top N" limit. Anything that needs interpretation (regions, misspelled
+countries, prices, ordering) is only detected, so the caller can leave the
+question to the agent.
+"""
+
+import re
+import unicodedata as ud
+from typing import Dict, Iterable, Optional
+
+import pycountry
+from rapidfuzz import fuzz, process
+
+from app.strands.infrastructure.database.constants import REGION_ALIASES, REGION_TO_ISO2
+from app.strands.infrastructure.database.utils import parse_time_to_days
+from app.strands.infrastructure.validators.shared import (
+    _COUNTRY_ALIASES,
+    get_allowed_iso_codes,
+    resolve_country_iso,
+)
+
+# Bare "IT" / "US" / "TV" are words and acronyms too: an ISO code only counts
+# as a country right after a location preposition or "país"/"country".
+_ISO_TOKEN_RE = re.compile(r"\b[A-Z]{2}\b")
+_ISO_CONTEXT_RE = re.compile(r"\b(?:en|in|from|desde|para|for|pa[ií]s|country)\s+([A-Z]{2})\b", re.IGNORECASE)
+_PLACE_RE = re.compile(
+    r"\b(?:en|in|from|desde)\s+([A-ZÁÉÍÓÚÑ][\w'-]+(?:\s+[A-ZÁÉÍÓÚÑ][\w'-]+){0,2})"
+)
+_COUNTRY_CUE_RE = re.compile(r"\b(?:pais(?:es)?|country|countries|nacional|local)\b")
+_COUNTRY_FUZZY_CUTOFF = 85
+# Cues for optional parameters the parsers do not fill; their default would
+# drop what the user asked for.
+_PARAM_CUES = {
+    "with_prices": re.compile(r"\b(?:precio|price|pricing|cost|cuest|vale|tarifa|rent|alquil|compr|buy)"),
+    "order_by": re.compile(
+        r"\b(?:orden|order|sort|clasific|ascend|descend|mayor a menor|menor a mayor"
+        r"|highest|lowest|mejor valorad|peor valorad)"
+    ),
+    "threshold": re.compile(r"\b(?:umbral|threshold|al menos|at least|minim|por encima|above|over)\b"),
+}
+_PARAM_CUES["order_dir"] = _PARAM_CUES["order_by"]
+_DAYS_RE = re.compile(
+    r"\b(?:ultim[oa]s?|last|past|hace)\s+(\d{1,4})\s+"
+    r"(dias?|semanas?|mes(?:es)?|anos?|days?|weeks?|months?|years?)\b"
+)
+_LAST_UNIT_RE = re.compile(r"\b(?:ultim[oa]|last|past)\s+(dia|semana|mes|ano|day|week|month|year)\b")
+_LIMIT_RE = re.compile(r"\b(?:top|primer[oa]s|first)\s*(\d{1,3})\b")
+_MAX_NGRAM = 3
+
+_country_names: Optional[Dict[str, str]] = None
+
+
+def _fold(text: str) -> str:
+    text = ud.normalize("NFKD", str(text or "").casefold())
+    return " ".join("".join(ch for ch in text if not ud.combining(ch)).split())
+
+
+# Two-letter aliases ("na", "se", "me") are ordinary words in questions.
+_REGION_NAMES = frozenset(
+    [_fold(k).replace("_", " ") for k in REGION_TO_ISO2]
+    + [_fold(k) for k in REGION_ALIASES if len(k) > 2]
+)
+
+
+def _get_country_names() -> Dict[str, str]:
+    global _country_names
+    if _country_names is None:
+        names = {}
+        for country in pycountry.countries:
+            for attr in ("name", "common_name", "official_name"):
+                value = getattr(country, attr, None)
+                if value:
+                    names[_fold(value)] = country.alpha_2
+        names.update({_fold(alias): iso for alias, iso in _COUNTRY_ALIASES.items()})
+        _country_names = names
+    return _country_names
+
+
+def _ngrams(text: str) -> Iterable[str]:
+    tokens = re.findall(r"[\w+-]+", text)
+    for n in range(_MAX_NGRAM, 0, -1):
+        for i in range(len(tokens) - n + 1):
+            yield " ".join(tokens[i:i + n])
+
+
+def strip_entities(question: str, names: Iterable[str]) -> str:
+    """Remove validated entity names so a title like "Malta" is not read as a country."""
+    for name in names:
+        if name:
+            question = re.sub(rf"\b{re.escape(name)}\b", " ", question, flags=re.IGNORECASE)
+    return question
+
+
+def mentions_region(question: str) -> bool:
+    return any(gram in _REGION_NAMES for gram in _ngrams(_fold(question)))
+
+
+def _resolve_place(place: str) -> Optional[str]:
+    try:
+        return resolve_country_iso(place)
+    except Exception:
+        # search_fuzzy raises LookupError for anything that is not a country.
+        return None
+
+
+def _countries_found(question: str) -> set:
+    allowed = get_allowed_iso_codes()
+    found = {token.upper() for token in _ISO_CONTEXT_RE.findall(question or "")
+             if token.isupper() and token in allowed}
+    names = _get_country_names()
+    found.update(names[gram] for gram in _ngrams(_fold(question)) if gram in names)
+    if not found:
+        found.update(filter(None, (_resolve_place(place) for place in _PLACE_RE.findall(question or ""))))
+    return found
+
+
+def extract_country(question: str) -> Optional[str]:
+    """ISO-2 of the single country named in the question, else None."""
+    found = _countries_found(question)
+    return found.pop() if len(found) == 1 else None
+
+
+def mentions_country(question: str) -> bool:
+    """True if the question seems to name a country, resolved or not (typo, bare ISO code)."""
+    if _countries_found(question):
+        return True
+    text = _fold(question)
+    if _COUNTRY_CUE_RE.search(text):
+        return True
+    allowed = get_allowed_iso_codes()
+    if any(token in allowed for token in _ISO_TOKEN_RE.findall(question or "")):
+        return True
+    names = list(_get_country_names())
+    return any(
+        process.extractOne(gram, names, scorer=fuzz.ratio, score_cutoff=_COUNTRY_FUZZY_CUTOFF)
+        for gram in _ngrams(text) if len(gram) >= 4
+    )
+
+
+def has_cue(param: str, question: str) -> bool:
+    """True if the question asks for something about ``param`` (prices, ordering...)."""
+    pattern = _PARAM_CUES.get(param)
+    return bool(pattern and pattern.search(_fold(question)))
+
+
+def extract_days(question: str) -> Optional[int]:
+    text = _fold(question)
+    match = _DAYS_RE.search(text)
+    if match:
+        return parse_time_to_days(f"{match.group(1)} {match.group(2)}")
+    match = _LAST_UNIT_RE.search(text)
+    return parse_time_to_days(f"1 {match.group(1)}") if match else None
+
+
+def extract_limit(question: str) -> Optional[int]:
+    match = _LIMIT_RE.search(_fold(question))
+    return int(match.group(1)) if match and int(match.group(1)) > 0 else None
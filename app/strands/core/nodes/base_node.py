@@ -1,9 +1,38 @@
-from typing import Dict, Callable, TypeVar, Any
+from typing import Dict, Callable, TypeVar, Any, Optional
+import asyncio
+import inspect
+import json
+import os
 import time
 from strands import Agent
+from app.strands.core.nodes.arg_extraction import (
+    extract_country,
+    extract_days,
+    extract_limit,
+    has_cue,
+    mentions_country,
+    mentions_region,
+    strip_entities
+)
 
 T = TypeVar('T', bound=Dict[str, Any])
 
+# Direct mode: call the tool without an agent when validated_entities plus
+# the cheap parsers fill every argument it needs.
+DIRECT_TOOL_CALLS = os.getenv("DIRECT_TOOL_CALLS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# tool parameter -> validated_entities key
+_ENTITY_PARAMS = {
+    "uid": "uid",
+    "actor_id": "actor_id",
+    "director_id": "director_id",
+    "actor_name": "actor_name",
+    "director_name": "director_name",
+}
+# Optional parameters whose default keeps the meaning of the question, as long
+# as the question has no cue for them (see arg_extraction.has_cue).
+_DEFAULTABLE_PARAMS = {"limit", "offset", "with_prices", "threshold", "order_by", "order_dir", "country", "days_back"}
+
 
 class BaseExecutorNode:
     def __init__(
@@ -13,7 +42,8 @@ class BaseExecutorNode:
         router_fn: Callable,
         system_prompt: str,
         model: str,
-        entity_key: str = None
+        entity_key: str = None,
+        direct_mode: bool = None
     ):
         self.node_name = node_name
         self.tools_map = tools_map
@@ -21,6 +51,7 @@ class BaseExecutorNode:
         self.system_prompt = system_prompt
         self.model = model
         self.entity_key = entity_key or f"{node_name}_id"
+        self.direct_mode = DIRECT_TOOL_CALLS if direct_mode is None else direct_mode
 
     async def execute(self, state: T) -> T:
         self._log_header(state)
@@ -30,7 +61,9 @@ class BaseExecutorNode:
             return self._handle_tool_not_found(state, tool_name)
         
         start_time = time.time()
-        result = await self._execute_with_agent(state, tool_fn)
+        result = await self._execute_direct(state, tool_fn) if self.direct_mode else None
+        if result is None:
+            result = await self._execute_with_agent(state, tool_fn)
         execution_time = time.time() - start_time
         
         return self._update_state(state, result, tool_name, execution_time)
@@ -63,6 +96,89 @@ class BaseExecutorNode:
         state['last_node'] = f"{self.node_name}_node"
         return state
 
+    def _direct_arguments(self, state: T, tool_fn: Callable) -> Optional[Dict[str, Any]]:
+        """Tool kwargs from validated_entities + parsers, or None if the agent is needed."""
+        schema = (getattr(tool_fn, "tool_spec", None) or {}).get("inputSchema", {}).get("json", {})
+        properties = schema.get("properties") or {}
+        required = set(schema.get("required") or ())
+        if not properties or {"args", "kwargs"} & set(properties):
+            return None
+
+        entities = state.get("validated_entities") or {}
+        if entities.get("status") == "skipped":
+            entities = {}
+        kwargs = {
+            param: entities[key] for param, key in _ENTITY_PARAMS.items()
+            if param in properties and entities.get(key)
+        }
+        # Without entity-driven arguments the question itself must be interpreted.
+        if not kwargs:
+            return None
+
+        question = strip_entities(
+            state["question"],
+            [entities.get("name"), entities.get("actor_name"), entities.get("director_name")]
+        )
+        if "country" in properties:
+            if mentions_region(question):
+                return None
+            country = extract_country(question)
+            if country:
+                kwargs["country"] = country
+            elif mentions_country(question):
+                # Misspelled / unknown country: a global query would drop the filter.
+                return None
+        if "days_back" in properties:
+            days = extract_days(question)
+            if days:
+                kwargs["days_back"] = days
+        if "limit" in properties:
+            limit = extract_limit(question)
+            if limit:
+                kwargs["limit"] = limit
+
+        for param in properties:
+            if param in kwargs:
+                continue
+            if param in required or param not in _DEFAULTABLE_PARAMS or has_cue(param, question):
+                return None
+        return kwargs
+
+    @staticmethod
+    def _is_usable_result(result: Any) -> bool:
+        """False for empty payloads and tool errors; the agent gets a chance instead."""
+        if isinstance(result, str):
+            try:
+                result = json.loads(result)
+            except ValueError:
+                return bool(result.strip())
+        if not result:
+            return False
+        if isinstance(result, dict):
+            return "error" not in result and result.get("status") != "error"
+        if isinstance(result, list):
+            return not all(isinstance(row, dict) and "error" in row for row in result)
+        return True
+
+    async def _execute_direct(self, state: T, tool_fn: Callable) -> Optional[str]:
+        kwargs = self._direct_arguments(state, tool_fn)
+        if kwargs is None:
+            return None
+        print(f"[DIRECT] Calling tool without agent: {kwargs}")
+        try:
+            result = await asyncio.to_thread(tool_fn, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as e:
+            print(f"[DIRECT] Tool failed ({type(e).__name__}: {e}), falling back to agent")
+            return None
+        if not self._is_usable_result(result):
+            print("[DIRECT] Empty or error result, falling back to agent")
+            return None
+        if isinstance(result, str):
+            return result
+        return json.dumps(result, ensure_ascii=False, default=str)
+
     async def _execute_with_agent(self, state: T, tool_fn: Callable) -> str:
         print(f"[AGENT] Executing tool with model: {self.model}...")
         question_with_context = self._build_context(state)
@@ -4,6 +4,7 @@ from app.strands.config.llm_models import (
     MODEL_SUPERVISOR,
     MODEL_FORMATTER,
 )
+from app.strands.infrastructure.cache.llm_cache import invoke_llm_cached
 from typing import Literal, TypedDict
 
 
@@ -48,12 +49,8 @@ async def main_supervisor(state: TypedDict) -> TypedDict:
         max_iter=max_iter,
         accumulated=accumulated
     )
-    supervisor_agent = Agent(model=MODEL_SUPERVISOR, system_prompt=supervisor_prompt)
-    response = await supervisor_agent.invoke_async("¿Los datos responden la pregunta?")
-    if isinstance(response, dict):
-        decision = str(response.get('message', response)).strip().upper()
-    else:
-        decision = str(getattr(response, "message", response)).strip().upper()
+    response = await invoke_llm_cached(MODEL_SUPERVISOR, supervisor_prompt, "¿Los datos responden la pregunta?")
+    decision = response.strip().upper()
     print(f"[SUPERVISOR] Decision del LLM: {decision}")
     if "COMPLETO" in decision or "COMPLETE" in decision:
         print("[SUPERVISOR] Pregunta respondida, ir a format")
@@ -118,14 +115,9 @@ async def format_response(state: TypedDict) -> TypedDict:
     Answer ONLY with ONE WORD: DATA or NO_DATA
     """
     
-    checker = Agent(model=MODEL_SUPERVISOR, system_prompt=check_prompt.format(response=accumulated[:500]))
-    check_result = await checker.invoke_async("Evaluate:")
-    
-    decision = ""
-    if isinstance(check_result, dict):
-        decision = str(check_result.get('message', check_result)).strip().upper()
-    else:
-        decision = str(getattr(check_result, "message", check_result)).strip().upper()
+    check_result = await invoke_llm_cached(
+        MODEL_SUPERVISOR, check_prompt.format(response=accumulated[:500]), "Evaluate:")
+    decision = check_result.strip().upper()
     
     if "NO_DATA" in decision or "NO DATA" in decision:
         print("[FORMAT] LLM detected 'NO DATA' response, returning as-is without formatting")
@@ -22,6 +22,7 @@ from langchain_core.tools import StructuredTool, Tool
 from rapidfuzz import fuzz, process
 
 from app.strands.infrastructure.database.connection import db
+from app.strands.infrastructure.database.async_connection import async_db
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,194 @@
+"""Shared L2 cache backends (Redis, local SQLite) behind the in-process caches.
+
+Every App Runner instance keeps its own L1 (``QueryCache`` / ``RouterCache``);
+this backend lets scaled-out instances share warm entries. Values are
+pickled, keys are namespaced (``<prefix>:<namespace>:<key>``) and carry the
+same TTL as the L1 entry.
+
+Redis is optional: without ``REDIS_URL`` the backend is disabled, and any
+connection error disables it for ``CACHE_REDIS_RETRY_SECONDS`` so requests
+degrade to L1-only instead of waiting on timeouts.
+
+``l2_cache`` chains Redis with the optional persistent tier
+(``persistent.disk_cache``): reads try Redis first and backfill it from disk,
+writes go to every available tier, and ``load`` restores entries into L1 on
+boot.
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from app.strands.infrastructure.cache.persistent import disk_cache
+
+logger = logging.getLogger(__name__)
+
+_MISS: Tuple[bool, Any] = (False, None)
+
+
+class RedisBackend:
+    """Thread-safe, fail-soft Redis client for cache entries."""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        prefix: Optional[str] = None,
+        socket_timeout: Optional[float] = None,
+        retry_seconds: Optional[float] = None,
+    ):
+        self.url = url if url is not None else os.getenv("REDIS_URL", "")
+        self.prefix = prefix or os.getenv("CACHE_REDIS_PREFIX", "chatbot:v1")
+        self.socket_timeout = socket_timeout or float(os.getenv("CACHE_REDIS_TIMEOUT", "0.2"))
+        self.retry_seconds = retry_seconds or float(os.getenv("CACHE_REDIS_RETRY_SECONDS", "30"))
+        self._client = None
+        self._lock = threading.Lock()
+        self._down_until = 0.0
+        self._last_error: Optional[str] = None
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    def available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._down_until
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import redis  # optional at runtime; only needed with REDIS_URL
+                    self._client = redis.Redis.from_url(
+                        self.url,
+                        socket_timeout=self.socket_timeout,
+                        socket_connect_timeout=self.socket_timeout,
+                        health_check_interval=30,
+                    )
+                    logger.info(f" Cache L2 (Redis) configurado: prefix={self.prefix}")
+        return self._client
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            self._down_until = time.monotonic() + self.retry_seconds
+            self._last_error = f"{type(error).__name__}: {error}"
+            self._stats["errors"] += 1
+        logger.warning(f" Cache L2 no disponible, solo L1 durante {self.retry_seconds:.0f}s: {error}")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any, Optional[float]]:
+        """Return ``(found, value, remaining_ttl_seconds)``."""
+        if not self.available():
+            return False, None, None
+        try:
+            pipe = self._get_client().pipeline(transaction=False)
+            pipe.get(self._key(namespace, key))
+            pipe.pttl(self._key(namespace, key))
+            raw, pttl = pipe.execute()
+        except Exception as e:
+            self._fail(e)
+            return False, None, None
+        if raw is None:
+            self._count("misses")
+            return False, None, None
+        try:
+            value = pickle.loads(raw)
+        except Exception as e:
+            logger.debug(f"Cache L2: valor ilegible en {namespace}:{key}: {e}")
+            self._count("misses")
+            return False, None, None
+        self._count("hits")
+        return True, value, (pttl / 1000.0 if pttl and pttl > 0 else None)
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> bool:
+        if not self.available() or ttl_seconds <= 0:
+            return False
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Cache L2: valor no serializable en {namespace}:{key}: {e}")
+            return False
+        try:
+            self._get_client().set(self._key(namespace, key), payload, px=max(1, int(ttl_seconds * 1000)))
+        except Exception as e:
+            self._fail(e)
+            return False
+        self._count("sets")
+        return True
+
+    def delete(self, namespace: str, key: str) -> None:
+        if not self.available():
+            return
+        try:
+            self._get_client().delete(self._key(namespace, key))
+        except Exception as e:
+            self._fail(e)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "enabled": self.enabled,
+                "down": time.monotonic() < self._down_until,
+                "prefix": self.prefix,
+                "last_error": self._last_error,
+            }
+
+
+class TieredBackend:
+    """Backends consulted in order with the ``RedisBackend`` interface."""
+
+    def __init__(self, **tiers):
+        self.tiers = tiers
+
+    @property
+    def enabled(self) -> bool:
+        return any(t.enabled for t in self.tiers.values())
+
+    def available(self) -> bool:
+        return any(t.available() for t in self.tiers.values())
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any, Optional[float]]:
+        missed = []
+        for tier in self.tiers.values():
+            if not tier.available():
+                continue
+            found, value, remaining = tier.get(namespace, key)
+            if found:
+                # Backfill faster tiers with the remaining TTL only.
+                if remaining is not None:
+                    for upper in missed:
+                        upper.set(namespace, key, value, remaining)
+                return found, value, remaining
+            missed.append(tier)
+        return False, None, None
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> bool:
+        stored = [t.set(namespace, key, value, ttl_seconds) for t in self.tiers.values() if t.available()]
+        return any(stored)
+
+    def delete(self, namespace: str, key: str) -> None:
+        for tier in self.tiers.values():
+            tier.delete(namespace, key)
+
+    def load(self, namespace: str, limit: int) -> List[Tuple[str, Any, float]]:
+        """Entries to restore into L1 from the first tier that can list them."""
+        for tier in self.tiers.values():
+            if hasattr(tier, "load") and tier.available():
+                return tier.load(namespace, limit)
+        return []
+
+    def stats(self) -> dict:
+        return {name: tier.stats() for name, tier in self.tiers.items()}
+
+
+redis_cache = RedisBackend()
+l2_cache = TieredBackend(redis=redis_cache, disk=disk_cache)
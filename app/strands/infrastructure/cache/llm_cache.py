@@ -0,0 +1,73 @@
+"""Cache for deterministic, classification-style LLM calls.
+
+Routers, classifiers, entity extraction and the supervisor all call Bedrock
+with a fixed system prompt and a short input that repeats across questions.
+``invoke_llm_cached`` keys the response text on (model id, system-prompt
+hash, normalized input) and stores it in a bounded ``QueryCache`` (shared via
+the Redis L2 when configured), so repeated questions skip the round-trip.
+
+Only use it for calls whose answer is a label / short extraction; free-form
+answers must keep calling the agent directly.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Optional
+
+from strands import Agent
+
+from app.strands.infrastructure.cache.backends import l2_cache
+from app.strands.infrastructure.cache.query_cache import QueryCache
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1").strip().lower() not in ("0", "false", "no", "off")
+
+llm_response_cache = QueryCache(
+    ttl_minutes=float(os.getenv("LLM_CACHE_TTL_MINUTES", "60")),
+    max_size=int(os.getenv("LLM_CACHE_MAX_SIZE", "5000")),
+    namespace="llm",
+    l2=l2_cache,
+)
+
+
+def normalize_llm_input(text: str) -> str:
+    return " ".join(str(text or "").casefold().split())
+
+
+def llm_cache_key(model: str, system_prompt: str, user_input: str) -> str:
+    prompt_hash = hashlib.sha256((system_prompt or "").encode()).hexdigest()[:16]
+    return llm_response_cache.get_cache_key(model, prompt_hash, normalize_llm_input(user_input))
+
+
+async def _invoke(model: str, system_prompt: str, user_input: str) -> str:
+    agent = Agent(model=model, system_prompt=system_prompt)
+    result = await agent.invoke_async(user_input)
+    # AgentResult.__str__ concatenates the text blocks of the final message.
+    return str(result).strip()
+
+
+async def invoke_llm_cached(
+    model: str,
+    system_prompt: str,
+    user_input: str,
+    ttl_seconds: Optional[float] = None,
+) -> str:
+    """Response text of ``Agent(model, system_prompt)`` for ``user_input``, cached."""
+    if not LLM_CACHE_ENABLED:
+        return await _invoke(model, system_prompt, user_input)
+
+    key = llm_cache_key(model, system_prompt, user_input)
+    cached = await llm_response_cache.aget(key)
+    if cached is not None:
+        logger.debug(f"LLM cache HIT ({model})")
+        return cached
+
+    async def load() -> str:
+        text = await _invoke(model, system_prompt, user_input)
+        if text:
+            await llm_response_cache.aset(key, text, ttl_seconds=ttl_seconds)
+        return text
+
+    return await llm_response_cache.flight.ado(key, load)
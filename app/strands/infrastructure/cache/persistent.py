@@ -0,0 +1,210 @@
+"""Local persistent cache tier (SQLite) that survives restarts and deploys.
+
+Same ``get``/``set``/``delete``/``stats`` interface as ``RedisBackend``, so it
+sits behind the in-process caches through ``backends.l2_cache``. Entries are
+pickled with a wall-clock ``expires_at``; reads skip expired rows and return
+the remaining TTL, so an entry restored after a restart expires when it would
+have anyway. Watermark-keyed entries (``cached_query(..., watermarks=...)``)
+carry the watermark in the key and simply stop matching once the data moves.
+
+Disabled unless ``CACHE_SQLITE_PATH`` is set (point it at a volume that
+outlives the container). Any SQLite error disables the tier for
+``CACHE_SQLITE_RETRY_SECONDS``; callers degrade to L1 / Redis.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace  TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    value      BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS ix_cache_entries_expires ON cache_entries (expires_at);
+CREATE INDEX IF NOT EXISTS ix_cache_entries_created ON cache_entries (namespace, created_at);
+"""
+
+
+class SQLiteBackend:
+    """Thread-safe, fail-soft SQLite store for cache entries."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        prefix: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        retry_seconds: Optional[float] = None,
+    ):
+        self.path = path if path is not None else os.getenv("CACHE_SQLITE_PATH", "")
+        # Same key version as the Redis tier: bumping it drops both.
+        self.prefix = prefix or os.getenv("CACHE_REDIS_PREFIX", "chatbot:v1")
+        self.max_rows = max_rows or int(os.getenv("CACHE_SQLITE_MAX_ROWS", "50000"))
+        self.retry_seconds = retry_seconds or float(os.getenv("CACHE_SQLITE_RETRY_SECONDS", "60"))
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._down_until = 0.0
+        self._last_error: Optional[str] = None
+        self._sets_since_prune = 0
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "restored": 0, "pruned": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._down_until
+
+    def _connect(self) -> sqlite3.Connection:
+        # Caller holds self._lock.
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=1.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._prune(conn)
+            logger.info(f" Cache persistente (SQLite) en {self.path}")
+        return self._conn
+
+    def _ns(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}"
+
+    def _fail(self, error: BaseException) -> None:
+        # Caller holds self._lock.
+        self._down_until = time.monotonic() + self.retry_seconds
+        self._last_error = f"{type(error).__name__}: {error}"
+        self._stats["errors"] += 1
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+        logger.warning(f" Cache persistente no disponible durante {self.retry_seconds:.0f}s: {error}")
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Drop expired rows, then the oldest rows beyond ``max_rows``."""
+        removed = conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)).rowcount
+        removed += conn.execute(
+            "DELETE FROM cache_entries WHERE rowid IN ("
+            " SELECT rowid FROM cache_entries ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,),
+        ).rowcount
+        self._stats["pruned"] += max(removed, 0)
+        self._sets_since_prune = 0
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any, Optional[float]]:
+        """Return ``(found, value, remaining_ttl_seconds)``."""
+        if not self.available():
+            return False, None, None
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value, expires_at FROM cache_entries"
+                    " WHERE namespace = ? AND key = ? AND expires_at > ?",
+                    (self._ns(namespace), key, now),
+                ).fetchone()
+            except (sqlite3.Error, OSError) as e:
+                self._fail(e)
+                return False, None, None
+            if row is None:
+                self._stats["misses"] += 1
+                return False, None, None
+            try:
+                value = pickle.loads(row[0])
+            except Exception as e:
+                logger.debug(f"Cache persistente: valor ilegible en {namespace}:{key}: {e}")
+                self._stats["misses"] += 1
+                return False, None, None
+            self._stats["hits"] += 1
+            return True, value, row[1] - now
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> bool:
+        if not self.available() or ttl_seconds <= 0:
+            return False
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Cache persistente: valor no serializable en {namespace}:{key}: {e}")
+            return False
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, created_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (self._ns(namespace), key, sqlite3.Binary(payload), now + ttl_seconds, now),
+                )
+                self._stats["sets"] += 1
+                self._sets_since_prune += 1
+                if self._sets_since_prune >= 1000:
+                    self._prune(conn)
+            except (sqlite3.Error, OSError) as e:
+                self._fail(e)
+                return False
+        return True
+
+    def delete(self, namespace: str, key: str) -> None:
+        if not self.available():
+            return
+        with self._lock:
+            try:
+                self._connect().execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self._ns(namespace), key)
+                )
+            except (sqlite3.Error, OSError) as e:
+                self._fail(e)
+
+    def load(self, namespace: str, limit: int) -> List[Tuple[str, Any, float]]:
+        """Unexpired ``(key, value, remaining_ttl)`` of a namespace, newest first."""
+        if not self.available() or limit <= 0:
+            return []
+        now = time.time()
+        with self._lock:
+            try:
+                rows = self._connect().execute(
+                    "SELECT key, value, expires_at FROM cache_entries"
+                    " WHERE namespace = ? AND expires_at > ? ORDER BY created_at DESC LIMIT ?",
+                    (self._ns(namespace), now, limit),
+                ).fetchall()
+            except (sqlite3.Error, OSError) as e:
+                self._fail(e)
+                return []
+        entries = []
+        for key, payload, expires_at in rows:
+            try:
+                entries.append((key, pickle.loads(payload), expires_at - now))
+            except Exception as e:
+                logger.debug(f"Cache persistente: valor ilegible en {namespace}:{key}: {e}")
+        with self._lock:
+            self._stats["restored"] += len(entries)
+        return entries
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "enabled": self.enabled,
+                "down": time.monotonic() < self._down_until,
+                "path": self.path,
+                "max_rows": self.max_rows,
+                "last_error": self._last_error,
+            }
+
+
+disk_cache = SQLiteBackend()
@@ -1,25 +1,80 @@
-"""Query result caching with TTL support."""
+"""Query result caching with TTL support.
 
-from typing import Any, Optional, Dict, Tuple
-from datetime import datetime, timedelta
+Entries live in an ``OrderedDict`` kept in LRU order (O(1) get/set/evict);
+expiry times go into a min-heap that is drained lazily, so purging expired
+entries never walks the whole cache. L1 operations hold an ``RLock`` and
+never await, so the same instance is safe from threads and from the event
+loop.
+
+Caches created with a ``namespace`` also read through / write through the
+shared L2 (``backends.l2_cache``: Redis with ``REDIS_URL``, local SQLite with
+``CACHE_SQLITE_PATH``); async callers use ``aget``/``aset`` so the L2
+round-trip runs off the loop. ``restore()`` reloads the unexpired entries
+persisted by a previous process into L1 on boot.
+
+With ``max_stale_minutes`` an expired entry is kept until that hard bound and
+``cached_query`` serves it while a background task revalidates it, so the
+caller that hits a TTL boundary does not pay for the query.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import hashlib
+import heapq
+import inspect
 import json
 import logging
+import os
+import threading
+import time
+
+from app.strands.infrastructure.cache.backends import TieredBackend, l2_cache
+from app.strands.infrastructure.cache.single_flight import SingleFlight
+from app.strands.infrastructure.cache.watermarks import watermarks as watermark_service
 
 logger = logging.getLogger(__name__)
 
+CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "1").strip().lower() not in ("0", "false", "no", "off")
+
 
 class QueryCache:
-    """Thread-safe cache for query results with TTL."""
-    
-    def __init__(self, ttl_minutes: int = 60, max_size: int = 1000):
-        self.cache: Dict[str, Tuple[Any, datetime]] = {}
-        self.ttl = timedelta(minutes=ttl_minutes)
+    """Thread-safe LRU cache for query results with TTL (per-entry override)."""
+
+    def __init__(
+        self,
+        ttl_minutes: float = 60,
+        max_size: int = 1000,
+        namespace: Optional[str] = None,
+        l2: Optional[TieredBackend] = None,
+        max_stale_minutes: float = 0,
+    ):
+        # key -> (value, expires_at, stale_until) on the monotonic clock,
+        # oldest use first
+        self.cache: "OrderedDict[str, Tuple[Any, float, float]]" = OrderedDict()
+        self.ttl_seconds = float(ttl_minutes) * 60
         self.max_size = max_size
+        # Stale-while-revalidate: expired entries may still be served (and
+        # refreshed in the background) for up to this long after expiry.
+        self.max_stale_seconds = float(max_stale_minutes) * 60
+        # Shared L2 (Redis); only used when a namespace is given.
+        self.namespace = namespace
+        self.l2 = l2
         self.hits = 0
         self.misses = 0
-    
+        self.l2_hits = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._expiry: List[Tuple[float, str]] = []
+        self._refreshing: Set[str] = set()
+        self._lock = threading.RLock()
+        # Coalesces concurrent misses on the same key (see cached_query).
+        self.flight = SingleFlight()
+
     def get_cache_key(self, func_name: str, *args, **kwargs) -> str:
         key_data = {
             'func': func_name,
@@ -28,86 +83,354 @@ class QueryCache:
         }
         key_str = json.dumps(key_data, sort_keys=True, default=str)
         return hashlib.md5(key_str.encode()).hexdigest()
-    
+
     def get(self, key: str) -> Optional[Any]:
-        if key not in self.cache:
-            self.misses += 1
-            return None
-        
-        value, timestamp = self.cache[key]
-        
-        if datetime.now() - timestamp > self.ttl:
-            del self.cache[key]
+        found, value, _ = self.lookup(key, allow_stale=False)
+        return value if found else None
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Like ``get`` but the L2 round-trip runs off the event loop."""
+        found, value, _ = await self.alookup(key, allow_stale=False)
+        return value if found else None
+
+    def lookup(self, key: str, allow_stale: bool = True) -> Tuple[bool, Any, bool]:
+        """Return ``(found, value, stale)``; stale entries only with ``allow_stale``."""
+        found, value, stale = self._get_local(key, allow_stale)
+        if found:
+            return found, value, stale
+        if not self._l2_active():
+            return self._miss()
+        return self._accept_l2(key, self.l2.get(self.namespace, key))
+
+    async def alookup(self, key: str, allow_stale: bool = True) -> Tuple[bool, Any, bool]:
+        found, value, stale = self._get_local(key, allow_stale)
+        if found:
+            return found, value, stale
+        if not self._l2_active():
+            return self._miss()
+        return self._accept_l2(key, await asyncio.to_thread(self.l2.get, self.namespace, key))
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claim the background refresh of a stale key (False if already running)."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else float(ttl_seconds)
+        self._set_local(key, value, ttl)
+        if self._l2_active():
+            self.l2.set(self.namespace, key, value, ttl)
+
+    async def aset(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else float(ttl_seconds)
+        self._set_local(key, value, ttl)
+        if self._l2_active():
+            await asyncio.to_thread(self.l2.set, self.namespace, key, value, ttl)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            removed = self.cache.pop(key, None) is not None
+        if self._l2_active():
+            self.l2.delete(self.namespace, key)
+        return removed
+
+    def restore(self) -> int:
+        """Load persisted entries into L1 (newest ``max_size``) with their remaining TTL."""
+        if not self._l2_active():
+            return 0
+        entries = self.l2.load(self.namespace, self.max_size)
+        # Oldest first, so the newest entries end up most recently used.
+        for key, value, remaining in reversed(entries):
+            self._set_local(key, value, remaining)
+        return len(entries)
+
+    def _l2_active(self) -> bool:
+        return self.l2 is not None and self.namespace is not None and self.l2.available()
+
+    def _miss(self) -> Tuple[bool, Any, bool]:
+        with self._lock:
             self.misses += 1
-            return None
-        
-        self.hits += 1
-        return value
-    
-    def set(self, key: str, value: Any) -> None:
-        if len(self.cache) >= self.max_size:
-            self.clear_expired()
-            
-            if len(self.cache) >= self.max_size:
-                oldest_key = min(self.cache.items(), key=lambda x: x[1][1])[0]
-                del self.cache[oldest_key]
-        
-        self.cache[key] = (value, datetime.now())
-    
+        return False, None, False
+
+    def _accept_l2(self, key: str, result: Tuple[bool, Any, Optional[float]]) -> Tuple[bool, Any, bool]:
+        found, value, remaining = result
+        if not found:
+            return self._miss()
+        # Mirror the remaining L2 TTL so instances expire the entry together.
+        self._set_local(key, value, remaining if remaining is not None else self.ttl_seconds)
+        with self._lock:
+            self.hits += 1
+            self.l2_hits += 1
+        return True, value, False
+
+    def _get_local(self, key: str, allow_stale: bool = False) -> Tuple[bool, Any, bool]:
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return False, None, False
+
+            value, expires_at, stale_until = entry
+            now = time.monotonic()
+            if now >= stale_until:
+                # Its heap entry is dropped lazily by _purge_expired.
+                del self.cache[key]
+                self.expirations += 1
+                return False, None, False
+            stale = now >= expires_at
+            if stale and not allow_stale:
+                return False, None, False
+
+            self.cache.move_to_end(key)
+            self.hits += 1
+            if stale:
+                self.stale_hits += 1
+            return True, value, stale
+
+    def _set_local(self, key: str, value: Any, ttl: float) -> None:
+        expires_at = time.monotonic() + ttl
+        stale_until = expires_at + self.max_stale_seconds
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            self.cache[key] = (value, expires_at, stale_until)
+            heapq.heappush(self._expiry, (stale_until, key))
+
+            if len(self.cache) > self.max_size:
+                self._purge_expired()
+                while len(self.cache) > self.max_size:
+                    self.cache.popitem(last=False)
+                    self.evictions += 1
+
+            # Overwrites and LRU evictions leave stale heap entries behind.
+            if len(self._expiry) > 2 * self.max_size:
+                self._compact()
+
     def clear(self) -> None:
-        self.cache.clear()
-        self.hits = 0
-        self.misses = 0
-    
+        """Clear L1 only; L2 entries are shared and expire on their own."""
+        with self._lock:
+            self.cache.clear()
+            self._expiry.clear()
+            self.hits = 0
+            self.misses = 0
+            self.l2_hits = 0
+            self.stale_hits = 0
+            self.refreshes = 0
+            self.evictions = 0
+            self.expirations = 0
+
     def clear_expired(self) -> int:
-        now = datetime.now()
-        expired_keys = [
-            key for key, (_, timestamp) in self.cache.items()
-            if now - timestamp > self.ttl
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
-        
-        return len(expired_keys)
-    
+        with self._lock:
+            return self._purge_expired()
+
+    def _purge_expired(self) -> int:
+        now = time.monotonic()
+        removed = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            stale_until, key = heapq.heappop(self._expiry)
+            entry = self.cache.get(key)
+            # Skip heap entries superseded by a later set() of the same key.
+            if entry is not None and entry[2] == stale_until:
+                del self.cache[key]
+                removed += 1
+        self.expirations += removed
+        return removed
+
+    def _compact(self) -> None:
+        self._expiry = [(until, key) for key, (_, _, until) in self.cache.items()]
+        heapq.heapify(self._expiry)
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
     def get_stats(self) -> dict:
-        total = self.hits + self.misses
-        hit_rate = (self.hits / total * 100) if total > 0 else 0
-        
-        return {
-            'hits': self.hits,
-            'misses': self.misses,
-            'total_requests': total,
-            'hit_rate': f"{hit_rate:.1f}%",
-            'cache_size': len(self.cache),
-            'max_size': self.max_size,
-            'ttl_minutes': self.ttl.total_seconds() / 60
-        }
+        with self._lock:
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'total_requests': total,
+                'hit_rate': f"{hit_rate:.1f}%",
+                'cache_size': len(self.cache),
+                'max_size': self.max_size,
+                'l2_hits': self.l2_hits,
+                'stale_hits': self.stale_hits,
+                'refreshes': self.refreshes,
+                'single_flight': self.flight.stats(),
+                'l2': self.l2.stats() if self.l2 is not None and self.namespace else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'ttl_minutes': self.ttl_seconds / 60,
+                'max_stale_minutes': self.max_stale_seconds / 60
+            }
+
+
+def _is_cacheable(result: Any) -> bool:
+    """None and ``[{"error": ...}]`` results are never cached."""
+    if result is None:
+        return False
+    if isinstance(result, dict) and "error" in result:
+        return False
+    if isinstance(result, list) and len(result) == 1:
+        first = result[0]
+        if isinstance(first, dict) and "error" in first:
+            return False
+    return True
+
+
+# Background refreshes of stale entries (sync tools); async tools use tasks.
+_REFRESH_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CACHE_REFRESH_WORKERS", "4")),
+    thread_name_prefix="cache-refresh",
+)
+_REFRESH_TASKS: Set["asyncio.Task"] = set()
+
+
+def _refresh_sync(cache_instance: QueryCache, cache_key: str, load: Callable[[], Any]) -> None:
+    try:
+        cache_instance.flight.do(cache_key, load)
+    except Exception as e:
+        logger.warning(f"Cache refresh failed ({cache_instance.namespace or 'local'}): {e}")
+    finally:
+        cache_instance.end_refresh(cache_key)
+
+
+def _refresh_async(cache_instance: QueryCache, cache_key: str, load: Callable[[], Awaitable[Any]]) -> None:
+    task = asyncio.ensure_future(cache_instance.flight.ado(cache_key, load))
+    _REFRESH_TASKS.add(task)
 
+    def _done(t: "asyncio.Task") -> None:
+        _REFRESH_TASKS.discard(t)
+        cache_instance.end_refresh(cache_key)
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning(f"Cache refresh failed ({cache_instance.namespace or 'local'}): {t.exception()}")
+
+    task.add_done_callback(_done)
+
+
+def cached_query(
+    cache_instance: QueryCache,
+    ttl_seconds: Optional[float] = None,
+    normalize: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    watermarks: Sequence[str] = (),
+):
+    """Cache a function's results in ``cache_instance``.
+
+    Arguments are bound to the signature (defaults applied, ``**kwargs``
+    flattened), so positional and keyword calls share a key; ``normalize``
+    maps argument names to callables applied before hashing (a normalizer
+    returning None keeps the raw value). Works on sync and async functions;
+    place it under ``@tool``. Concurrent misses on the same key share one
+    execution (``cache_instance.flight``). On caches with
+    ``max_stale_minutes``, an expired entry is returned immediately while one
+    background refresh reloads it. ``watermarks`` names table watermarks
+    (``watermarks.WATERMARK_SOURCES``) folded into the key, so entries are
+    invalidated when the data changes and long TTLs are safe. Disabled with
+    ``QUERY_CACHE_ENABLED=0``.
+    """
+    normalizers = normalize or {}
 
-def cached_query(cache_instance: QueryCache):
     def decorator(func):
+        sig = inspect.signature(func)
+        key_name = f"{func.__module__}.{func.__name__}"
+        var_kw = next(
+            (p.name for p in sig.parameters.values() if p.kind is inspect.Parameter.VAR_KEYWORD),
+            None,
+        )
+
+        def make_key(args: tuple, kwargs: dict, watermark: Optional[str] = None) -> str:
+            try:
+                bound = sig.bind(*args, **kwargs)
+            except TypeError:
+                return cache_instance.get_cache_key(key_name, watermark, *args, **kwargs)
+            bound.apply_defaults()
+            values = dict(bound.arguments)
+            if var_kw is not None:
+                values.update(values.pop(var_kw, None) or {})
+            for name, fn in normalizers.items():
+                raw = values.get(name)
+                if raw is None:
+                    continue
+                try:
+                    normalized = fn(raw)
+                except Exception:
+                    normalized = None
+                if normalized is not None:
+                    values[name] = normalized
+            return cache_instance.get_cache_key(key_name, values, watermark)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not CACHE_ENABLED:
+                    return await func(*args, **kwargs)
+                watermark = await watermark_service.atoken(watermarks) if watermarks else None
+                cache_key = make_key(args, kwargs, watermark)
+
+                async def load():
+                    result = await func(*args, **kwargs)
+                    if _is_cacheable(result):
+                        await cache_instance.aset(cache_key, result, ttl_seconds=ttl_seconds)
+                    return result
+
+                found, cached_result, stale = await cache_instance.alookup(cache_key)
+                if found:
+                    logger.debug(f"Cache {'STALE' if stale else 'HIT'} for {func.__name__}")
+                    if stale and cache_instance.begin_refresh(cache_key):
+                        _refresh_async(cache_instance, cache_key, load)
+                    return cached_result
+
+                logger.debug(f"Cache MISS for {func.__name__}")
+                return await cache_instance.flight.ado(cache_key, load)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            cache_key = cache_instance.get_cache_key(func.__name__, *args, **kwargs)
-            
-            cached_result = cache_instance.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache HIT for {func.__name__}")
+            if not CACHE_ENABLED:
+                return func(*args, **kwargs)
+            watermark = watermark_service.token(watermarks) if watermarks else None
+            cache_key = make_key(args, kwargs, watermark)
+
+            def load():
+                result = func(*args, **kwargs)
+                if _is_cacheable(result):
+                    cache_instance.set(cache_key, result, ttl_seconds=ttl_seconds)
+                return result
+
+            found, cached_result, stale = cache_instance.lookup(cache_key)
+            if found:
+                logger.debug(f"Cache {'STALE' if stale else 'HIT'} for {func.__name__}")
+                if stale and cache_instance.begin_refresh(cache_key):
+                    _REFRESH_POOL.submit(_refresh_sync, cache_instance, cache_key, load)
                 return cached_result
-            
+
             logger.debug(f"Cache MISS for {func.__name__}")
-            result = func(*args, **kwargs)
-            
-            cache_instance.set(cache_key, result)
-            return result
-        
+            return cache_instance.flight.do(cache_key, load)
+
         return wrapper
     return decorator
 
 
-intelligence_cache = QueryCache(ttl_minutes=60, max_size=500)
-rankings_cache = QueryCache(ttl_minutes=30, max_size=500)
-pricing_cache = QueryCache(ttl_minutes=15, max_size=500)
-general_cache = QueryCache(ttl_minutes=30, max_size=1000)
+# TTL per domain: rankings move daily, prices and availability change within
+# the day, catalog metadata and talent rarely. The hits tables refresh once a
+# day, so rankings/intelligence serve stale (up to 6h) while revalidating.
+intelligence_cache = QueryCache(
+    ttl_minutes=60, max_size=500, namespace="intelligence", l2=l2_cache, max_stale_minutes=360)
+rankings_cache = QueryCache(
+    ttl_minutes=30, max_size=500, namespace="rankings", l2=l2_cache, max_stale_minutes=360)
+pricing_cache = QueryCache(ttl_minutes=15, max_size=500, namespace="pricing", l2=l2_cache)
+availability_cache = QueryCache(ttl_minutes=15, max_size=500, namespace="availability", l2=l2_cache)
+general_cache = QueryCache(ttl_minutes=30, max_size=1000, namespace="general", l2=l2_cache)
+# Entity resolution outcomes (validate_title/actor/director); not_found uses a
+# short per-entry TTL.
+validation_cache = QueryCache(ttl_minutes=360, max_size=5000, namespace="validation", l2=l2_cache)
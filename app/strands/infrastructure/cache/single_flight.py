@@ -0,0 +1,77 @@
+"""Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-flight execution
+instead of each running the same query before the cache is filled. Sync
+callers (tools run in worker threads) wait on a ``concurrent.futures.Future``;
+async callers await a shielded task, so cancelling the first caller does not
+cancel the work the others are waiting on.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """Per-key coalescing of concurrent sync and async calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, concurrent.futures.Future] = {}
+        self._tasks: Dict[Tuple[int, str], "asyncio.Task"] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            fut = self._calls.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._calls[key] = concurrent.futures.Future()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return fut.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Tasks belong to one loop; key them by loop so threads never share one.
+        task_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = self._tasks[task_key] = asyncio.ensure_future(fn())
+                self.leaders += 1
+                task.add_done_callback(lambda t: self._forget(task_key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: Tuple[int, str], task: "asyncio.Task") -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        # Mark the exception as retrieved when every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
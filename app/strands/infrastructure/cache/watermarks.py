@@ -0,0 +1,124 @@
+"""Per-table freshness watermarks for cache invalidation.
+
+Analytical tables only change when their load marker advances (e.g.
+``MAX(date_hits)`` on the hits tables, ``MAX(created_at)`` on prices). The
+service polls each marker at most every ``WATERMARK_POLL_SECONDS`` and
+``cached_query(..., watermarks=...)`` folds the current values into the cache
+key, so entries computed under an old watermark stop matching as soon as the
+data changes and TTLs can be long.
+
+A failed poll keeps the last known value; with no value at all the token is
+``"unknown"`` and entries fall back to plain TTL expiry.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from app.strands.infrastructure.database.connection import db
+from app.strands.infrastructure.database.constants import HITS_GLOBAL_TBL, HITS_PRESENCE_TBL, PRICES_TBL
+
+logger = logging.getLogger(__name__)
+
+# Each statement returns a single ``mark`` column; all are index-backed MAX().
+WATERMARK_SOURCES: Dict[str, str] = {
+    "hits_presence": f"SELECT MAX(date_hits)::date AS mark FROM {HITS_PRESENCE_TBL}",
+    "hits_global": f"SELECT MAX(date_hits)::date AS mark FROM {HITS_GLOBAL_TBL}",
+    "prices": f"SELECT MAX(created_at) AS mark FROM {PRICES_TBL}",
+}
+
+
+class WatermarkService:
+    """Thread-safe, lazily polled table watermarks."""
+
+    def __init__(self, sources: Optional[Dict[str, str]] = None, poll_seconds: Optional[float] = None):
+        self.sources = dict(sources or WATERMARK_SOURCES)
+        self.poll_seconds = poll_seconds or float(os.getenv("WATERMARK_POLL_SECONDS", "60"))
+        self._lock = threading.Lock()
+        self._values: Dict[str, Any] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._changed_at: Dict[str, float] = {}
+        self._polling: set = set()
+        self._stats = {"polls": 0, "changes": 0, "errors": 0}
+
+    def _due(self, source: str) -> bool:
+        with self._lock:
+            if source in self._polling:
+                return False
+            if time.monotonic() - self._checked_at.get(source, 0.0) < self.poll_seconds:
+                return False
+            # Claim the poll; concurrent callers keep using the last value.
+            self._polling.add(source)
+            return True
+
+    def _poll(self, source: str) -> None:
+        try:
+            rows = db.execute_query(self.sources[source], operation_name=f"watermark_{source}")
+            value = rows[0]["mark"] if rows else None
+        except Exception as e:
+            with self._lock:
+                self._stats["errors"] += 1
+                self._checked_at[source] = time.monotonic()
+                self._polling.discard(source)
+            logger.warning(f" Watermark '{source}' no disponible: {e}")
+            return
+        with self._lock:
+            self._stats["polls"] += 1
+            previous = self._values.get(source)
+            if source in self._values and value != previous:
+                self._stats["changes"] += 1
+                self._changed_at[source] = time.time()
+                logger.info(f" Watermark '{source}' avanzó: {previous} → {value}")
+            self._values[source] = value
+            self._checked_at[source] = time.monotonic()
+            self._polling.discard(source)
+
+    def get(self, source: str) -> Any:
+        """Current watermark of ``source`` (polled if the last check is old)."""
+        if source not in self.sources:
+            raise KeyError(f"Unknown watermark source '{source}'")
+        if self._due(source):
+            self._poll(source)
+        with self._lock:
+            return self._values.get(source)
+
+    async def aget(self, source: str) -> Any:
+        if source not in self.sources:
+            raise KeyError(f"Unknown watermark source '{source}'")
+        if self._due(source):
+            await asyncio.to_thread(self._poll, source)
+        with self._lock:
+            return self._values.get(source)
+
+    def token(self, sources: Iterable[str]) -> str:
+        return "|".join(f"{s}={self._fmt(self.get(s))}" for s in sources)
+
+    async def atoken(self, sources: Iterable[str]) -> str:
+        return "|".join([f"{s}={self._fmt(await self.aget(s))}" for s in sources])
+
+    @staticmethod
+    def _fmt(value: Any) -> str:
+        return "unknown" if value is None else str(value)
+
+    def invalidate(self, source: Optional[str] = None) -> None:
+        """Force the next access to re-poll (e.g. right after an ETL load)."""
+        with self._lock:
+            if source is None:
+                self._checked_at.clear()
+            else:
+                self._checked_at.pop(source, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "poll_seconds": self.poll_seconds,
+                "values": {k: self._fmt(v) for k, v in self._values.items()},
+                "changed_at": dict(self._changed_at),
+            }
+
+
+watermarks = WatermarkService()
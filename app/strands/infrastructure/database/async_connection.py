@@ -0,0 +1,278 @@
+"""Async PostgreSQL gateway (asyncpg) for the strands graph.
+
+Same contract as ``SQLConnectionManager.execute_query`` but awaitable, so
+async LangGraph nodes and async ``@tool`` functions do not block the event
+loop while Aurora works. Queries keep the psycopg2 placeholder style
+(``%s`` / ``%(name)s``); they are rewritten to asyncpg's ``$n`` form here.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+
+import asyncpg
+
+from app.strands.infrastructure.database.connection import Rows, resolve_db_config, resolve_reader_host
+from app.strands.infrastructure.database.connection import to_dollar_params as to_asyncpg
+from app.strands.infrastructure.database.instrumentation import estimate_bytes, query_stats
+from app.strands.infrastructure.database.routing import READER_LAG_SQL, reader_health
+
+logger = logging.getLogger(__name__)
+
+_WRITE_PREFIXES = ('CREATE', 'DROP', 'ALTER', 'INSERT', 'UPDATE', 'DELETE')
+
+_INT_TYPES = {"int2", "int4", "int8", "oid"}
+_FLOAT_TYPES = {"float4", "float8"}
+
+# Bad query arguments. asyncpg has two DataError classes: the SQLSTATE 22
+# one (exceptions.DataError) and a client-side one that subclasses
+# InterfaceError; neither says anything about the reader's health.
+_ARGUMENT_ERRORS = (asyncpg.exceptions.DataError, asyncpg.exceptions._base.DataError)
+
+# Errors that mean "the reader is unreachable", as opposed to query errors.
+# Always catch _ARGUMENT_ERRORS first: InterfaceError is a parent of one of them.
+_READER_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.exceptions.PostgresConnectionError,
+    asyncpg.exceptions.InterfaceError,
+    asyncpg.exceptions.OperatorInterventionError,
+)
+
+
+def _coerce_arg(value: Any, type_name: str) -> Any:
+    """Coerce a loosely typed argument to what the server inferred.
+
+    psycopg2 interpolates literals and lets Postgres cast them; asyncpg binds
+    typed values, so ``'123'`` for an ``int4`` parameter must become ``123``.
+    """
+    if value is None:
+        return None
+    if type_name in _INT_TYPES and not isinstance(value, int):
+        return int(str(value).strip())
+    if type_name in _FLOAT_TYPES and not isinstance(value, float):
+        return float(value)
+    if type_name == "numeric" and not isinstance(value, Decimal):
+        return Decimal(str(value))
+    if type_name == "date" and isinstance(value, str):
+        return date.fromisoformat(value)
+    if type_name in ("timestamp", "timestamptz") and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if type_name in ("text", "varchar", "bpchar", "name") and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def _parse_rowcount(status: str) -> int:
+    parts = (status or "").split()
+    return int(parts[-1]) if parts and parts[-1].isdigit() else 0
+
+
+class AsyncSQLConnectionManager:
+    """asyncpg pool with the same ``execute_query`` contract as the sync manager."""
+
+    def __init__(
+        self,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        host: Optional[str] = None,
+        role: str = "writer",
+    ):
+        self.min_size = min_size or int(os.getenv("DB_ASYNC_POOL_MIN", "1"))
+        self.max_size = max_size or int(os.getenv("DB_ASYNC_POOL_MAX", "10"))
+        self.host = host
+        self.role = role
+        # Hard cap on rows materialized per query, as in the sync manager (0 = unlimited).
+        self.max_rows = int(os.getenv("DB_MAX_ROWS", "50000"))
+        self.truncated_results = 0
+        # Reader pool is resolved lazily (needs the DB config) on first query.
+        self.reader: Optional["AsyncSQLConnectionManager"] = None
+        self._reader_resolved = role != "writer"
+        self._pool: Optional[asyncpg.Pool] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _create_pool(self) -> asyncpg.Pool:
+        cfg = await asyncio.to_thread(resolve_db_config)
+        host = self.host or cfg["host"]
+        pool = await asyncpg.create_pool(
+            host=host,
+            port=cfg["port"],
+            database=cfg["db"],
+            user=cfg["user"],
+            password=cfg["password"],
+            ssl=os.getenv("DB_SSLMODE", "require"),
+            min_size=self.min_size,
+            max_size=self.max_size,
+            timeout=30 if self.role == "writer" else int(os.getenv("DB_READER_CONNECT_TIMEOUT", "5")),
+            server_settings={
+                "application_name": "chatbot_app_async" if self.role == "writer" else f"chatbot_app_async_{self.role}",
+                "search_path": os.getenv("DB_SEARCH_PATH", "ms,public"),
+                "statement_timeout": os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"),
+            },
+        )
+        logger.info(
+            f" Async pool connected to PostgreSQL: {cfg['db']}@{host}:{cfg['port']} "
+            f"(min={self.min_size} max={self.max_size})"
+        )
+        return pool
+
+    async def get_pool(self) -> asyncpg.Pool:
+        # A pool is bound to the loop that created it; rebuild if the loop changed.
+        loop = asyncio.get_running_loop()
+        if self._pool is not None and self._loop is loop:
+            return self._pool
+
+        if self._lock is None or self._loop is not loop:
+            if self._pool is not None:
+                self._abandon_pool(self._pool)
+            self._lock = asyncio.Lock()
+            self._pool = None
+            self._loop = loop
+
+        async with self._lock:
+            if self._pool is None:
+                self._pool = await self._create_pool()
+        return self._pool
+
+    def _abandon_pool(self, pool: asyncpg.Pool) -> None:
+        # The old loop may already be closed, so the pool cannot be awaited: drop its sockets.
+        logger.warning(f" Async pool ({self.role}) creado en otro event loop; cerrando sus conexiones")
+        try:
+            pool.terminate()
+        except Exception as e:
+            logger.warning(f" No se pudo cerrar el pool anterior ({self.role}): {e}")
+
+    def get_stats(self) -> dict:
+        return {
+            "role": self.role,
+            "connected": self._pool is not None,
+            "max_rows": self.max_rows,
+            "truncated_results": self.truncated_results,
+            **({"reader": self.reader.get_stats()} if self.reader is not None else {}),
+        }
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+        self._pool = None
+        self._loop = None
+        self._lock = None
+        if self.reader is not None:
+            await self.reader.close()
+
+    async def _get_reader(self) -> Optional["AsyncSQLConnectionManager"]:
+        if not self._reader_resolved:
+            host = resolve_reader_host(await asyncio.to_thread(resolve_db_config))
+            if host:
+                reader_health.host = host
+                self.reader = AsyncSQLConnectionManager(
+                    max_size=int(os.getenv("DB_READER_POOL_MAX", str(self.max_size))),
+                    host=host,
+                    role="reader",
+                )
+            self._reader_resolved = True
+        return self.reader
+
+    async def _route_to_reader(self) -> bool:
+        reader = await self._get_reader()
+        if reader is None or reader_health.is_down():
+            return False
+        if reader_health.lag_check_due():
+            try:
+                rows = await reader.execute_query(READER_LAG_SQL, operation_name="reader_lag")
+                reader_health.record_lag(rows[0]["lag_seconds"] if rows else 0)
+            except _READER_ERRORS as e:
+                reader_health.mark_down(e)
+                return False
+        return reader_health.usable()
+
+    def _row_cap(self, max_rows: Optional[int]) -> Optional[int]:
+        caps = [c for c in (max_rows, self.max_rows) if c]
+        return min(caps) if caps else None
+
+    async def _run(
+        self, conn: asyncpg.Connection, sql: str, args: List[Any], is_write: bool,
+        max_rows: Optional[int] = None, row_format: str = "dict",
+    ):
+        if is_write and "RETURNING" not in sql.upper():
+            return _parse_rowcount(await conn.execute(sql, *args))
+        cap = None if is_write else self._row_cap(max_rows)
+        if cap:
+            # Server-side cursor: at most cap + 1 rows (to detect truncation) leave Postgres.
+            async with conn.transaction(readonly=True):
+                cur = await conn.cursor(sql, *args)
+                records = await cur.fetch(cap + 1)
+            if len(records) > cap:
+                records = records[:cap]
+                self.truncated_results += 1
+                logger.warning(f" Result truncated to {cap} filas (max_rows)")
+        else:
+            records = await conn.fetch(sql, *args)
+        if row_format == "tuple":
+            # Column names come from the first record (empty when no rows).
+            return Rows(list(records[0].keys()) if records else [], (tuple(r) for r in records))
+        return [dict(r) for r in records]
+
+    async def execute_query(
+        self, query, params=None, operation_name=None, max_rows=None, use_writer=False, row_format="dict",
+    ):
+        if row_format not in ("dict", "tuple"):
+            raise ValueError(f"row_format must be 'dict' or 'tuple', got '{row_format}'")
+        sql, args = to_asyncpg(query, params)
+        is_write = query.strip().upper().startswith(_WRITE_PREFIXES)
+
+        if not (is_write or use_writer) and await self._route_to_reader():
+            try:
+                result = await self.reader.execute_query(
+                    query, params, operation_name, max_rows=max_rows, row_format=row_format)
+                reader_health.count("reader_reads")
+                return result
+            except asyncpg.exceptions.QueryCanceledError:
+                raise  # statement_timeout: re-running it on the writer would only double the cost
+            except asyncpg.exceptions.ReadOnlySQLTransactionError:
+                pass  # write hidden in a CTE/function; run it on the writer
+            except _ARGUMENT_ERRORS:
+                raise  # still bad after coercion: the writer would fail the same way
+            except _READER_ERRORS as e:
+                reader_health.mark_down(e)
+        if not is_write and self.reader is not None:
+            reader_health.count("writer_reads")
+
+        pool = await self.get_pool()
+        start_time = time.perf_counter()
+        try:
+            async with pool.acquire() as conn:
+                try:
+                    result = await self._run(conn, sql, args, is_write, max_rows, row_format)
+                except _ARGUMENT_ERRORS:
+                    stmt = await conn.prepare(sql)
+                    types = [t.name for t in stmt.get_parameters()]
+                    args = [_coerce_arg(a, t) for a, t in zip(args, types)]
+                    result = await self._run(conn, sql, args, is_write, max_rows, row_format)
+        except Exception as e:
+            query_stats.record(
+                query, params, operation_name,
+                elapsed_ms=(time.perf_counter() - start_time) * 1000, error=e,
+            )
+            raise
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        is_rows = isinstance(result, list)
+        query_stats.record(
+            query, params, operation_name,
+            elapsed_ms=elapsed_ms,
+            rows=len(result) if is_rows else result,
+            nbytes=estimate_bytes(result) if is_rows else 0,
+        )
+        logger.debug(
+            f"[async] {operation_name or 'query'}: "
+            f"{len(result) if is_rows else result} filas en {elapsed_ms:.1f}ms"
+        )
+        return result
+
+async_db = AsyncSQLConnectionManager()
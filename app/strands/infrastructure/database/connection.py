@@ -1,21 +1,62 @@
 import base64
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
 import time
-from functools import lru_cache
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import boto3
 import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
 import psycopg2.extras
 from botocore.exceptions import ClientError
 
+from app.strands.infrastructure.database.instrumentation import estimate_bytes, query_stats, template_hash
+from app.strands.infrastructure.database.routing import READER_LAG_SQL, reader_health
+
 logger = logging.getLogger(__name__)
 
+Params = Optional[Union[Sequence[Any], Dict[str, Any]]]
+
+_PLACEHOLDER_RE = re.compile(r"%\((\w+)\)s|%s|%%")
+
+
+_SECRET_TTL_SECONDS = float(os.getenv("DB_SECRET_TTL_SECONDS", "3600"))
+_secret_lock = threading.Lock()
+_secret_cache: Dict[str, Any] = {"value": None, "loaded_at": 0.0}
+
+
+def get_secret(force_refresh: bool = False) -> dict:
+    """DB secret from Secrets Manager, cached for ``DB_SECRET_TTL_SECONDS``.
 
-@lru_cache(maxsize=1)
-def get_secret() -> dict:
+    A failed refresh keeps serving the previous value (rotation is rare and
+    the old password usually stays valid for a while).
+    """
+    with _secret_lock:
+        cached = _secret_cache["value"]
+        age = time.monotonic() - _secret_cache["loaded_at"]
+        if cached is not None and not force_refresh and age < _SECRET_TTL_SECONDS:
+            return cached
+        try:
+            cfg = _fetch_secret()
+        except Exception as e:
+            if cached is None:
+                raise
+            logger.warning(f" Secret refresh failed, using cached value: {e}")
+            return cached
+        _secret_cache["value"] = cfg
+        _secret_cache["loaded_at"] = time.monotonic()
+        return cfg
 
+
+def _fetch_secret() -> dict:
     secret_id = os.getenv("DB_SECRET_ID", "aurora-postgres-origin-insights-secret-er")
     region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
 
@@ -39,85 +80,692 @@ def get_secret() -> dict:
     if missing:
         raise RuntimeError(f"Secreto incompleto; faltan claves: {', '.join(missing)}")
 
+    cfg["reader_host"] = raw.get("reader_host") or raw.get("host_ro")
     return cfg
 
 
+def resolve_db_config(force_refresh: bool = False) -> dict:
+    """Credenciales de la base compartida por strands y los módulos legacy.
+
+    An explicit ``DB_SECRET_ID`` wins; otherwise the legacy ``infra.config``
+    settings (AURORA_*/PG*/DATABASE_URL/secret ARN) are used when complete,
+    falling back to the default strands secret.
+    """
+    if not os.getenv("DB_SECRET_ID"):
+        from infra.config import SETTINGS
+        if SETTINGS.db_ready:
+            return {
+                "host": SETTINGS.aurora_host,
+                "port": SETTINGS.aurora_port,
+                "db": SETTINGS.aurora_db,
+                "user": SETTINGS.aurora_user,
+                "password": SETTINGS.aurora_pass,
+                "reader_host": None,
+            }
+    return get_secret(force_refresh=force_refresh)
+
+
+def resolve_reader_host(cfg: dict) -> Optional[str]:
+    """Aurora reader endpoint (``DB_READER_HOST`` or the secret's ``reader_host``)."""
+    host = os.getenv("DB_READER_HOST") or cfg.get("reader_host")
+    if not host or host == cfg.get("host"):
+        return None
+    return host
+
+
+def _session_options(search_path: str, statement_timeout_ms: int) -> str:
+    return f"-c search_path={search_path} -c statement_timeout={int(statement_timeout_ms)}"
+
+
+def _rewrite_placeholders(query: str, params: Params, dollar: bool) -> Tuple[str, List[Any]]:
+    args: List[Any] = []
+    named: Dict[str, int] = {}
+    positional = iter(params) if params is not None and not isinstance(params, dict) else None
+
+    def _sub(match: "re.Match") -> str:
+        token = match.group(0)
+        if token == "%%":
+            return "%" if dollar else "%%"
+        if token == "%s":
+            if positional is None:
+                raise ValueError("Positional placeholder used without sequence params")
+            args.append(next(positional))
+            return f"${len(args)}" if dollar else "%s"
+        name = match.group(1)
+        if not isinstance(params, dict):
+            raise ValueError(f"Named placeholder '{name}' used without dict params")
+        if not dollar:
+            args.append(params[name])
+            return "%s"
+        if name not in named:
+            args.append(params[name])
+            named[name] = len(args)
+        return f"${named[name]}"
+
+    return _PLACEHOLDER_RE.sub(_sub, query), args
+
+
+def to_dollar_params(query: str, params: Params = None) -> Tuple[str, List[Any]]:
+    """Rewrite a psycopg2-style query into server-side ``$n`` form.
+
+    Named placeholders reuse the same ``$n`` when repeated; ``%%`` is
+    unescaped to a literal ``%``.
+    """
+    return _rewrite_placeholders(query, params, dollar=True)
+
+
+def to_positional_params(query: str, params: Params = None) -> Tuple[str, List[Any]]:
+    """Rewrite named placeholders to ``%s`` so statements can be concatenated."""
+    return _rewrite_placeholders(query, params, dollar=False)
+
+
+class Rows(list):
+    """Compact result (``row_format="tuple"``): a list of row tuples plus ``columns``.
+
+    Behaves like a list for ``len``/truthiness/slicing/JSON; column names are
+    stored once instead of a key per row.
+    """
+
+    def __init__(self, columns: Sequence[str], rows=()):
+        super().__init__(rows)
+        self.columns: List[str] = list(columns)
+
+    def index_of(self, name: str) -> int:
+        return self.columns.index(name)
+
+    def column(self, name: str) -> list:
+        i = self.columns.index(name)
+        return [row[i] for row in self]
+
+    def to_columnar(self) -> Dict[str, list]:
+        """Column arrays: ``{"col": [v1, v2, ...], ...}``."""
+        return {name: [row[i] for row in self] for i, name in enumerate(self.columns)}
+
+    def to_dicts(self) -> List[dict]:
+        return [dict(zip(self.columns, row)) for row in self]
+
+
+_ROW_FORMATS = ("dict", "tuple")
+
+
+def _cursor_factory(row_format: str):
+    if row_format not in _ROW_FORMATS:
+        raise ValueError(f"row_format must be one of {_ROW_FORMATS}, got '{row_format}'")
+    return psycopg2.extras.RealDictCursor if row_format == "dict" else None
+
+
+class PoolTimeoutError(RuntimeError):
+    """No pooled connection became available within the checkout timeout."""
+
+
 class SQLConnectionManager:
-    """PostgreSQL con reintentos."""
+    """Pool thread-safe de conexiones PostgreSQL con reintentos.
+
+    Connections are checked out per query and returned afterwards. Liveness
+    is only probed for connections that sat idle longer than
+    ``idle_check_seconds``; broken connections are discarded and replaced.
+    """
 
-    def __init__(self):
-        cfg = get_secret()
+    def __init__(
+        self,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        idle_check_seconds: Optional[float] = None,
+        checkout_timeout: Optional[float] = None,
+        host: Optional[str] = None,
+        role: str = "writer",
+    ):
+        cfg = resolve_db_config()
+        self.role = role
+        self.search_path = os.getenv("DB_SEARCH_PATH", "ms,public")
+        self.statement_timeout_ms = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
         self.conn_params = {
-            "host": cfg["host"],
+            "host": host or cfg["host"],
             "port": cfg["port"],
             "dbname": cfg["db"],
             "user": cfg["user"],
             "password": cfg["password"],
-            "connect_timeout": 30,
-            "application_name": "chatbot_app",
-            "sslmode": "require",
+            "connect_timeout": 30 if role == "writer" else int(os.getenv("DB_READER_CONNECT_TIMEOUT", "5")),
+            "application_name": "chatbot_app" if role == "writer" else f"chatbot_app_{role}",
+            "sslmode": os.getenv("DB_SSLMODE", "require"),
+            "options": _session_options(self.search_path, self.statement_timeout_ms),
+        }
+        self.min_size = min_size if min_size is not None else int(os.getenv("DB_POOL_MIN", "1"))
+        self.max_size = max(max_size or int(os.getenv("DB_POOL_MAX", "10")), 1)
+        self.idle_check_seconds = (
+            idle_check_seconds if idle_check_seconds is not None
+            else float(os.getenv("DB_POOL_IDLE_CHECK_SECONDS", "30"))
+        )
+        self.checkout_timeout = (
+            checkout_timeout if checkout_timeout is not None
+            else float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        )
+        # Hard cap on rows materialized per query (0 = unlimited).
+        self.max_rows = int(os.getenv("DB_MAX_ROWS", "50000"))
+
+        self._cond = threading.Condition()
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        # statement_timeout currently set on each pooled connection (by id).
+        self._timeouts: Dict[int, int] = {}
+        # Server-side prepared statement names per pooled connection (by id).
+        self._prepared: Dict[int, Set[str]] = {}
+        # SQL template -> prepared statement name; shared by all connections.
+        self._statement_names: Dict[str, str] = {}
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "timeouts": 0,
+            "connections_opened": 0,
+            "connections_discarded": 0,
+            "liveness_checks": 0,
+            "retries": 0,
+            "timeout_changes": 0,
+            "prepared_hits": 0,
+            "prepared_misses": 0,
+            "truncated_results": 0,
+            "streamed_queries": 0,
         }
-        self._connection = None
         self._initialized = False
-        self._initialize_connection()
+        self._initialize_pool()
 
-    def _initialize_connection(self):
-        self._connection = psycopg2.connect(**self.conn_params)
+        # Read-only statements go to the Aurora reader endpoint when configured.
+        self.reader: Optional["SQLConnectionManager"] = None
+        reader_host = resolve_reader_host(cfg) if role == "writer" else None
+        if reader_host:
+            reader_health.host = reader_host
+            self.reader = SQLConnectionManager(
+                min_size=0,
+                max_size=int(os.getenv("DB_READER_POOL_MAX", str(self.max_size))),
+                idle_check_seconds=self.idle_check_seconds,
+                checkout_timeout=self.checkout_timeout,
+                host=reader_host,
+                role="reader",
+            )
+
+    def _initialize_pool(self):
+        for _ in range(min(self.min_size, self.max_size)):
+            with self._cond:
+                self._size += 1
+            self._idle.append((self._open_connection(), time.monotonic()))
         if not self._initialized:
             logger.info(
                 f" Connected to PostgreSQL: {self.conn_params['dbname']}@"
-                f"{self.conn_params['host']}:{self.conn_params['port']}"
+                f"{self.conn_params['host']}:{self.conn_params['port']} "
+                f"(pool min={self.min_size} max={self.max_size})"
             )
             self._initialized = True
 
-    def get_connection(self, retry_count=3):
-        for attempt in range(retry_count):
-            if self._connection and not self._connection.closed:
-                with self._connection.cursor() as c:
-                    c.execute("SELECT 1")
-                return self._connection
-
-            if attempt == 0:
-                logger.info(" Creating new PostgreSQL connection")
-            self._connection = psycopg2.connect(**self.conn_params)
-            self._connection.autocommit = True
-            return self._connection
-
-    def _close(self):
-        if self._connection and not self._connection.closed:
-            self._connection.close()
-        self._connection = None
-
-    def execute_query(self, query, params=None, operation_name=None):
-        import time
-        
-        print("\n" + "="*80)
-        print(" SQL QUERY EJECUTADA")
-        print("="*80)
-        if operation_name:
-            print(f" Operación: {operation_name}")
-        print(f" Query:")
-        print(query)
-        if params:
-            print(f" Parámetros: {params}")
-        print("="*80 + "\n")
-        
-        conn = self.get_connection()
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            start_time = time.time()
+    def _refresh_credentials(self, force: bool = False):
+        cfg = resolve_db_config(force_refresh=force)
+        self.conn_params["user"] = cfg["user"]
+        self.conn_params["password"] = cfg["password"]
+
+    def _connect(self):
+        # Picks up rotated credentials once the cached secret expires.
+        self._refresh_credentials()
+        try:
+            return psycopg2.connect(**self.conn_params)
+        except psycopg2.OperationalError as e:
+            if "password authentication failed" not in str(e):
+                raise
+            logger.warning(" Authentication failed; reloading DB secret and retrying")
+            self._refresh_credentials(force=True)
+            return psycopg2.connect(**self.conn_params)
+
+    def _open_connection(self):
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        conn.autocommit = True
+        with self._cond:
+            self._stats["connections_opened"] += 1
+            self._timeouts[id(conn)] = self.statement_timeout_ms
+        return conn
+
+    def _discard(self, conn):
+        try:
+            if conn is not None and not conn.closed:
+                conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._stats["connections_discarded"] += 1
+            self._timeouts.pop(id(conn), None)
+            self._prepared.pop(id(conn), None)
+            self._cond.notify()
+
+    def _is_alive(self, conn, last_used: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.idle_check_seconds:
+            return True
+        with self._cond:
+            self._stats["liveness_checks"] += 1
+        try:
+            with conn.cursor() as c:
+                c.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _checkout(self):
+        deadline = time.monotonic() + self.checkout_timeout
+        waited_from = None
+        while True:
+            with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeoutError(
+                            f"No DB connection available after {self.checkout_timeout:.1f}s "
+                            f"(pool max={self.max_size})"
+                        )
+                    if waited_from is None:
+                        waited_from = time.monotonic()
+                    self._cond.wait(remaining)
+
+                if waited_from is not None:
+                    waited = time.monotonic() - waited_from
+                    self._stats["waits"] += 1
+                    self._stats["wait_time_total"] += waited
+                    self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited)
+                    waited_from = None
+
+                self._stats["checkouts"] += 1
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                else:
+                    self._size += 1
+                    conn, last_used = None, None
+
+            if conn is None:
+                return self._open_connection()
+            if self._is_alive(conn, last_used):
+                return conn
+            self._discard(conn)
+
+    def _checkin(self, conn, broken: bool = False):
+        if broken or conn.closed:
+            self._discard(conn)
+            return
+        try:
+            if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def _apply_timeout(self, conn, timeout_ms: Optional[int]):
+        # Connections run in autocommit, so SET persists for the session;
+        # only issue it when the wanted value differs from the current one.
+        wanted = self.statement_timeout_ms if timeout_ms is None else int(timeout_ms)
+        if self._timeouts.get(id(conn)) == wanted:
+            return
+        with conn.cursor() as c:
+            c.execute("SET statement_timeout = %s", (wanted,))
+        with self._cond:
+            self._timeouts[id(conn)] = wanted
+            self._stats["timeout_changes"] += 1
+
+    @contextmanager
+    def connection(self, timeout_ms: Optional[int] = None):
+        """Check out a pooled connection; it is returned (or discarded if broken) on exit.
+
+        ``timeout_ms`` sets ``statement_timeout`` for this checkout (``None`` = pool default).
+        """
+        conn = self._checkout()
+        broken = False
+        try:
+            self._apply_timeout(conn, timeout_ms)
+            yield conn
+        except psycopg2.errors.QueryCanceled:
+            raise  # statement_timeout (an OperationalError): the connection itself is fine
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self._checkin(conn, broken=broken)
+
+    def get_pool_stats(self) -> dict:
+        with self._cond:
+            size = self._size
+            idle = len(self._idle)
+            stats = dict(self._stats)
+        waits = stats["waits"]
+        return {
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "checkouts": stats["checkouts"],
+            "waits": waits,
+            "avg_wait_ms": round(stats["wait_time_total"] / waits * 1000, 2) if waits else 0.0,
+            "max_wait_ms": round(stats["wait_time_max"] * 1000, 2),
+            "timeouts": stats["timeouts"],
+            "connections_opened": stats["connections_opened"],
+            "connections_discarded": stats["connections_discarded"],
+            "liveness_checks": stats["liveness_checks"],
+            "retries": stats["retries"],
+            "timeout_changes": stats["timeout_changes"],
+            "prepared_hits": stats["prepared_hits"],
+            "prepared_misses": stats["prepared_misses"],
+            "prepared_templates": len(self._statement_names),
+            "truncated_results": stats["truncated_results"],
+            "streamed_queries": stats["streamed_queries"],
+            "max_rows": self.max_rows,
+            "statement_timeout_ms": self.statement_timeout_ms,
+            "role": self.role,
+            "host": self.conn_params["host"],
+            **(
+                {"reader": self.reader.get_pool_stats(), "routing": reader_health.stats()}
+                if self.reader is not None else {}
+            ),
+        }
+
+    def close_all(self):
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _ in idle:
+            self._discard(conn)
+        if self.reader is not None:
+            self.reader.close_all()
+
+    def _route_to_reader(self) -> bool:
+        if self.reader is None or reader_health.is_down():
+            return False
+        if reader_health.lag_check_due():
+            try:
+                rows = self.reader.execute_query(READER_LAG_SQL, operation_name="reader_lag", retry_count=1)
+                reader_health.record_lag(rows[0]["lag_seconds"] if rows else 0)
+            except (psycopg2.Error, PoolTimeoutError) as e:
+                reader_health.mark_down(e)
+                return False
+        return reader_health.usable()
+
+    def execute_query(
+        self, query, params=None, operation_name=None, retry_count=2, timeout_ms=None,
+        prepared=False, max_rows=None, use_writer=False, row_format="dict",
+    ):
+        """Run a statement and return its rows (or the rowcount for writes).
+
+        ``row_format="dict"`` returns ``RealDictRow`` dicts; ``"tuple"`` returns
+        a compact :class:`Rows` (tuples + column names once).
+        """
+        query_upper = query.strip().upper()
+        is_write = query_upper.startswith(('CREATE', 'DROP', 'ALTER', 'INSERT', 'UPDATE', 'DELETE'))
+
+        if not (is_write or use_writer) and self._route_to_reader():
+            try:
+                result = self.reader.execute_query(
+                    query, params, operation_name, retry_count=retry_count, timeout_ms=timeout_ms,
+                    prepared=prepared, max_rows=max_rows, row_format=row_format,
+                )
+                reader_health.count("reader_reads")
+                return result
+            except psycopg2.errors.QueryCanceled:
+                raise  # statement_timeout: re-running it on the writer would only double the cost
+            except psycopg2.errors.ReadOnlySqlTransaction:
+                pass  # write hidden in a CTE/function; run it on the writer
+            except (psycopg2.OperationalError, psycopg2.InterfaceError, PoolTimeoutError) as e:
+                reader_health.mark_down(e)
+        if not is_write and self.reader is not None:
+            reader_health.count("writer_reads")
+
+        # retry_count counts attempts; 0 still runs the statement once.
+        attempts = max(1, retry_count)
+        start_time = time.perf_counter()
+        try:
+            for attempt in range(attempts):
+                try:
+                    with self.connection(timeout_ms=timeout_ms) as conn:
+                        if prepared:
+                            result = self._execute_prepared(conn, query, params, is_write, max_rows, row_format)
+                        else:
+                            result = self._execute(conn, query, params, is_write, max_rows, row_format)
+                    break
+                except psycopg2.errors.QueryCanceled:
+                    raise  # statement_timeout: a replay would time out again
+                except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                    # Only reads are safe to replay on a fresh connection.
+                    if is_write or attempt == attempts - 1:
+                        raise
+                    with self._cond:
+                        self._stats["retries"] += 1
+                    logger.warning(f" Broken PostgreSQL connection, retrying: {e}")
+        except Exception as e:
+            query_stats.record(
+                query, params, operation_name,
+                elapsed_ms=(time.perf_counter() - start_time) * 1000, error=e,
+            )
+            raise
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        is_rows = isinstance(result, list)
+        query_stats.record(
+            query, params, operation_name,
+            elapsed_ms=elapsed_ms,
+            rows=len(result) if is_rows else max(result, 0),
+            nbytes=estimate_bytes(result) if is_rows else 0,
+        )
+        logger.debug(
+            f" {operation_name or 'query'}: "
+            f"{len(result) if is_rows else result} filas en {elapsed_ms:.1f}ms"
+        )
+        return result
+
+    def execute_batch(self, statements, operation_name=None, timeout_ms=None) -> List[list]:
+        """Run several independent read statements in a single round-trip.
+
+        Each ``(query, params)`` becomes a ``json_agg`` scalar subquery of one
+        SELECT; results come back in order, one list of dicts per statement.
+        Values are JSON-typed (dates/decimals arrive as str/float), so use it
+        for probes and lookups rather than typed payloads.
+        """
+        if not statements:
+            return []
+        parts: List[str] = []
+        args: List[Any] = []
+        for i, (query, params) in enumerate(statements):
+            sql, stmt_args = to_positional_params(query.strip().rstrip(";"), params)
+            parts.append(f"(SELECT COALESCE(json_agg(t), '[]'::json) FROM ({sql}) t) AS r{i}")
+            args.extend(stmt_args)
+
+        rows = self.execute_query(
+            "SELECT " + ",\n       ".join(parts),
+            tuple(args),
+            operation_name or f"batch[{len(statements)}]",
+            timeout_ms=timeout_ms,
+        )
+        row = rows[0] if rows else {}
+        return [row.get(f"r{i}") or [] for i in range(len(statements))]
+
+    def _statement_name(self, query: str) -> str:
+        name = self._statement_names.get(query)
+        if name is None:
+            # Exact text: template_hash folds case/whitespace, which would alias
+            # templates that differ only in quoted literals or identifiers.
+            name = f"ps_{hashlib.md5(query.encode()).hexdigest()}"
+            with self._cond:
+                self._statement_names[query] = name
+        return name
+
+    def _execute_prepared(self, conn, query, params, is_write, max_rows=None, row_format="dict"):
+        """PREPARE the template once per connection, then EXECUTE it by name."""
+        name = self._statement_name(query)
+        sql, args = to_dollar_params(query, params)
+        names = self._prepared.setdefault(id(conn), set())
+
+        with conn.cursor(cursor_factory=_cursor_factory(row_format)) as cur:
+            if name in names:
+                with self._cond:
+                    self._stats["prepared_hits"] += 1
+            else:
+                try:
+                    cur.execute(f"PREPARE {name} AS {sql}")
+                except psycopg2.errors.DuplicatePreparedStatement:
+                    pass  # prepared outside the registry's knowledge; reuse it
+                names.add(name)
+                with self._cond:
+                    self._stats["prepared_misses"] += 1
+
+            if args:
+                cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(args))})", args)
+            else:
+                cur.execute(f"EXECUTE {name}")
+
+            if is_write and not conn.autocommit:
+                conn.commit()
+            if cur.description:
+                return self._fetch_rows(cur, max_rows, row_format)
+            return cur.rowcount
+
+    def _row_cap(self, max_rows: Optional[int]) -> Optional[int]:
+        caps = [c for c in (max_rows, self.max_rows) if c]
+        return min(caps) if caps else None
+
+    def _fetch_rows(self, cur, max_rows: Optional[int], row_format: str = "dict") -> list:
+        cap = self._row_cap(max_rows)
+        if cap is None:
+            rows = cur.fetchall()
+        else:
+            rows = cur.fetchmany(cap + 1)
+            if len(rows) > cap:
+                rows = rows[:cap]
+                with self._cond:
+                    self._stats["truncated_results"] += 1
+                logger.warning(f" Result truncated to {cap} filas (max_rows)")
+        if row_format == "tuple":
+            return Rows([d[0] for d in cur.description], rows)
+        return rows
+
+    def iter_query(
+        self, query, params=None, operation_name=None, max_rows=None, batch_size=500, timeout_ms=None,
+        row_format="dict",
+    ) -> Iterator[Any]:
+        """Stream rows from a server-side (named) cursor, ``batch_size`` at a time.
+
+        At most ``max_rows`` rows (and never more than ``DB_MAX_ROWS``) are
+        read. The pooled connection is held until the iterator is exhausted or
+        closed, so consume it in a ``for`` loop or wrap it in ``closing()``.
+        Runs on the reader when available; it falls back to the writer only
+        if the reader fails before the first row. ``row_format="tuple"``
+        yields plain tuples.
+        """
+        if self._route_to_reader():
+            streamed = False
+            try:
+                for row in self.reader._iter_query(
+                    query, params, operation_name, max_rows, batch_size, timeout_ms, row_format
+                ):
+                    streamed = True
+                    yield row
+                reader_health.count("reader_reads")
+                return
+            except psycopg2.errors.QueryCanceled:
+                raise
+            except (psycopg2.OperationalError, psycopg2.InterfaceError, PoolTimeoutError) as e:
+                if streamed:
+                    raise
+                reader_health.mark_down(e)
+        if self.reader is not None:
+            reader_health.count("writer_reads")
+        yield from self._iter_query(
+            query, params, operation_name, max_rows, batch_size, timeout_ms, row_format)
+
+    def _iter_query(
+        self, query, params, operation_name, max_rows, batch_size, timeout_ms, row_format="dict",
+    ) -> Iterator[Any]:
+        cap = self._row_cap(max_rows)
+        count = 0
+        nbytes = 0
+        error = None
+        start_time = time.perf_counter()
+        with self._cond:
+            self._stats["streamed_queries"] += 1
+        try:
+            with self.connection(timeout_ms=timeout_ms) as conn:
+                # Named cursors only live inside a transaction.
+                conn.autocommit = False
+                try:
+                    with conn.cursor(
+                        name=f"stream_{uuid.uuid4().hex[:12]}",
+                        cursor_factory=_cursor_factory(row_format),
+                    ) as cur:
+                        cur.execute(query, params)
+                        while cap is None or count < cap:
+                            size = batch_size if cap is None else min(batch_size, cap - count)
+                            batch = cur.fetchmany(size)
+                            if not batch:
+                                break
+                            count += len(batch)
+                            nbytes += estimate_bytes(batch)
+                            yield from batch
+                finally:
+                    if not conn.closed:
+                        conn.rollback()
+                        conn.autocommit = True
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            query_stats.record(
+                query, params, operation_name,
+                elapsed_ms=(time.perf_counter() - start_time) * 1000,
+                rows=count, nbytes=nbytes, error=error,
+            )
+
+    def _execute(self, conn, query, params, is_write, max_rows=None, row_format="dict"):
+        with conn.cursor(cursor_factory=_cursor_factory(row_format)) as cur:
             cur.execute(query, params)
-            elapsed_time = time.time() - start_time
 
-            query_upper = query.strip().upper()
-            if query_upper.startswith(('CREATE', 'DROP', 'ALTER', 'INSERT', 'UPDATE', 'DELETE')):
+            if is_write and not conn.autocommit:
                 conn.commit()
             if cur.description:
-                results = cur.fetchall()
-                print(f" Query retornó {len(results)} filas en {elapsed_time:.3f}s\n")
-                return results
-            else:
-                print(f" Query afectó {cur.rowcount} filas en {elapsed_time:.3f}s\n")
-                return cur.rowcount
+                return self._fetch_rows(cur, max_rows, row_format)
+            return cur.rowcount
+
+
+class _LazyConnectionManager:
+    """Module-level ``db``: the pool (secret lookup + connects) is built on first use.
+
+    Keeps imports free of network I/O; the app lifespan warms it up in the
+    background (see ``app.strands.infrastructure.warmup``).
+    """
+
+    def __init__(self, factory: Callable[[], SQLConnectionManager]):
+        self._factory = factory
+        self._instance: Optional[SQLConnectionManager] = None
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None
+
+    def get(self) -> SQLConnectionManager:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                instance = self._instance
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
 
 
-db = SQLConnectionManager()
+db = _LazyConnectionManager(SQLConnectionManager)
@@ -0,0 +1,233 @@
+"""Per-template SQL instrumentation.
+
+Aggregates latency, rows, approximate bytes fetched and errors per query
+template, keyed by a hash of the normalized SQL (callers often embed IDs in
+``operation_name``, so it is kept only as a label). Generated SQL makes the
+template set open-ended, so it is an LRU capped at ``DB_STATS_MAX_TEMPLATES``.
+The SQL text is only kept for a sample of calls, with string literals and
+parameter values redacted (type and length only).
+"""
+
+import bisect
+import hashlib
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_WS_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_MAX_SAMPLE_SQL = 2000
+_MAX_SAMPLE_PARAMS = 50
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def template_hash(query: str) -> str:
+    normalized = _WS_RE.sub(" ", query).strip().lower()
+    return hashlib.md5(normalized.encode()).hexdigest()[:12]
+
+
+def estimate_bytes(rows: Any) -> int:
+    """Rough payload size of a result set (text/bytes length, 8 for scalars)."""
+    if not isinstance(rows, list):
+        return 0
+    total = 0
+    for row in rows:
+        values = row.values() if isinstance(row, dict) else row
+        for v in values:
+            if v is None:
+                continue
+            if isinstance(v, (str, bytes, bytearray, memoryview)):
+                total += len(v)
+            else:
+                total += 8
+    return total
+
+
+def redact_sql(query: str) -> str:
+    """SQL text for samples: string literals replaced, truncated."""
+    query = _STRING_LITERAL_RE.sub("'?'", query)
+    return query if len(query) <= _MAX_SAMPLE_SQL else query[:_MAX_SAMPLE_SQL] + "..."
+
+
+def redact_params(params: Any) -> Any:
+    """Shape of the params without their values: ``<str:12>``, ``<int>``..."""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {k: redact_params(v) for k, v in list(params.items())[:_MAX_SAMPLE_PARAMS]}
+    if isinstance(params, (list, tuple)):
+        return [redact_params(v) for v in params[:_MAX_SAMPLE_PARAMS]]
+    if isinstance(params, (str, bytes, bytearray)):
+        return f"<{type(params).__name__}:{len(params)}>"
+    return f"<{type(params).__name__}>"
+
+
+class _TemplateStats:
+    __slots__ = (
+        "sql_hash", "operation", "calls", "errors", "rows", "bytes",
+        "total_ms", "max_ms", "buckets", "last_error", "samples", "last_seen",
+    )
+
+    def __init__(self, sql_hash: str, operation: Optional[str]):
+        self.sql_hash = sql_hash
+        self.operation = operation
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.bytes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.last_error: Optional[str] = None
+        self.samples: List[dict] = []
+        self.last_seen = 0.0
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Bucket upper bound containing the q-th percentile (None if open bucket)."""
+        if not self.calls:
+            return None
+        target = q * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else None
+        return None
+
+    def as_dict(self, include_samples: bool) -> dict:
+        data = {
+            "sql_hash": self.sql_hash,
+            "operation": self.operation,
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "histogram": {
+                **{f"le_{b}": c for b, c in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                "inf": self.buckets[-1],
+            },
+            "last_error": self.last_error,
+            "last_seen": self.last_seen,
+        }
+        if include_samples:
+            data["samples"] = list(self.samples)
+        return data
+
+
+class QueryInstrumentation:
+    """Thread-safe registry of per-template query stats."""
+
+    def __init__(
+        self,
+        sample_rate: Optional[float] = None,
+        max_samples: int = 5,
+        slow_ms: Optional[float] = None,
+        max_templates: Optional[int] = None,
+    ):
+        self.sample_rate = (
+            sample_rate if sample_rate is not None
+            else float(os.getenv("DB_SQL_SAMPLE_RATE", "0.01"))
+        )
+        self.slow_ms = slow_ms if slow_ms is not None else float(os.getenv("DB_SLOW_QUERY_MS", "1000"))
+        self.max_samples = max_samples
+        self.max_templates = max_templates or int(os.getenv("DB_STATS_MAX_TEMPLATES", "2000"))
+        self._lock = threading.Lock()
+        # sql_hash -> stats, least recently seen first
+        self._templates: "OrderedDict[str, _TemplateStats]" = OrderedDict()
+        self.evicted = 0
+
+    def record(
+        self,
+        query: str,
+        params: Any = None,
+        operation_name: Optional[str] = None,
+        elapsed_ms: float = 0.0,
+        rows: int = 0,
+        nbytes: int = 0,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        sql_hash = template_hash(query)
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)
+        slow = elapsed_ms >= self.slow_ms
+
+        with self._lock:
+            stats = self._templates.get(sql_hash)
+            if stats is None:
+                stats = self._templates[sql_hash] = _TemplateStats(sql_hash, operation_name)
+                while len(self._templates) > self.max_templates:
+                    self._templates.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self._templates.move_to_end(sql_hash)
+                if operation_name:
+                    stats.operation = operation_name
+            stats.calls += 1
+            stats.rows += rows
+            stats.bytes += nbytes
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.buckets[bucket] += 1
+            stats.last_seen = time.time()
+            if error is not None:
+                stats.errors += 1
+                stats.last_error = f"{type(error).__name__}: {error}"
+
+            # Always keep the first call, errors and slow calls; sample the rest.
+            keep = stats.calls == 1 or error is not None or slow or random.random() < self.sample_rate
+            if keep:
+                if len(stats.samples) >= self.max_samples:
+                    stats.samples.pop(0)
+                stats.samples.append({
+                    "operation": operation_name,
+                    "sql": redact_sql(query),
+                    "params": redact_params(params),
+                    "elapsed_ms": round(elapsed_ms, 2),
+                    "rows": rows,
+                    "error": stats.last_error if error is not None else None,
+                    "at": stats.last_seen,
+                })
+
+        key = operation_name or sql_hash
+        if slow:
+            logger.warning(f" Slow query [{key}]: {elapsed_ms:.1f}ms, {rows} filas")
+        elif error is not None:
+            logger.warning(f" Query error [{key}]: {error}")
+
+    def snapshot(self, sort_by: str = "total_ms", limit: int = 50, include_samples: bool = False) -> List[dict]:
+        with self._lock:
+            items = [s.as_dict(include_samples) for s in self._templates.values()]
+        if items and sort_by in items[0]:
+            items.sort(key=lambda d: d[sort_by] or 0, reverse=True)
+        return items[:limit]
+
+    def get(self, sql_hash: str) -> Optional[dict]:
+        with self._lock:
+            stats = self._templates.get(sql_hash)
+            return stats.as_dict(include_samples=True) if stats else None
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {"tracked": len(self._templates), "max_templates": self.max_templates, "evicted": self.evicted}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self.evicted = 0
+
+
+query_stats = QueryInstrumentation()
@@ -0,0 +1,90 @@
+"""Reader-endpoint health shared by the sync and async gateways.
+
+Read-only statements go to the Aurora reader endpoint while it is healthy
+and within the replication lag budget; otherwise they fall back to the
+writer. A failing reader is skipped for ``DB_READER_RETRY_SECONDS``.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Lag in seconds; an idle primary makes the replay timestamp look stale, so a
+# fully replayed WAL counts as zero lag.
+READER_LAG_SQL = os.getenv("DB_READER_LAG_SQL") or """
+SELECT CASE
+  WHEN NOT pg_is_in_recovery() THEN 0
+  WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+  ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END AS lag_seconds
+"""
+
+
+class ReaderHealth:
+    """Thread-safe reader availability / lag state with routing counters."""
+
+    def __init__(self):
+        self.host: Optional[str] = None
+        self.max_lag_seconds = float(os.getenv("DB_READER_MAX_LAG_SECONDS", "30"))
+        self.lag_check_seconds = float(os.getenv("DB_READER_LAG_CHECK_SECONDS", "10"))
+        self.retry_seconds = float(os.getenv("DB_READER_RETRY_SECONDS", "30"))
+        self._lock = threading.Lock()
+        self._down_until = 0.0
+        self._last_lag_check = 0.0
+        self._lag: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._stats = {"reader_reads": 0, "writer_reads": 0, "fallbacks": 0, "lag_checks": 0}
+
+    def is_down(self) -> bool:
+        with self._lock:
+            return time.monotonic() < self._down_until
+
+    def usable(self) -> bool:
+        with self._lock:
+            if time.monotonic() < self._down_until:
+                return False
+            return self._lag is None or self._lag <= self.max_lag_seconds
+
+    def lag_check_due(self) -> bool:
+        with self._lock:
+            if time.monotonic() - self._last_lag_check < self.lag_check_seconds:
+                return False
+            # Claim the probe so concurrent callers do not all run it.
+            self._last_lag_check = time.monotonic()
+            self._stats["lag_checks"] += 1
+            return True
+
+    def record_lag(self, seconds: Optional[float]) -> None:
+        with self._lock:
+            self._lag = float(seconds or 0.0)
+        if self._lag > self.max_lag_seconds:
+            logger.warning(f" Reader lag {self._lag:.1f}s > {self.max_lag_seconds:.0f}s; reads go to writer")
+
+    def mark_down(self, error: BaseException) -> None:
+        with self._lock:
+            self._down_until = time.monotonic() + self.retry_seconds
+            self._last_error = f"{type(error).__name__}: {error}"
+            self._stats["fallbacks"] += 1
+        logger.warning(f" Reader unavailable, falling back to writer for {self.retry_seconds:.0f}s: {error}")
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "host": self.host,
+                "down": time.monotonic() < self._down_until,
+                "lag_seconds": self._lag,
+                "max_lag_seconds": self.max_lag_seconds,
+                "last_error": self._last_error,
+            }
+
+
+reader_health = ReaderHealth()
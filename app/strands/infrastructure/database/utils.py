@@ -175,10 +175,12 @@ def detect_id_kind(value: str, prices_tbl: str, pres_tbl: str) -> Tuple[str, Opt
     """
     if not value:
         return "none", None
-    has_hash = bool(db.execute_query(
-        f"SELECT 1 FROM {prices_tbl} WHERE hash_unique = %s LIMIT 1", (value,)))
-    has_uid = bool(db.execute_query(
-        f"SELECT 1 FROM {pres_tbl}    WHERE uid         = %s LIMIT 1", (value,)))
+    hash_rows, uid_rows = db.execute_batch([
+        (f"SELECT 1 FROM {prices_tbl} WHERE hash_unique = %s LIMIT 1", (value,)),
+        (f"SELECT 1 FROM {pres_tbl}    WHERE uid         = %s LIMIT 1", (value,)),
+    ], "detect_id_kind")
+    has_hash = bool(hash_rows)
+    has_uid = bool(uid_rows)
     if has_hash and has_uid:
         return "both", value
     if has_hash:
@@ -203,8 +205,8 @@ def get_hashes_by_uid(uid: str, pres_tbl: str, *, iso: Optional[str] = None, pla
         params.append(platform_name.lower())
     sql = f"SELECT DISTINCT p.hash_unique FROM {pres_tbl} p WHERE " + " AND ".join(
         where)
-    rows = db.execute_query(sql, tuple(params)) or []
-    return [r["hash_unique"] for r in rows if r.get("hash_unique")]
+    rows = db.execute_query(sql, tuple(params), row_format="tuple") or []
+    return [r[0] for r in rows if r[0]]
 
 
 
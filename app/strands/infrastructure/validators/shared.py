@@ -57,16 +57,19 @@ def get_validation(field_name: str) -> List[Dict]:
 
 
 def clear_validation_cache(field_name: Optional[str] = None) -> None:
-    global _VALIDATION_CACHE, _GENRE_ALIAS_MAP
+    global _VALIDATION_CACHE, _GENRE_ALIAS_MAP, _ALLOWED_ISO_CODES
     
     if field_name:
         _VALIDATION_CACHE.pop(field_name, None)
         if field_name == "primary_genre":
             _GENRE_ALIAS_MAP = None
+        if field_name == "platform_name_iso":
+            _ALLOWED_ISO_CODES = None
         logger.info(f"Cleared cache for: {field_name}")
     else:
         _VALIDATION_CACHE.clear()
         _GENRE_ALIAS_MAP = None
+        _ALLOWED_ISO_CODES = None
         logger.info("Cleared all validation cache")
 
 
@@ -85,7 +88,15 @@ def _initialize_allowed_iso_codes() -> Set[str]:
     return allowed_codes
 
 
-ALLOWED_ISO_CODES: Set[str] = _initialize_allowed_iso_codes()
+_ALLOWED_ISO_CODES: Optional[Set[str]] = None
+
+
+def get_allowed_iso_codes() -> Set[str]:
+    # Loaded on first use (or by the startup warm-up), not at import.
+    global _ALLOWED_ISO_CODES
+    if _ALLOWED_ISO_CODES is None:
+        _ALLOWED_ISO_CODES = _initialize_allowed_iso_codes()
+    return _ALLOWED_ISO_CODES
 
 MOVIE_TYPES = {"movie", "movies", "film", "films", "película", "pelicula"}
 SERIES_TYPES = {"series", "tv", "show", "shows", "serie", "television", "tv show"}
@@ -228,7 +239,7 @@ def resolve_region_isos(region: Optional[str]) -> List[str]:
     valid_isos = []
     for iso_code in iso_list:
         normalized = normalize_iso(iso_code)
-        if normalized in ALLOWED_ISO_CODES:
+        if normalized in get_allowed_iso_codes():
             valid_isos.append(normalized)
     
     return valid_isos
@@ -404,7 +415,52 @@ def validate_country_list(countries: List[str]) -> List[str]:
     return result
 
 
-
+# Argument normalizers for cache keys (cached_query). Exact only: "USA" /
+# "us" / "Estados Unidos" share one entry, but nothing fuzzy ("EU" must not
+# become "RE", "all" must not become "WF"); anything not recognised exactly
+# keys on its casefolded text, at worst a cache miss.
+def _cache_key_text(value: Any) -> Any:
+    return " ".join(value.casefold().split()) if isinstance(value, str) else value
+
+
+def country_cache_key(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    # Regions first, like get_region_iso_list ("ca" is Central America there).
+    region = REGION_ALIASES.get(text.lower(), text.lower())
+    if region in REGION_TO_ISO2:
+        return region
+    upper = region.upper() if len(region) == 2 else text.upper()
+    if upper in _COUNTRY_ALIASES:
+        return _COUNTRY_ALIASES[upper]
+    if len(upper) == 2 and upper.isalpha():
+        return upper
+    try:
+        # lookup() matches codes and names exactly (case-insensitive); no search_fuzzy.
+        return pycountry.countries.lookup(text).alpha_2
+    except LookupError:
+        return _cache_key_text(text)
+
+
+def genre_cache_key(value: Any) -> Any:
+    if isinstance(value, str):
+        canonical = _build_genre_alias_map().get(value)
+        if canonical:
+            return canonical
+    return _cache_key_text(value)
+
+
+TOOL_ARG_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {
+    "country": country_cache_key,
+    "iso": country_cache_key,
+    "iso_alpha2": country_cache_key,
+    "platform": _cache_key_text,
+    "platform_name": _cache_key_text,
+    "genre": genre_cache_key,
+    "content_type": resolve_content_type,
+    "type": resolve_content_type,
+}
 
 
 def normalize_langgraph_params(*args, **kwargs) -> dict:
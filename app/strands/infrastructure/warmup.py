@@ -0,0 +1,105 @@
+"""Background warm-up of DB pools, validation data, graphs and persisted caches.
+
+Nothing here runs at import: the FastAPI lifespan starts ``warm_up()`` as a
+task so the server binds its port immediately, and ``readiness()`` reports
+progress to ``/healthz``. Anything that fails here is retried lazily on
+first use.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from app.strands.infrastructure.database.async_connection import async_db
+from app.strands.infrastructure.database.connection import db
+
+logger = logging.getLogger(__name__)
+
+_state: Dict[str, Any] = {
+    "status": "cold",  # cold | warming | ready | degraded
+    "started_at": None,
+    "finished_at": None,
+    "steps": {},
+}
+
+
+# Bundled under src/data; rebuilt from the image on every boot.
+_VALIDATION_FIELDS = ("platform_name_iso", "platform_name", "primary_genre", "currency")
+
+
+def _load_validation_data() -> None:
+    from app.strands.infrastructure.validators.shared import get_allowed_iso_codes, get_validation
+    for field_name in _VALIDATION_FIELDS:
+        get_validation(field_name)
+    get_allowed_iso_codes()
+
+
+def _compile_graphs() -> None:
+    import importlib
+    from app.strands.main_router.graph import create_advanced_graph
+    for domain in ("business", "talent", "content", "platform", "common"):
+        importlib.import_module(f"app.strands.{domain}.graph_core.graph").create_streaming_graph()
+    create_advanced_graph()
+
+
+def _restore_caches() -> None:
+    """Reload entries persisted by the previous process (CACHE_SQLITE_PATH)."""
+    from app.strands.infrastructure.cache import query_cache
+    from app.strands.infrastructure.cache.backends import l2_cache
+    from app.strands.infrastructure.cache.llm_cache import llm_response_cache
+    from app.strands.main_router.router_cache import get_router_cache
+
+    if not l2_cache.tiers["disk"].available():
+        return
+    caches = [
+        query_cache.intelligence_cache, query_cache.rankings_cache, query_cache.pricing_cache,
+        query_cache.availability_cache, query_cache.general_cache, query_cache.validation_cache,
+        llm_response_cache, get_router_cache(),
+    ]
+    restored = sum(cache.restore() for cache in caches)
+    logger.info(f" Cache persistente: {restored} entradas restauradas")
+
+
+async def _step(name: str, fn: Callable[[], Awaitable[Any]]) -> bool:
+    start = time.perf_counter()
+    try:
+        await fn()
+    except Exception as e:
+        _state["steps"][name] = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        logger.warning(f" Warm-up step '{name}' failed: {e}")
+        return False
+    _state["steps"][name] = {"ok": True, "ms": round((time.perf_counter() - start) * 1000, 1)}
+    return True
+
+
+async def warm_up() -> None:
+    """Open the pools, load validation data, compile graphs and restore caches concurrently."""
+    _state["status"] = "warming"
+    _state["started_at"] = time.time()
+    results = await asyncio.gather(
+        _step("db_pool", lambda: asyncio.to_thread(db.get)),
+        _step("async_db_pool", async_db.get_pool),
+        _step("validation_data", lambda: asyncio.to_thread(_load_validation_data)),
+        _step("cache_restore", lambda: asyncio.to_thread(_restore_caches)),
+        _step("graphs", lambda: asyncio.to_thread(_compile_graphs)),
+    )
+    _state["finished_at"] = time.time()
+    _state["status"] = "ready" if all(results) else "degraded"
+    logger.info(
+        f" Warm-up {_state['status']} en {_state['finished_at'] - _state['started_at']:.2f}s"
+    )
+
+
+def start_warm_up() -> "asyncio.Task":
+    return asyncio.create_task(warm_up(), name="strands-warm-up")
+
+
+def readiness() -> Dict[str, Any]:
+    return {
+        "status": _state["status"],
+        "db_initialized": db.initialized,
+        "steps": dict(_state["steps"]),
+        "started_at": _state["started_at"],
+        "finished_at": _state["finished_at"],
+    }
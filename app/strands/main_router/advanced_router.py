@@ -1,10 +1,11 @@
 import json
-from strands import Agent
 from app.strands.config.llm_models import MODEL_CLASSIFIER
+from app.strands.infrastructure.cache.llm_cache import invoke_llm_cached
 from .state import MainRouterState
-from .prompts import ADVANCED_ROUTER_PROMPT
+from .prompts import ADVANCED_ROUTER_PROMPT, ROUTER_AND_ENTITIES_PROMPT
 from .config import (
     CONFIDENCE_THRESHOLD,
+    ROUTER_EXTRACTS_ENTITIES,
     MAX_PARALLEL_CANDIDATES,
     MIN_CANDIDATE_SCORE,
     GRAPHS_REQUIRING_VALIDATION,
@@ -17,21 +18,7 @@ from .config import (
 from .telemetry import log_router_decision, log_candidate_discard, log_rerouting
 from .router_cache import get_router_cache
 
-
-def _extract_response(response) -> str:
-    if hasattr(response, 'message'):
-        message = response.message
-        if isinstance(message, dict) and 'content' in message:
-            return message['content'][0]['text']
-        return str(message)
-    
-    if isinstance(response, dict):
-        if 'content' in response and isinstance(response['content'], list):
-            return response['content'][0].get('text', '')
-        if 'message' in response:
-            return response['message']
-    
-    return str(response)
+ENTITY_TYPES = ("title", "actor", "director")
 
 
 def _parse_json_response(result_str: str) -> dict:
@@ -45,6 +32,22 @@ def _parse_json_response(result_str: str) -> dict:
     return json.loads(result_str)
 
 
+def _parse_entities(raw) -> list:
+    """[{"name", "type"}] válidas; None si el LLM no las devolvió bien (validation re-extrae)."""
+    if not isinstance(raw, list):
+        return None
+    entities = []
+    for item in raw:
+        if not isinstance(item, dict):
+            return None
+        name = str(item.get("name") or "").strip()
+        entity_type = str(item.get("type") or "").strip().lower()
+        if not name or entity_type not in ENTITY_TYPES:
+            return None
+        entities.append({"name": name, "type": entity_type})
+    return entities
+
+
 def _filter_candidates(candidates_raw: list, visited: list) -> list:
     candidates = [
         (cand["category"].lower(), float(cand.get("confidence", 0.0)))
@@ -190,26 +193,34 @@ async def advanced_router_node(state: MainRouterState) -> MainRouterState:
         if current_hop >= max_hops:
             return _handle_max_hops_reached(state, max_hops)
     
+    # Primer hop: la misma llamada extrae las entidades para validation_preprocessor.
+    extract_entities = ROUTER_EXTRACTS_ENTITIES and not visited and not state.get("needs_rerouting", False)
+    entities = state.get("extracted_entities")
+    
     cache = get_router_cache()
-    cached_decision = cache.get(state['question'], visited)
+    cached_decision = await cache.aget(state['question'], visited)
     
     if cached_decision:
         primary = cached_decision["selected_graph"]
         confidence = cached_decision["confidence"]
         candidates = cached_decision["candidates"]
+        if extract_entities:
+            entities = cached_decision.get("entities")
     else:
         question_context = _create_context_aware_question(
             state['question'], visited, state.get("needs_rerouting", False)
         )
         
-        agent = Agent(model=MODEL_CLASSIFIER, system_prompt=ADVANCED_ROUTER_PROMPT)
-        response = await agent.invoke_async(question_context)
-        result_str = _extract_response(response)
+        prompt = ROUTER_AND_ENTITIES_PROMPT if extract_entities else ADVANCED_ROUTER_PROMPT
+        result_str = await invoke_llm_cached(MODEL_CLASSIFIER, prompt, question_context)
         
         result = _parse_json_response(result_str)
         primary = result.get("primary", "COMMON").upper()
         confidence = float(result.get("confidence", 0.5))
         candidates = _filter_candidates(result.get("candidates", []), visited)
+        if extract_entities:
+            entities = _parse_entities(result.get("entities"))
+            print(f"[ROUTER] Entidades extraídas: {entities}")
     
     selected_graph, alt_conf = _find_alternative(primary.lower(), candidates, visited)
     
@@ -248,7 +259,10 @@ async def advanced_router_node(state: MainRouterState) -> MainRouterState:
         )
     
     if not cached_decision:
-        cache.set(state['question'], visited, selected_graph, confidence, candidates)
+        await cache.aset(
+            state['question'], visited, selected_graph, confidence, candidates,
+            entities if extract_entities else None
+        )
     
     return {
         **state,
@@ -258,6 +272,7 @@ async def advanced_router_node(state: MainRouterState) -> MainRouterState:
         "routing_candidates": candidates,
         "visited_graphs": new_visited,
         "skip_validation": skip_validation,
+        "extracted_entities": entities,
         "needs_rerouting": False,
         "parallel_execution": use_parallel,
         "parallel_k": parallel_k
@@ -1,5 +1,12 @@
+import os
+
 CONFIDENCE_THRESHOLD = 0.75
 MAX_PARALLEL_CANDIDATES = 3
+# Cada rama paralela se corta a los N segundos (status "timeout").
+PARALLEL_BRANCH_TIMEOUT_SECONDS = float(os.getenv("PARALLEL_BRANCH_TIMEOUT_SECONDS", "60"))
+# Early exit: si una rama alcanza este score (_calculate_result_score) se
+# cancelan las demás. 0 = desactivado, se esperan todas.
+PARALLEL_EARLY_EXIT_SCORE = float(os.getenv("PARALLEL_EARLY_EXIT_SCORE", "0"))
 MIN_CANDIDATE_SCORE = 0.50
 SCORE_GAP = 0.10
 
@@ -16,6 +23,10 @@ MIN_CONFIDENCE_NO_CLARIFICATION = 0.50
 
 GRAPHS_REQUIRING_VALIDATION = ["talent", "content", "business", "platform"]
 
+# El primer hop del router también extrae las entidades a validar (una sola
+# llamada al LLM); validation_preprocessor las usa en vez de re-clasificar.
+ROUTER_EXTRACTS_ENTITIES = os.getenv("ROUTER_EXTRACTS_ENTITIES", "1").strip().lower() not in ("0", "false", "no", "off")
+
 
 def should_use_parallel_execution(confidence: float, num_candidates: int) -> bool:
     return confidence < CONFIDENCE_THRESHOLD and num_candidates >= 2
@@ -20,6 +20,7 @@ from .routing_gates import (
     route_from_aggregator
 )
 from .telemetry import TelemetryLogger, print_telemetry_summary
+from app.strands.core.graph_registry import compiled_graph
 
 from app.strands.business.graph_core.graph import process_question as business_process_question
 from app.strands.talent.graph_core.graph import process_question as talent_process_question
@@ -275,12 +276,16 @@ def _add_edges(graph: StateGraph):
     graph.add_edge("error_handler", "responder_formatter")
 
 
-def create_advanced_graph(use_checkpointer: bool = True):
+def _build_advanced_graph() -> StateGraph:
     graph = StateGraph(MainRouterState)
     _add_nodes(graph)
     _add_edges(graph)
-    
-    return graph.compile(checkpointer=checkpointer if use_checkpointer else None)
+    return graph
+
+
+def create_advanced_graph(use_checkpointer: bool = True):
+    # Compilado una vez por proceso; el checkpointer se inyecta por llamada.
+    return compiled_graph("main_router", _build_advanced_graph, checkpointer if use_checkpointer else None)
 
 
 def _create_initial_state(question: str, max_hops: int) -> MainRouterState:
@@ -300,6 +305,7 @@ def _create_initial_state(question: str, max_hops: int) -> MainRouterState:
         "validation_message": None,
         "validation_status": None,
         "skip_validation": False,
+        "extracted_entities": None,
         "routing_confidence": 0.0,
         "routing_candidates": [],
         "visited_graphs": [],
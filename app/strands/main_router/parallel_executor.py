@@ -1,5 +1,8 @@
+import asyncio
+import time
+
 from .state import MainRouterState
-from .config import MAX_PARALLEL_CANDIDATES
+from .config import MAX_PARALLEL_CANDIDATES, PARALLEL_BRANCH_TIMEOUT_SECONDS, PARALLEL_EARLY_EXIT_SCORE
 from app.strands.business.graph_core.graph import process_question as business_process
 from app.strands.talent.graph_core.graph import process_question as talent_process
 from app.strands.content.graph_core.graph import process_question as content_process
@@ -26,19 +29,60 @@ def _execute_graph_tasks(candidates_to_execute: list, question: str, state: Main
     return tasks
 
 
-async def _await_parallel_results(tasks: list) -> list:
-    results = []
-    for graph_name, confidence, task in tasks:
-        result = await task
-        results.append({
-            "graph": graph_name,
-            "confidence": confidence,
-            "result": result,
-            "status": "success"
-        })
-        print(f"[PARALLEL] {graph_name} completado")
-    
-    return results
+async def _run_branch(graph_name: str, confidence: float, task) -> dict:
+    """Una rama aislada: timeouts y excepciones quedan en ``status``."""
+    start = time.perf_counter()
+    branch = {"graph": graph_name, "confidence": confidence, "result": {}}
+    try:
+        branch["result"] = await asyncio.wait_for(task, timeout=PARALLEL_BRANCH_TIMEOUT_SECONDS)
+        branch["status"] = "success"
+    except asyncio.TimeoutError:
+        branch["status"] = "timeout"
+        branch["error"] = f"Timeout tras {PARALLEL_BRANCH_TIMEOUT_SECONDS:.0f}s"
+    except Exception as e:
+        branch["status"] = "error"
+        branch["error"] = f"{type(e).__name__}: {e}"
+    branch["elapsed"] = round(time.perf_counter() - start, 2)
+    print(f"[PARALLEL] {graph_name} {branch['status']} en {branch['elapsed']:.2f}s")
+    return branch
+
+
+def _is_good_enough(branch: dict, early_exit_score: float) -> bool:
+    return branch["status"] == "success" and _calculate_result_score(branch) >= early_exit_score
+
+
+async def _await_parallel_results(tasks: list, early_exit_score: float = PARALLEL_EARLY_EXIT_SCORE) -> list:
+    """Ejecuta las ramas a la vez: cuesta max(latencia), no la suma.
+
+    Con ``early_exit_score`` > 0, la primera rama que lo alcanza cancela al resto.
+    """
+    if early_exit_score <= 0:
+        return list(await asyncio.gather(*(_run_branch(*task) for task in tasks)))
+
+    pending = {
+        asyncio.ensure_future(_run_branch(graph_name, confidence, task)): (index, graph_name, confidence)
+        for index, (graph_name, confidence, task) in enumerate(tasks)
+    }
+    finished = {}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                finished[pending.pop(future)[0]] = future.result()
+            winner = next((b for b in finished.values() if _is_good_enough(b, early_exit_score)), None)
+            if winner and pending:
+                print(f"[PARALLEL] Early exit: {winner['graph']} supera score {early_exit_score:.2f}")
+                break
+    finally:
+        # Early exit o cancelación del nodo: no dejar ramas huérfanas.
+        for future in pending:
+            future.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    for future, (index, graph_name, confidence) in pending.items():
+        finished[index] = {"graph": graph_name, "confidence": confidence, "result": {}, "status": "cancelled"}
+    return [finished[index] for index in sorted(finished)]
 
 
 async def parallel_executor_node(state: MainRouterState) -> MainRouterState:
@@ -108,6 +152,9 @@ async def aggregator_node(state: MainRouterState) -> MainRouterState:
         return state
     
     successful_results = [r for r in parallel_results if r.get("status") == "success"]
+    for r in parallel_results:
+        if r.get("status") != "success":
+            print(f"[AGGREGATOR] {r.get('graph')}: {r.get('status')} {r.get('error', '')}".rstrip())
     
     if not successful_results:
         print("[AGGREGATOR]  Ningún grafo completó exitosamente")
@@ -23,6 +23,45 @@ KEY DISTINCTIONS:
 - "action movies 2023" -> CONTENT"""
 
 
+# Primer hop: routing + extracción de entidades en una sola llamada.
+ROUTER_AND_ENTITIES_PROMPT = """RETURN ONLY JSON. NO TEXT.
+
+FORMAT:
+{"primary":"CATEGORY","confidence":0.00,"candidates":[{"category":"CATEGORY","confidence":0.00}],"entities":[{"name":"NAME","type":"TYPE"}]}
+
+RULES:
+- primary first in candidates
+- confidence: 0.0-1.0
+- confidence >= 0.8: only primary
+- confidence < 0.8: 2-3 candidates
+
+CATEGORIES:
+BUSINESS = exclusivity | catalog comparison | regional differences | pricing | rankings | market data
+TALENT = actor/director filmography | collaborations | cast/crew
+CONTENT = title search | metadata | genre/year/rating filters
+PLATFORM = "where to watch X" | availability | catalog listing
+COMMON = validation | SQL | system queries
+
+KEY DISTINCTIONS:
+- "exclusive on Netflix" -> BUSINESS
+- "where to watch Inception" -> PLATFORM
+- "Tom Hanks movies" -> TALENT
+- "action movies 2023" -> CONTENT
+
+ENTITIES:
+- Specific movie/series/show titles and people named in the question
+- type: "title" | "actor" | "director"
+- name EXACTLY as written: DO NOT expand ("Coppola" stays "Coppola", "Hanks" stays "Hanks")
+- Platforms, countries, genres, years are NOT entities
+- General query with NO specific entity -> "entities":[]
+
+EXAMPLES:
+"Tom Hanks filmography" -> "entities":[{"name":"Tom Hanks","type":"actor"}]
+"movies directed by Coppola" -> "entities":[{"name":"Coppola","type":"director"}]
+"donde puedo ver Inception" -> "entities":[{"name":"Inception","type":"title"}]
+"Spielberg and Cruise films" -> "entities":[{"name":"Spielberg","type":"director"},{"name":"Cruise","type":"actor"}]
+"best action movies" -> "entities":[]"""
+
 VALIDATION_PREPROCESSOR_PROMPT = """You are a validation assistant that identifies entities in user questions and validates them.
 
 INSTRUCTIONS:
@@ -1,82 +1,211 @@
+import asyncio
 import hashlib
+import os
+import re
+import threading
 import time
-from typing import Dict, Tuple, List, Optional
+import unicodedata as ud
+from collections import OrderedDict
+from typing import Tuple, List, Optional
+
+from rapidfuzz import fuzz, process
+
+from app.strands.infrastructure.cache.backends import TieredBackend, l2_cache
+from app.strands.infrastructure.database.utils import normalize
+
+# Palabras sin peso para el routing (ES/EN). No incluir negaciones ni
+# comparativos ("no", "sin", "vs", "not"): cambian el significado.
+_STOPWORDS = frozenset({
+    "el", "la", "los", "las", "un", "una", "unos", "unas", "de", "del", "al", "a",
+    "en", "y", "o", "que", "por", "para", "con", "me", "mi", "se", "lo", "le",
+    "es", "son", "hay", "cual", "cuales", "dame", "muestrame", "quiero", "puedes",
+    "podrias", "favor", "porfavor", "hola",
+    "the", "a", "an", "of", "in", "on", "at", "to", "for", "and", "or", "is", "are",
+    "me", "my", "please", "show", "give", "can", "you", "could", "what", "which", "hi",
+})
+_WORD_RE = re.compile(r"\w+")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def canonical_question(question: str) -> str:
+    """Casefold, strip accents/punctuation and stopwords; keeps token order."""
+    text = ud.normalize("NFKD", (question or "").casefold())
+    text = "".join(ch for ch in text if not ud.combining(ch))
+    tokens = [normalize(t) for t in _WORD_RE.findall(text)]
+    return " ".join(t for t in tokens if t and t not in _STOPWORDS)
 
 
 class RouterCache:
-    
-    def __init__(self, ttl_seconds: int = 300, max_size: int = 1000):
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_size: int = 1000,
+        l2: Optional[TieredBackend] = None,
+        fuzzy_threshold: Optional[float] = None,
+        fuzzy_window: Optional[int] = None,
+    ):
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
-        self._cache: Dict[str, Tuple[dict, float]] = {}
-        self._access_times: Dict[str, float] = {}
-    
-    def _generate_key(self, question: str, visited_graphs: List[str]) -> str:
-        normalized_question = question.lower().strip()
+        # Decisiones compartidas entre instancias / reinicios (namespace "router").
+        self.l2 = l2
+        # Near-duplicates: fuzz.ratio >= threshold sobre las últimas N preguntas
+        # canónicas con el mismo historial de grafos (0 = desactivado).
+        self.fuzzy_threshold = (
+            fuzzy_threshold if fuzzy_threshold is not None
+            else float(os.getenv("ROUTER_CACHE_FUZZY_THRESHOLD", "92"))
+        )
+        self.fuzzy_window = fuzzy_window or int(os.getenv("ROUTER_CACHE_FUZZY_WINDOW", "256"))
+        # key -> (canonical, visited_str, data, timestamp), en orden LRU
+        self._cache: "OrderedDict[str, Tuple[str, str, dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "fuzzy_hits": 0, "l2_hits": 0, "misses": 0}
+
+    def _parts(self, question: str, visited_graphs: List[str]) -> Tuple[str, str, str]:
+        canonical = canonical_question(question)
         visited_str = ",".join(sorted(visited_graphs))
-        key_str = f"{normalized_question}|{visited_str}"
-        return hashlib.md5(key_str.encode()).hexdigest()
-    
+        key = hashlib.md5(f"{canonical}|{visited_str}".encode()).hexdigest()
+        return key, canonical, visited_str
+
+    def _generate_key(self, question: str, visited_graphs: List[str]) -> str:
+        return self._parts(question, visited_graphs)[0]
+
     def _is_expired(self, timestamp: float) -> bool:
         return time.time() - timestamp > self.ttl_seconds
-    
-    def _evict_oldest(self):
-        oldest_key = min(self._access_times.items(), key=lambda x: x[1])[0]
-        del self._cache[oldest_key]
-        del self._access_times[oldest_key]
-    
-    def get(self, question: str, visited_graphs: List[str]) -> Optional[dict]:
-        key = self._generate_key(question, visited_graphs)
-        
-        if key not in self._cache:
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
-        
-        cached_data, timestamp = self._cache[key]
-        
-        if self._is_expired(timestamp):
+        if self._is_expired(entry[3]):
             del self._cache[key]
-            if key in self._access_times:
-                del self._access_times[key]
             return None
-        
-        self._access_times[key] = time.time()
-        
-        print(f"[ROUTER CACHE] HIT - Using cached decision for similar query")
+        self._cache.move_to_end(key)
+        return entry[2]
+
+    def _fuzzy_lookup(self, canonical: str, visited_str: str) -> Optional[dict]:
+        if self.fuzzy_threshold <= 0 or not canonical:
+            return None
+        digits = _DIGITS_RE.findall(canonical)
+        choices = {}
+        for key in reversed(self._cache):
+            if len(choices) >= self.fuzzy_window:
+                break
+            cand_canonical, cand_visited, _, timestamp = self._cache[key]
+            # Mismo historial y mismos números ("top 10" != "top 100");
+            # las entradas restauradas (sin canónica) solo valen por key.
+            if not cand_canonical or cand_visited != visited_str or self._is_expired(timestamp):
+                continue
+            if _DIGITS_RE.findall(cand_canonical) != digits:
+                continue
+            choices[key] = cand_canonical
+        if not choices:
+            return None
+        match = process.extractOne(canonical, choices, scorer=fuzz.ratio, score_cutoff=self.fuzzy_threshold)
+        if match is None:
+            return None
+        _, score, key = match
+        print(f"[ROUTER CACHE] FUZZY HIT ({score:.0f}) - '{canonical}' ~ '{choices[key]}'")
+        cached_data = self._lookup(key)
+        # Las entidades son de la otra pregunta: validation_preprocessor las re-extrae.
+        return {k: v for k, v in cached_data.items() if k != "entities"} if cached_data else cached_data
+
+    def get(self, question: str, visited_graphs: List[str]) -> Optional[dict]:
+        key, canonical, visited_str = self._parts(question, visited_graphs)
+
+        with self._lock:
+            cached_data = self._lookup(key)
+            if cached_data is not None:
+                self._stats["hits"] += 1
+                print(f"[ROUTER CACHE] HIT - Using cached decision for similar query")
+                return cached_data
+
+            cached_data = self._fuzzy_lookup(canonical, visited_str)
+            if cached_data is not None:
+                self._stats["hits"] += 1
+                self._stats["fuzzy_hits"] += 1
+                return cached_data
+
+            self._stats["misses"] += 1
+        return None
+
+    async def aget(self, question: str, visited_graphs: List[str]) -> Optional[dict]:
+        """get() con fallback a L2 (Redis) fuera del event loop."""
+        cached_data = self.get(question, visited_graphs)
+        if cached_data is not None or self.l2 is None or not self.l2.available():
+            return cached_data
+
+        key, canonical, visited_str = self._parts(question, visited_graphs)
+        found, cached_data, _ = await asyncio.to_thread(self.l2.get, "router", key)
+        if not found:
+            return None
+        self._store(key, canonical, visited_str, cached_data)
+        with self._lock:
+            self._stats["l2_hits"] += 1
+        print(f"[ROUTER CACHE] L2 HIT - Using shared decision")
         return cached_data
-    
-    def set(self, question: str, visited_graphs: List[str], 
-            selected_graph: str, confidence: float, candidates: list):
-        key = self._generate_key(question, visited_graphs)
-        current_time = time.time()
-        
-        if len(self._cache) >= self.max_size:
-            self._evict_oldest()
-        
+
+    def _store(self, key: str, canonical: str, visited_str: str, cached_data: dict,
+               timestamp: Optional[float] = None) -> None:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            self._cache[key] = (canonical, visited_str, cached_data, timestamp or time.time())
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def set(self, question: str, visited_graphs: List[str],
+            selected_graph: str, confidence: float, candidates: list,
+            entities: Optional[list] = None):
+        key, canonical, visited_str = self._parts(question, visited_graphs)
+
         cached_data = {
             "selected_graph": selected_graph,
             "confidence": confidence,
             "candidates": candidates
         }
-        
-        self._cache[key] = (cached_data, current_time)
-        self._access_times[key] = current_time
-        
+        if entities is not None:
+            cached_data["entities"] = entities
+        self._store(key, canonical, visited_str, cached_data)
+
         print(f"[ROUTER CACHE] SET - Cached decision for future queries")
-    
+        return key, cached_data
+
+    async def aset(self, question: str, visited_graphs: List[str],
+                   selected_graph: str, confidence: float, candidates: list,
+                   entities: Optional[list] = None):
+        key, cached_data = self.set(question, visited_graphs, selected_graph, confidence, candidates, entities)
+        if self.l2 is not None and self.l2.available():
+            await asyncio.to_thread(self.l2.set, "router", key, cached_data, self.ttl_seconds)
+
+    def restore(self) -> int:
+        """Carga en L1 las decisiones persistidas (solo match exacto: sin pregunta canónica)."""
+        if self.l2 is None or not self.l2.available():
+            return 0
+        entries = self.l2.load("router", self.max_size)
+        now = time.time()
+        for key, cached_data, remaining in reversed(entries):
+            self._store(key, "", "", cached_data, timestamp=now - (self.ttl_seconds - remaining))
+        return len(entries)
+
     def clear(self):
-        self._cache.clear()
-        self._access_times.clear()
-    
+        with self._lock:
+            self._cache.clear()
+
     def get_stats(self) -> dict:
-        return {
-            "size": len(self._cache),
-            "max_size": self.max_size,
-            "ttl_seconds": self.ttl_seconds
-        }
+        with self._lock:
+            return {
+                **self._stats,
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "fuzzy_threshold": self.fuzzy_threshold,
+                "l2": self.l2.stats() if self.l2 is not None else None
+            }
 
 
-_router_cache = RouterCache(ttl_seconds=300, max_size=1000)
+_router_cache = RouterCache(ttl_seconds=300, max_size=1000, l2=l2_cache)
 
 
 def get_router_cache() -> RouterCache:
-    return _router_cache
\ No newline at end of file
+    return _router_cache
@@ -16,6 +16,8 @@ class MainRouterState(TypedDict, total=False):
     validation_message: Optional[str]
     validation_status: Optional[Literal["resolved", "ambiguous", "not_found", "error"]]
     skip_validation: bool
+    # [{"name", "type": title|actor|director}] del router; None = no extraídas.
+    extracted_entities: Optional[List[Dict[str, str]]]
     routing_confidence: float
     routing_candidates: List[Dict[str, Any]]
     visited_graphs: List[str]
@@ -1,6 +1,6 @@
 import asyncio
-from strands import Agent
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
+from app.strands.infrastructure.cache.llm_cache import invoke_llm_cached
 from .state import MainRouterState
 from app.strands.common.common_modules.validation import validate_title, validate_actor, validate_director
 from app.strands.core.factories.router_factory import create_router
@@ -23,38 +23,15 @@ VALIDATION_TOOLS_MAP = {
 VALIDATION_TOOLS = list(VALIDATION_TOOLS_MAP.keys()) + ["NO_ENTITY"]
 
 
-def _extract_text_from_result(result) -> str:
-    if isinstance(result, dict):
-        if 'content' in result and isinstance(result['content'], list):
-            for content_item in result['content']:
-                if isinstance(content_item, dict) and 'text' in content_item:
-                    return content_item['text'].strip()
-        if 'message' in result:
-            return str(result['message']).strip()
-    
-    if hasattr(result, 'content'):
-        content = result.content
-        if isinstance(content, list) and len(content) > 0:
-            first_content = content[0]
-            if isinstance(first_content, dict) and 'text' in first_content:
-                return first_content['text'].strip()
-    
-    if hasattr(result, 'message'):
-        message = result.message
-        if isinstance(message, dict):
-            if 'content' in message and isinstance(message['content'], list):
-                for content_item in message['content']:
-                    if isinstance(content_item, dict) and 'text' in content_item:
-                        return content_item['text'].strip()
-        return str(message).strip()
-    
-    return str(result).strip()
+async def _extract_entity_name(question: str) -> str:
+    return await invoke_llm_cached(MODEL_NODE_EXECUTOR, ENTITY_EXTRACTION_PROMPT, question)
 
 
-async def _extract_entity_name(question: str) -> str:
-    agent = Agent(model=MODEL_NODE_EXECUTOR, system_prompt=ENTITY_EXTRACTION_PROMPT)
-    result = await agent.invoke_async(question)
-    return _extract_text_from_result(result)
+def _from_router_entities(entities: list) -> tuple[str, str]:
+    """(tool_name, entity_names_raw) a partir de entidades del router de un solo tipo, sin LLM."""
+    if not entities:
+        return "NO_ENTITY", "NO_ENTITY"
+    return f"validate_{entities[0]['type']}", " | ".join(entity["name"] for entity in entities)
 
 
 def _process_validation_result(validation_result: dict) -> tuple[str, bool, dict]:
@@ -135,6 +112,24 @@ def _process_multiple_entities(entity_names: list, tool_name: str, tool_fn) -> t
     return "resolved", False, validated_entities
 
 
+def _process_typed_entities(entities: list) -> tuple[str, bool, dict]:
+    """Actor + director del router: cada nombre con su propio tool, ids combinados."""
+    print(f"[VALIDATION] Detectadas {len(entities)} entidades tipadas: {entities}")
+    validated_entities = {"status": "ok"}
+    
+    for entity in entities:
+        tool_name = f"validate_{entity['type']}"
+        print(f"[VALIDATION] Ejecutando {tool_name}('{entity['name']}')...")
+        validation_result = VALIDATION_TOOLS_MAP[tool_name](entity["name"])
+        print(f"[VALIDATION] Resultado: {validation_result}")
+        
+        if validation_result.get("status") == "ok":
+            validated_entities.setdefault(f"{entity['type']}_id", validation_result.get("id"))
+            validated_entities.setdefault(f"{entity['type']}_name", validation_result.get("name"))
+    
+    return "resolved", False, validated_entities
+
+
 def _handle_skip_validation(state: MainRouterState) -> MainRouterState:
     print("[VALIDATION] Validacion no requerida para este grafo, saltando...")
     return {
@@ -208,10 +203,29 @@ def _handle_validation_error(state: MainRouterState, error: Exception) -> MainRo
     }
 
 
+def _handle_validated(state: MainRouterState, validation_status: str, needs_user_input: bool,
+                      validated_entities: dict) -> MainRouterState:
+    if needs_user_input:
+        return _handle_user_input_required(state, validation_status, validated_entities)
+    
+    print(f"[VALIDATION] Completada con status: {validation_status}")
+    print(f"[VALIDATION] Entities: {validated_entities}")
+    print("="*80 + "\n")
+    
+    return {
+        **state,
+        "validation_done": True,
+        "validation_status": validation_status,
+        "needs_validation": True,
+        "validated_entities": validated_entities
+    }
+
+
 _validation_router = create_router(
     prompt=VALIDATION_ROUTER_PROMPT_STRICT,
     valid_tools=VALIDATION_TOOLS,
-    model=MODEL_NODE_EXECUTOR
+    model=MODEL_NODE_EXECUTOR,
+    name="validation_preprocessor"
 )
 
 
@@ -229,11 +243,24 @@ async def validation_preprocessor_node(state: MainRouterState) -> MainRouterStat
         return _handle_skip_validation(state)
 
     try:
-        print("[VALIDATION] Ejecutando router y extractor en paralelo...")
-        tool_name, entity_names_raw = await asyncio.gather(
-            _validation_router(state),
-            _extract_entity_name(state['question'])
-        )
+        extracted_entities = state.get("extracted_entities")
+        entity_types = {entity["type"] for entity in extracted_entities or ()}
+        if extracted_entities is not None and len(entity_types) <= 1:
+            print("[VALIDATION] Usando entidades extraídas por el router (sin LLM)")
+            tool_name, entity_names_raw = _from_router_entities(extracted_entities)
+        elif entity_types == {"actor", "director"}:
+            validation_status, needs_user_input, validated_entities = await asyncio.to_thread(
+                _process_typed_entities, extracted_entities
+            )
+            return _handle_validated(state, validation_status, needs_user_input, validated_entities)
+        else:
+            if extracted_entities:
+                print(f"[VALIDATION] Tipos mezclados del router {sorted(entity_types)}, re-extrayendo...")
+            print("[VALIDATION] Ejecutando router y extractor en paralelo...")
+            tool_name, entity_names_raw = await asyncio.gather(
+                _validation_router(state),
+                _extract_entity_name(state['question'])
+            )
         
         print(f"[VALIDATION] Tool seleccionado: {tool_name}")
 
@@ -257,33 +284,20 @@ async def validation_preprocessor_node(state: MainRouterState) -> MainRouterStat
         entity_names = [name.strip() for name in entity_names_raw.split(" | ")]
 
         if len(entity_names) > 1:
-            validation_status, needs_user_input, validated_entities = _process_multiple_entities(
-                entity_names, tool_name, tool_fn
+            validation_status, needs_user_input, validated_entities = await asyncio.to_thread(
+                _process_multiple_entities, entity_names, tool_name, tool_fn
             )
         else:
             entity_name = entity_names[0]
             print(f"[VALIDATION] Ejecutando {tool_name}('{entity_name}')...")
-            validation_result = tool_fn(entity_name)
+            validation_result = await asyncio.to_thread(tool_fn, entity_name)
             
             print(f"[VALIDATION] Resultado: {validation_result}")
             
             validation_status, needs_user_input, validated_entities = _process_validation_result(validation_result)
             validated_entities = _map_entity_ids(validated_entities, tool_name)
         
-        if needs_user_input:
-            return _handle_user_input_required(state, validation_status, validated_entities)
-        
-        print(f"[VALIDATION] Completada con status: {validation_status}")
-        print(f"[VALIDATION] Entities: {validated_entities}")
-        print("="*80 + "\n")
-        
-        return {
-            **state,
-            "validation_done": True,
-            "validation_status": validation_status,
-            "needs_validation": True,
-            "validated_entities": validated_entities
-        }
+        return _handle_validated(state, validation_status, needs_user_input, validated_entities)
         
     except Exception as e:
         return _handle_validation_error(state, e)
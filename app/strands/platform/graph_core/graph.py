@@ -1,4 +1,5 @@
 from langgraph.graph import StateGraph, END
+from app.strands.core.graph_registry import compiled_graph
 from .state import State, create_initial_state
 from .supervisor import platform_classifier, main_supervisor, route_from_main_supervisor, format_response
 from app.strands.platform.nodes.availability import availability_node
@@ -13,7 +14,7 @@ def _route_from_classifier(state: State) -> str:
     return "presence_node"
 
 
-def create_streaming_graph():
+def _build_graph() -> StateGraph:
     """Create platform graph with validation node."""
     graph = StateGraph(State)
 
@@ -58,7 +59,12 @@ def create_streaming_graph():
     graph.add_edge("presence_node", "main_supervisor")
     graph.add_edge("format_response", END)
 
-    return graph.compile()
+    return graph
+
+
+def create_streaming_graph():
+    """Compiled platform graph, built once per process."""
+    return compiled_graph("platform", _build_graph)
 
 
 async def process_question(question: str, max_iterations: int = 3, validated_entities: dict = None) -> State:
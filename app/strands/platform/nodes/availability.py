@@ -2,7 +2,8 @@ from app.strands.platform.graph_core.state import State
 from app.strands.platform.nodes.prompt_platform import AVAILABILITY_PROMPT
 from app.strands.platform.nodes.router_configs import (
     AVAILABILITY_TOOLS,
-    AVAILABILITY_ROUTER_PROMPT
+    AVAILABILITY_ROUTER_PROMPT,
+    AVAILABILITY_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -33,7 +34,10 @@ _availability_executor = BaseExecutorNode(
     tools_map=AVAILABILITY_TOOLS_MAP,
     router_fn=create_router(
         prompt=AVAILABILITY_ROUTER_PROMPT,
-        valid_tools=AVAILABILITY_TOOLS
+        valid_tools=AVAILABILITY_TOOLS,
+        name="availability",
+        fast_rules=AVAILABILITY_FAST_RULES,
+        tools=AVAILABILITY_TOOLS_MAP
     ),
     system_prompt=AVAILABILITY_PROMPT,
     model=MODEL_NODE_EXECUTOR
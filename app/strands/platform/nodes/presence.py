@@ -2,7 +2,8 @@ from app.strands.platform.graph_core.state import State
 from app.strands.platform.nodes.prompt_platform import PRESENCE_PROMPT
 from app.strands.platform.nodes.router_configs import (
     PRESENCE_TOOLS,
-    PRESENCE_ROUTER_PROMPT
+    PRESENCE_ROUTER_PROMPT,
+    PRESENCE_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -31,7 +32,10 @@ _presence_executor = BaseExecutorNode(
     tools_map=PRESENCE_TOOLS_MAP,
     router_fn=create_router(
         prompt=PRESENCE_ROUTER_PROMPT,
-        valid_tools=PRESENCE_TOOLS
+        valid_tools=PRESENCE_TOOLS,
+        name="presence",
+        fast_rules=PRESENCE_FAST_RULES,
+        tools=PRESENCE_TOOLS_MAP
     ),
     system_prompt=PRESENCE_PROMPT,
     model=MODEL_NODE_EXECUTOR
@@ -27,3 +27,63 @@ PRESENCE_TOOLS = {
     "platform_count_by_country",
     "country_platform_summary"
 }
+
+
+# Fast-path rules (core/factories/fast_router): keywords match whole words on
+# the casefolded, accent-free question, so list every inflection.
+AVAILABILITY_FAST_RULES = {
+    "availability_by_uid": {
+        "keywords": ("donde ver", "donde puedo ver", "donde se puede ver", "donde esta", "donde la",
+                     "donde lo", "where to watch", "where can i watch", "where is", "disponible",
+                     "disponibles", "disponibilidad", "available", "availability", "en que plataforma",
+                     "which platform", "what platform"),
+        "entities": ("uid",),
+        "excludes": ("exclusivo", "exclusiva", "exclusivos", "exclusivas", "exclusividad", "exclusive",
+                     "exclusives", "exclusivity", "compara", "comparar", "comparame", "comparacion",
+                     "comparativa", "compare", "compared", "comparison", "comparing", "estreno", "estrenos",
+                     "premiere", "premieres"),
+    },
+    "get_platform_exclusives": {
+        "keywords": ("exclusivo", "exclusiva", "exclusivos", "exclusivas", "exclusividad", "exclusive",
+                     "exclusives", "exclusivity", "solo en", "only on"),
+        "excludes": ("compara", "comparar", "comparame", "comparacion", "comparativa", "compare", "compared",
+                     "comparison", "comparing"),
+    },
+    "compare_platforms_for_title": {
+        "keywords": ("compara", "comparar", "comparame", "comparacion", "comparativa", "compare", "compared",
+                     "comparison", "comparing"),
+        "excludes": ("exclusivo", "exclusiva", "exclusivos", "exclusivas", "exclusividad", "exclusive",
+                     "exclusives", "exclusivity"),
+    },
+    "get_recent_premieres_by_country": {
+        "keywords": ("estreno", "estrenos", "premiere", "premieres", "recien llegado", "recien llegada",
+                     "recien llegados", "recien llegadas", "new release", "new releases",
+                     "nuevos lanzamientos", "just added"),
+        "excludes": ("exclusivo", "exclusiva", "exclusivos", "exclusivas", "exclusividad", "exclusive",
+                     "exclusives", "exclusivity"),
+    },
+}
+
+PRESENCE_FAST_RULES = {
+    "presence_count": {
+        "keywords": ("cuantos", "cuantas", "how many", "numero de", "number of", "cantidad de"),
+        "excludes": ("plataformas", "platforms", "estadistica", "estadisticas", "estadistico", "estadisticos",
+                     "statistic", "statistics"),
+    },
+    "presence_list": {
+        "keywords": ("list", "lista", "listado", "listar", "muestra todos", "show all"),
+        "excludes": ("plataformas por pais", "platforms by country"),
+    },
+    "presence_statistics": {
+        "keywords": ("estadistica", "estadisticas", "estadistico", "estadisticos", "statistic", "statistics",
+                     "metrica", "metricas", "metric", "metrics"),
+    },
+    "platform_count_by_country": {
+        "keywords": ("cuantas plataformas", "how many platforms", "numero de plataformas",
+                     "number of platforms", "cantidad de plataformas"),
+    },
+    "country_platform_summary": {
+        "keywords": ("resumen", "summary", "panorama", "overview"),
+        "excludes": ("estadistica", "estadisticas", "estadistico", "estadisticos", "statistic", "statistics"),
+    },
+}
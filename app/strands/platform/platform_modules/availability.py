@@ -2,11 +2,13 @@ from app.strands.infrastructure.database.utils import *
 from app.strands.core.shared_imports import *
 from app.strands.platform.platform_queries.queries_availability import *
 from app.strands.infrastructure.validators.shared import *
+from app.strands.infrastructure.cache.query_cache import cached_query, availability_cache
 from strands import tool
 
 
 @tool
-def get_availability_by_uid(uid: str, country: Optional[str] = None, with_prices: bool = False, limit: int = 100) -> List[Dict]:
+@cached_query(availability_cache, normalize=TOOL_ARG_NORMALIZERS)
+async def get_availability_by_uid(uid: str, country: Optional[str] = None, with_prices: bool = False, limit: int = 100) -> List[Dict]:
     """Get platform availability for a title by UID with optional price information.
 
     NOTE: Country validation is handled by validation_node in the graph.
@@ -52,7 +54,7 @@ def get_availability_by_uid(uid: str, country: Optional[str] = None, with_prices
         sql = QUERY_AVAILABILITY_WITHOUT_PRICES.format(
             country_condition=country_condition)
 
-    result = db.execute_query(sql, query_params)
+    result = await async_db.execute_query(sql, query_params, max_rows=limit or None)
     country_filter_display = country_isos[0] if country_isos and len(country_isos) == 1 else (
         f"region:{country}" if country_isos and len(country_isos) > 1 else None)
     logger.info(
@@ -68,9 +70,9 @@ def get_availability_by_uid(uid: str, country: Optional[str] = None, with_prices
                 error_context["countries_searched"] = country_isos
         return [error_context]
 
-    total_platforms = len(result)
-    if limit and len(result) > limit:
-        result = result[:limit]
+    total_platforms = result[0].get("total_count", len(result))
+    for r in result:
+        r.pop("total_count", None)
 
     response_data = {
         "uid": uid,
@@ -111,7 +113,8 @@ def get_availability_by_uid(uid: str, country: Optional[str] = None, with_prices
 
 
 @tool
-def query_platforms_for_title(uid: str, limit: int = 50) -> List[Dict]:
+@cached_query(availability_cache, normalize=TOOL_ARG_NORMALIZERS)
+async def query_platforms_for_title(uid: str, limit: int = 50) -> List[Dict]:
     """
     Get all platforms carrying a specific title.
 
@@ -127,7 +130,7 @@ def query_platforms_for_title(uid: str, limit: int = 50) -> List[Dict]:
 
     if not uid:
         return [{"message": "uid required"}]
-    result = db.execute_query(QUERY_PLATFORMS_FOR_TITLE, (uid, limit))
+    result = await async_db.execute_query(QUERY_PLATFORMS_FOR_TITLE, (uid, limit))
 
     logger.info(
         f"Platforms queried for {uid}, results: {len(result) if result else 0}")
@@ -135,7 +138,8 @@ def query_platforms_for_title(uid: str, limit: int = 50) -> List[Dict]:
 
 
 @tool
-def query_platforms_for_uid_by_country(uid: str, country: str = None) -> List[Dict]:
+@cached_query(availability_cache, normalize=TOOL_ARG_NORMALIZERS)
+async def query_platforms_for_uid_by_country(uid: str, country: str = None) -> List[Dict]:
     """
     Get platforms for a UID within a specific country or region.
 
@@ -158,12 +162,12 @@ def query_platforms_for_uid_by_country(uid: str, country: str = None) -> List[Di
     if not country:
         logger.info(
             "No country provided, falling back to generic platforms query")
-        return query_platforms_for_title(uid)
+        return await query_platforms_for_title(uid)
 
     country_isos = [country] if isinstance(country, str) else country
     
     if len(country_isos) == 1:
-        result = db.execute_query(
+        result = await async_db.execute_query(
             QUERY_PLATFORMS_FOR_UID_BY_COUNTRY, (uid, country_isos[0]))
         return handle_query_result(result, "platforms for title by country", f"{uid} @ {country_isos[0]}")
     else:
@@ -172,12 +176,13 @@ def query_platforms_for_uid_by_country(uid: str, country: str = None) -> List[Di
             "p.iso_alpha2 = %s",
             f"p.iso_alpha2 IN ({placeholders})"
         )
-        result = db.execute_query(query, (uid,))
+        result = await async_db.execute_query(query, (uid,))
         return handle_query_result(result, "platforms for title by region", f"{uid} @ {country}")
 
 
 @tool
-def get_platform_exclusives(platform_name: str, country: str = "US", limit: int = 50) -> List[Dict]:
+@cached_query(availability_cache, normalize=TOOL_ARG_NORMALIZERS)
+async def get_platform_exclusives(platform_name: str, country: str = "US", limit: int = 50) -> List[Dict]:
     """Get exclusive titles available on a specific platform within a country or region.
 
     NOTE: Platform and country validation handled by validation_node.
@@ -200,13 +205,13 @@ def get_platform_exclusives(platform_name: str, country: str = "US", limit: int
     country_isos = [country] if isinstance(country, str) else country
     
     if len(country_isos) == 1:
-        result = db.execute_query(
+        result = await async_db.execute_query(
             QUERY_PLATFORM_EXCLUSIVES, (platform_name, country_isos[0], limit))
         return handle_query_result(result, "platform exclusives", f"exclusives {platform_name} @ {country_isos[0]}")
     else:
         all_results = []
         for iso in country_isos:
-            result = db.execute_query(
+            result = await async_db.execute_query(
                 QUERY_PLATFORM_EXCLUSIVES, (platform_name, iso, limit))
             if result:
                 all_results.extend(result)
@@ -223,7 +228,7 @@ def get_platform_exclusives(platform_name: str, country: str = "US", limit: int
 
 
 @tool
-def compare_platforms_for_title(title_: str) -> List[Dict]:
+async def compare_platforms_for_title(title_: str) -> List[Dict]:
     """Compare which streaming platforms carry a specific title (exact title match).
 
     Returns distinct list of platform names and countries where the title is available.
@@ -240,14 +245,15 @@ def compare_platforms_for_title(title_: str) -> List[Dict]:
     if not title_:
         return [{"message": "Title required"}]
 
-    result = db.execute_query(QUERY_COMPARE_PLATFORM_TITLE, (title_,))
+    result = await async_db.execute_query(QUERY_COMPARE_PLATFORM_TITLE, (title_,))
 
     logger.info(f"Platforms queried for {title_}, results: {result}")
     return handle_query_result(result, "compare platforms for title", title_)
 
 
 @tool
-def get_recent_premieres_by_country(country: str, days_back: int = 7, limit: int = 30) -> List[Dict]:
+@cached_query(availability_cache, normalize=TOOL_ARG_NORMALIZERS)
+async def get_recent_premieres_by_country(country: str, days_back: int = 7, limit: int = 30) -> List[Dict]:
     """
     Get recent premieres available in a country or region within the last N days.
 
@@ -284,7 +290,7 @@ def get_recent_premieres_by_country(country: str, days_back: int = 7, limit: int
             }
             logger.debug(
                 f"[recent_premieres] country={region_isos[0]}, days_back={days_back}, range=({date_from},{date_to}), limit={limit}")
-            rows = db.execute_query(QUERY_RECENT_PREMIERES_BY_COUNTRY, params)
+            rows = await async_db.execute_query(QUERY_RECENT_PREMIERES_BY_COUNTRY, params)
             return handle_query_result(rows, "recent premieres by country", f"{region_isos[0]} last {days_back}d")
         else:
             all_results = []
@@ -295,7 +301,7 @@ def get_recent_premieres_by_country(country: str, days_back: int = 7, limit: int
                     "date_to": date_to,
                     "limit": limit,
                 }
-                rows = db.execute_query(
+                rows = await async_db.execute_query(
                     QUERY_RECENT_PREMIERES_BY_COUNTRY, params)
                 if rows:
                     all_results.extend(rows)
@@ -324,6 +330,6 @@ def get_recent_premieres_by_country(country: str, days_back: int = 7, limit: int
 
     logger.debug(
         f"[recent_premieres] country={resolved_country}, days_back={days_back}, range=({date_from},{date_to}), limit={limit}")
-    rows = db.execute_query(QUERY_RECENT_PREMIERES_BY_COUNTRY, params)
+    rows = await async_db.execute_query(QUERY_RECENT_PREMIERES_BY_COUNTRY, params)
 
     return handle_query_result(rows, "recent premieres by country", f"{resolved_country} last {days_back}d")
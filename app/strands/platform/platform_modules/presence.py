@@ -164,7 +164,7 @@ def presence_list(country: str = None, platform_name: str = None, type: str = No
         "offset": offset
     })
 
-    result = db.execute_query(sql, query_params)
+    result = db.execute_query(sql, query_params, max_rows=limit)
     return result if result else [{"message": "No results found"}]
 
 @tool
@@ -64,7 +64,8 @@ SELECT
   lp.currency,
   lp.price_type,
   lp.definition,
-  lp.license
+  lp.license,
+  COUNT(*) OVER() AS total_count
 FROM {PRES_TBL} p
 LEFT JOIN LATERAL (
   SELECT price, currency, price_type, definition, license
@@ -80,7 +81,8 @@ ORDER BY p.platform_name ASC, lp.price ASC NULLS LAST;
 QUERY_AVAILABILITY_WITHOUT_PRICES = f"""
     SELECT
         p.platform_name,
-        p.clean_title
+        p.clean_title,
+        COUNT(*) OVER() AS total_count
     FROM {PRES_TBL} p
     WHERE p.uid = %(uid)s
         {{country_condition}}
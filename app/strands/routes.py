@@ -2,6 +2,16 @@
 import asyncio
 from fastapi import APIRouter, Request
 from app.strands.main_router.graph import process_question_advanced
+from app.strands.infrastructure.database.connection import db
+from app.strands.infrastructure.database.async_connection import async_db
+from app.strands.infrastructure.database.instrumentation import query_stats
+from app.strands.infrastructure.cache.query_cache import (
+    availability_cache, general_cache, intelligence_cache, pricing_cache, rankings_cache, validation_cache,
+)
+from app.strands.infrastructure.cache.llm_cache import llm_response_cache
+from app.strands.infrastructure.cache.watermarks import watermarks
+from app.strands.core.graph_registry import graph_registry_stats
+from app.strands.core.factories.fast_router import routing_stats
 
 router = APIRouter()
 
@@ -54,4 +64,66 @@ async def strand_ask(request: Request):
             "tool_times": result.get("tool_execution_times", {}),
         }
     except Exception as e:
-        return {"ok": False, "error": str(e)}
\ No newline at end of file
+        return {"ok": False, "error": str(e)}
+
+
+@router.get("/db/pool")
+def strand_db_pool():
+    """
+    Estadísticas del pool de conexiones (tamaño, uso y tiempos de espera).
+    """
+    if not db.initialized:
+        return {"ok": True, "pool": None, "initialized": False, "async": async_db.get_stats()}
+    return {"ok": True, "pool": db.get_pool_stats(), "async": async_db.get_stats()}
+
+
+@router.get("/db/queries")
+def strand_db_queries(sort_by: str = "total_ms", limit: int = 50, samples: bool = False):
+    """
+    Métricas agregadas por plantilla SQL (latencia, filas, bytes, errores).
+    """
+    return {
+        "ok": True,
+        **query_stats.summary(),
+        "templates": query_stats.snapshot(sort_by=sort_by, limit=limit, include_samples=samples),
+    }
+
+
+@router.get("/db/queries/{sql_hash}")
+def strand_db_query_detail(sql_hash: str):
+    """
+    Detalle de una plantilla SQL, incluyendo muestras del texto completo.
+    """
+    stats = query_stats.get(sql_hash)
+    if stats is None:
+        return {"ok": False, "error": f"Unknown template '{sql_hash}'"}
+    return {"ok": True, "template": stats}
+
+
+@router.get("/cache/stats")
+def strand_cache_stats():
+    """
+    Estadísticas de las cachés de resultados (L1/L2, stale, single-flight), watermarks y grafos compilados.
+    """
+    return {
+        "ok": True,
+        "caches": {
+            "intelligence": intelligence_cache.get_stats(),
+            "rankings": rankings_cache.get_stats(),
+            "pricing": pricing_cache.get_stats(),
+            "availability": availability_cache.get_stats(),
+            "general": general_cache.get_stats(),
+            "validation": validation_cache.get_stats(),
+            "llm": llm_response_cache.get_stats(),
+        },
+        "watermarks": watermarks.stats(),
+        "graphs": graph_registry_stats(),
+    }
+
+
+@router.get("/routing/stats")
+def strand_routing_stats():
+    """
+    Decisiones de routing de tools por nodo: hit rate del fast path y latencia (fast vs LLM).
+    """
+    return {"ok": True, "routers": routing_stats.snapshot()}
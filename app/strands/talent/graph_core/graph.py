@@ -1,4 +1,5 @@
 from langgraph.graph import StateGraph, END
+from app.strands.core.graph_registry import compiled_graph
 from .state import State, create_initial_state
 from .supervisor import talent_classifier, main_supervisor, route_from_main_supervisor
 from app.strands.talent.nodes.actors import actors_node
@@ -28,7 +29,7 @@ def _route_from_classifier(state: State) -> str:
     return "actors_node"
 
 
-def create_streaming_graph():
+def _build_graph() -> StateGraph:
     """Create optimized talent graph (no internal validation)."""
     graph = StateGraph(State)
 
@@ -64,7 +65,12 @@ def create_streaming_graph():
     graph.add_edge("directors_node", "main_supervisor")
     graph.add_edge("collaborations_node", "main_supervisor")
 
-    return graph.compile()
+    return graph
+
+
+def create_streaming_graph():
+    """Compiled talent graph, built once per process."""
+    return compiled_graph("talent", _build_graph)
 
 
 async def process_question(question: str, max_iterations: int = 3, validated_entities: dict = None) -> State:
@@ -2,7 +2,8 @@ from app.strands.talent.graph_core.state import State
 from app.strands.talent.nodes.prompt_talent import ACTORS_PROMPT
 from app.strands.talent.nodes.router_configs import (
     ACTORS_TOOLS,
-    ACTORS_ROUTER_PROMPT
+    ACTORS_ROUTER_PROMPT,
+    ACTORS_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -27,7 +28,10 @@ _actors_executor = BaseExecutorNode(
     tools_map=ACTORS_TOOLS_MAP,
     router_fn=create_router(
         prompt=ACTORS_ROUTER_PROMPT,
-        valid_tools=ACTORS_TOOLS
+        valid_tools=ACTORS_TOOLS,
+        name="actors",
+        fast_rules=ACTORS_FAST_RULES,
+        tools=ACTORS_TOOLS_MAP
     ),
     system_prompt=ACTORS_PROMPT,
     model=MODEL_NODE_EXECUTOR,
@@ -25,7 +25,8 @@ _collaborations_executor = BaseExecutorNode(
     tools_map=COLLABORATIONS_TOOLS_MAP,
     router_fn=create_router(
         prompt=COLLABORATIONS_ROUTER_PROMPT,
-        valid_tools=COLLABORATIONS_TOOLS
+        valid_tools=COLLABORATIONS_TOOLS,
+        name="collaborations"
     ),
     system_prompt=COLLABORATIONS_PROMPT,
     model=MODEL_NODE_EXECUTOR
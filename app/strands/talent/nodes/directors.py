@@ -2,7 +2,8 @@ from app.strands.talent.graph_core.state import State
 from app.strands.talent.nodes.prompt_talent import DIRECTORS_PROMPT
 from app.strands.talent.nodes.router_configs import (
     DIRECTORS_TOOLS,
-    DIRECTORS_ROUTER_PROMPT
+    DIRECTORS_ROUTER_PROMPT,
+    DIRECTORS_FAST_RULES
 )
 from app.strands.config.llm_models import MODEL_NODE_EXECUTOR
 from app.strands.core.nodes.base_node import BaseExecutorNode
@@ -25,7 +26,10 @@ _directors_executor = BaseExecutorNode(
     tools_map=DIRECTORS_TOOLS_MAP,
     router_fn=create_router(
         prompt=DIRECTORS_ROUTER_PROMPT,
-        valid_tools=DIRECTORS_TOOLS
+        valid_tools=DIRECTORS_TOOLS,
+        name="directors",
+        fast_rules=DIRECTORS_FAST_RULES,
+        tools=DIRECTORS_TOOLS_MAP
     ),
     system_prompt=DIRECTORS_PROMPT,
     model=MODEL_NODE_EXECUTOR,
@@ -25,3 +25,38 @@ COLLABORATIONS_TOOLS = {
     "find_common_titles_actor_director",
     "get_common_projects_actor_director_by_name"
 }
+
+
+# Fast-path rules (core/factories/fast_router): keywords match whole words on
+# the casefolded, accent-free question, so list every inflection.
+ACTORS_FAST_RULES = {
+    "get_actor_filmography": {
+        "keywords": ("filmografia", "filmography", "peliculas de", "movies of", "movies with",
+                     "en que pelicula", "en que peliculas", "what movies", "which movies", "trabajado en",
+                     "acted in", "ha actuado", "ha participado"),
+        "entities": ("actor_id",),
+        "excludes": ("coactor", "coactores", "co-actor", "co actor", "con quien", "who has worked with",
+                     "companero", "companera", "companeros", "companeras"),
+    },
+    "get_actor_coactors": {
+        "keywords": ("coactor", "coactores", "co-actor", "co actor", "con quien", "who has worked with",
+                     "companero", "companera", "companeros", "companeras", "costar", "costars", "co-star",
+                     "co-stars"),
+        "entities": ("actor_id",),
+    },
+}
+
+DIRECTORS_FAST_RULES = {
+    "get_director_filmography": {
+        "keywords": ("filmografia", "filmography", "pelicula", "peliculas", "movie", "movies", "dirigido",
+                     "dirigida", "dirigidos", "dirigidas", "directed", "obras", "works"),
+        "entities": ("director_id",),
+        "excludes": ("colaboracion", "colaboraciones", "colaborado", "colaborador", "colaboradores",
+                     "colaboro", "codirector", "codirectores", "co-director", "con quien", "worked with"),
+    },
+    "get_director_collaborators": {
+        "keywords": ("colaboracion", "colaboraciones", "colaborado", "colaborador", "colaboradores",
+                     "colaboro", "codirector", "codirectores", "co-director", "con quien", "worked with"),
+        "entities": ("director_id",),
+    },
+}
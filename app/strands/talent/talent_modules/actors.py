@@ -1,12 +1,15 @@
+import asyncio
 from app.strands.talent.talent_queries.queries_actors import *
 from app.strands.infrastructure.database.utils import *
 from app.strands.infrastructure.database.constants import *
 from app.strands.core.shared_imports import *
 from app.strands.common.common_modules.validation import *
+from app.strands.infrastructure.cache.query_cache import cached_query, general_cache
 from strands import tool
 
 @tool
-def get_actor_filmography(actor_id: str, limit: int = DEFAULT_LIMIT) -> Dict[str, Any]:
+@cached_query(general_cache)
+async def get_actor_filmography(actor_id: str, limit: int = DEFAULT_LIMIT) -> Dict[str, Any]:
     """Get actor's filmography using their ID (efficient direct query).
     
     Single parameter: actor_id (cast_id). Returns default 10 films (most recent).
@@ -21,7 +24,7 @@ def get_actor_filmography(actor_id: str, limit: int = DEFAULT_LIMIT) -> Dict[str
         Dict with filmography data or error message
     """
     
-    results = db.execute_query(
+    results = await async_db.execute_query(
         FILMOGRAPHY_SQL_ACTOR, 
         (actor_id, limit),
         f"actor_filmography_{actor_id}"
@@ -29,7 +32,8 @@ def get_actor_filmography(actor_id: str, limit: int = DEFAULT_LIMIT) -> Dict[str
     return handle_query_result(results, "actor_filmography", actor_id)
 
 @tool
-def get_actor_coactors(actor_id: str, limit: int = MAX_LIMIT) -> Dict[str, Any]:
+@cached_query(general_cache)
+async def get_actor_coactors(actor_id: str, limit: int = MAX_LIMIT) -> Dict[str, Any]:
     """Get co-actors using the actor's ID (efficient direct query).
     
     Single parameter: actor_id (cast_id). Returns default 20 co-actors (most frequent).
@@ -44,7 +48,7 @@ def get_actor_coactors(actor_id: str, limit: int = MAX_LIMIT) -> Dict[str, Any]:
         Dict with co-actors data or error message
     """
     
-    results = db.execute_query(
+    results = await async_db.execute_query(
         COACTORS_SQL, 
         (actor_id, actor_id, limit),
         f"actor_coactors_{actor_id}"
@@ -52,7 +56,7 @@ def get_actor_coactors(actor_id: str, limit: int = MAX_LIMIT) -> Dict[str, Any]:
     return handle_query_result(results, "actor_coactors", actor_id)
 
 @tool
-def get_actor_filmography_by_name(
+async def get_actor_filmography_by_name(
     actor_name: Union[str, List[str], Any], 
     limit: int = DEFAULT_LIMIT
     ) -> str:
@@ -70,10 +74,10 @@ def get_actor_filmography_by_name(
     Returns:
         JSON string with filmography data, options, or error message
     """
-    validation = validate_actor(actor_name)
+    validation = await asyncio.to_thread(validate_actor, actor_name)
     
     if validation["status"] == "ok":
-        filmography = get_actor_filmography(validation["id"], limit)
+        filmography = await get_actor_filmography(validation["id"], limit)
         return json.dumps(filmography, indent=2, ensure_ascii=False)
     
     query_text = normalize_input(actor_name)
@@ -85,7 +89,7 @@ def get_actor_filmography_by_name(
     return f"No encontré coincidencias para '{query_text}'."
 
 @tool
-def get_actor_coactors_by_name(
+async def get_actor_coactors_by_name(
     actor_name: Union[str, List[str], Any], 
     limit: int = DEFAULT_LIMIT
     ) -> str:
@@ -101,10 +105,10 @@ def get_actor_coactors_by_name(
     Returns:
         JSON string with co-actors data, options, or error message
     """
-    validation = validate_actor(actor_name)
+    validation = await asyncio.to_thread(validate_actor, actor_name)
     
     if validation["status"] == "ok":
-        coactors = get_actor_coactors(validation["id"], limit)
+        coactors = await get_actor_coactors(validation["id"], limit)
         return json.dumps(coactors, indent=2, ensure_ascii=False)
     
     query_text = normalize_input(actor_name)
@@ -90,7 +90,8 @@ def find_common_titles_actor_director(
     results = db.execute_query(
         COMMON_TITLES_ACTOR_DIRECTOR_SQL,
         (actor_validation["id"], director_validation["id"], limit),
-        f"common_titles_actor_{actor_validation['id']}_director_{director_validation['id']}"
+        f"common_titles_actor_{actor_validation['id']}_director_{director_validation['id']}",
+        prepared=True,
     )
 
     if not results:
@@ -163,7 +164,8 @@ def get_common_projects_actor_director_by_name(
                 results = db.execute_query(
                     COMMON_TITLES_ACTOR_DIRECTOR_SQL,
                     (actor_id, director_id, limit),
-                    f"common_titles_{actor_id}_{director_id}"
+                    f"common_titles_{actor_id}_{director_id}",
+                    prepared=True,
                 )
 
                 if not results:
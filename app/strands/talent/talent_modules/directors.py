@@ -6,7 +6,7 @@ from app.strands.common.common_modules.validation import *
 from strands import tool
 
 @tool
-def get_director_filmography(director_id: str, limit: int = DEFAULT_LIMIT) -> Dict[str, Any]:
+async def get_director_filmography(director_id: str, limit: int = DEFAULT_LIMIT) -> Dict[str, Any]:
     """Get director's filmography using their numeric ID (efficient direct query).
     
     IMPORTANT: director_id must be a NUMERIC ID (e.g., 615683), NOT an IMDB ID (e.g., nm0634240).
@@ -28,7 +28,7 @@ def get_director_filmography(director_id: str, limit: int = DEFAULT_LIMIT) -> Di
         return {"error": f"Invalid director_id: {director_id}. Must be numeric (e.g., 615683)"}
     director_id_int = int(numeric_id)
    
-    results = db.execute_query(
+    results = await async_db.execute_query(
         FILMOGRAPHY_SQL_DIRECTOR,
         (director_id_int, limit),
         f"director_filmography_{director_id_int}"
@@ -36,7 +36,7 @@ def get_director_filmography(director_id: str, limit: int = DEFAULT_LIMIT) -> Di
     return handle_query_result(results, "director_filmography", director_id_int)
 
 @tool
-def get_director_collaborators(director_id: str, limit: int = MAX_LIMIT) -> Dict[str, Any]:
+async def get_director_collaborators(director_id: str, limit: int = MAX_LIMIT) -> Dict[str, Any]:
     """Get co-directors (directors who have worked on the same films) using director's numeric ID.
     
     IMPORTANT: director_id must be a NUMERIC ID (e.g., 615683), NOT an IMDB ID (e.g., nm0634240).
@@ -58,7 +58,7 @@ def get_director_collaborators(director_id: str, limit: int = MAX_LIMIT) -> Dict
         return {"error": f"Invalid director_id: {director_id}. Must be numeric (e.g., 615683)"}
     director_id_int = int(numeric_id)
    
-    results = db.execute_query(
+    results = await async_db.execute_query(
         CODIRECTORS_SQL,
         (director_id_int, director_id_int, limit),
         f"director_collaborators_{director_id_int}"
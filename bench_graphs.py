@@ -0,0 +1,53 @@
+# bench_graphs.py
+"""
+Benchmark del coste de compilar los grafos por request vs. el registro de grafos compilados.
+
+Uso: python bench_graphs.py [iteraciones]
+No llama al LLM ni a la base de datos: solo mide construcción + compile().
+"""
+
+import contextlib
+import importlib
+import io
+import sys
+import time
+
+DOMAINS = ("business", "talent", "content", "platform", "common")
+
+
+def _ms_per_call(fn, iterations: int) -> float:
+    # Los builders imprimen banners; se silencian para no medir stdout.
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main(iterations: int = 50):
+    from app.strands.main_router import graph as main_graph
+
+    cases = []
+    for domain in DOMAINS:
+        module = importlib.import_module(f"app.strands.{domain}.graph_core.graph")
+        cases.append((domain, lambda m=module: m._build_graph().compile(), module.create_streaming_graph))
+    cases.append((
+        "main_router",
+        lambda: main_graph._build_advanced_graph().compile(checkpointer=main_graph.checkpointer),
+        lambda: main_graph.create_advanced_graph(use_checkpointer=True),
+    ))
+
+    print(f"{'grafo':<14}{'compile/request':>18}{'registro':>12}{'speedup':>10}")
+    total_before = total_after = 0.0
+    for name, per_request, cached in cases:
+        before = _ms_per_call(per_request, iterations)
+        _ms_per_call(cached, 1)  # primera compilación (la hace el warm-up al arrancar)
+        after = _ms_per_call(cached, iterations)
+        total_before += before
+        total_after += after
+        print(f"{name:<14}{before:>15.3f}ms{after:>10.4f}ms{before / max(after, 1e-9):>9.0f}x")
+    print(f"{'total':<14}{total_before:>15.3f}ms{total_after:>10.4f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
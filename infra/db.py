@@ -1,106 +1,107 @@
 # infra/db.py
-import os
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from infra.config import SETTINGS
 
-try:
-    import psycopg2
-    from psycopg2.pool import SimpleConnectionPool
-    from psycopg2.extras import RealDictCursor
-except Exception:  # tests locales sin deps
-    psycopg2 = None
-    SimpleConnectionPool = None
-    RealDictCursor = None
-
 log = logging.getLogger("infra.db")
 
-_pool: Optional[SimpleConnectionPool] = None
-
+# Los módulos legacy comparten el pool del gateway de strands
+# (app.strands.infrastructure.database.connection.db): un único presupuesto
+# de conexiones contra Aurora, search_path ms,public fijado al conectar y
+# statement_timeout por sentencia.
 
-def _ensure_pool() -> None:
-    """
-    Inicializa el pool si:
-      - no estamos en OFFLINE_MODE
-      - hay credenciales (SETTINGS.db_ready)
-      - psycopg2 está disponible
-    """
-    global _pool
-    if SETTINGS.offline_mode:
-        return
-    if _pool is not None:
-        return
-    if not SETTINGS.db_ready:
-        log.warning("DB not ready: missing credentials (db_ready=False).")
-        return
-    if not psycopg2:
-        log.warning("psycopg2 not available; cannot initialize pool.")
-        return
 
-    minconn = int(os.getenv("AURORA_POOL_MIN", "1"))
-    maxconn = int(os.getenv("AURORA_POOL_MAX", "5"))
-
-    _pool = SimpleConnectionPool(
-        minconn=minconn,
-        maxconn=maxconn,
-        user=SETTINGS.aurora_user,
-        password=SETTINGS.aurora_pass,
-        host=SETTINGS.aurora_host,
-        port=SETTINGS.aurora_port,
-        database=SETTINGS.aurora_db,
-        connect_timeout=5,
-        options=f"-c application_name=origin-insights-llm"
-    )
-    log.info(
-        "PG pool initialized (min=%s max=%s host=%s db=%s, source=%s)",
-        minconn, maxconn, SETTINGS.aurora_host, SETTINGS.aurora_db, SETTINGS.db_source
-    )
+# Tras un fallo de inicialización no se reintenta (secret + connect) en cada llamada.
+_GATEWAY_RETRY_SECONDS = float(os.getenv("DB_GATEWAY_RETRY_SECONDS", "30"))
+_gateway_down_until = 0.0
 
 
-def _conn():
-    _ensure_pool()
+def _gateway():
+    """
+    Devuelve el SQLConnectionManager compartido (ya inicializado), o None si:
+      - estamos en OFFLINE_MODE
+      - no se pudo inicializar (sin credenciales / sin psycopg2 / Aurora caída);
+        se reintenta tras DB_GATEWAY_RETRY_SECONDS
+    El ``db`` de strands es lazy (no falla al importar), así que el pool se
+    construye aquí para que run_sql / iter_sql / db_health sigan devolviendo
+    []/None/False sin credenciales en vez de lanzar en el primer uso.
+    """
+    global _gateway_down_until
     if SETTINGS.offline_mode:
-        raise RuntimeError("DB not available: OFFLINE_MODE=1")
-    if _pool is None:
-        raise RuntimeError("DB not available: pool not initialized (db_ready=%s)" % SETTINGS.db_ready)
-    return _pool.getconn()
+        return None
+    if time.monotonic() < _gateway_down_until:
+        return None
+    try:
+        from app.strands.infrastructure.database.connection import db
+        return db.get()
+    except Exception as e:
+        _gateway_down_until = time.monotonic() + _GATEWAY_RETRY_SECONDS
+        log.warning("DB gateway not available: %s", e)
+        return None
 
 
-def _put(conn) -> None:
-    if _pool and conn:
-        _pool.putconn(conn)
+def get_conn(timeout_ms: Optional[int] = None):
+    """
+    Conexión del pool compartido como context manager (se devuelve al salir):
+    with get_conn() as conn, conn.cursor() as cur: ...
+    """
+    gw = _gateway()
+    if gw is None:
+        raise RuntimeError("DB not available (offline_mode=%s)" % SETTINGS.offline_mode)
+    return gw.connection(timeout_ms=timeout_ms)
 
 
 def run_sql(
     sql: str,
-    params: Optional[Union[Dict[str, Any], Tuple[Any, ...]]] = None
-) -> List[Dict[str, Any]]:
+    params: Optional[Union[Dict[str, Any], Tuple[Any, ...]]] = None,
+    timeout_ms: Optional[int] = None,
+    max_rows: Optional[int] = None,
+    row_format: str = "dict",
+) -> List[Any]:
     """
-    Ejecuta SQL y devuelve filas como dicts.
-    - SET search_path a ms,public
-    - SET LOCAL statement_timeout (ENV PG_STMT_TIMEOUT_MS -> SETTINGS.pg_stmt_timeout_ms)
+    Ejecuta SQL y devuelve filas como dicts (RealDictRow, sin copia extra).
+    - search_path ms,public (fijado en la conexión del pool)
+    - statement_timeout por sentencia (timeout_ms -> SETTINGS.pg_stmt_timeout_ms)
+    - max_rows: tope de filas materializadas (además de DB_MAX_ROWS)
+    - row_format="tuple": Rows compactas (tuplas + nombres de columna una vez)
+    - sin DB disponible (offline / sin credenciales) => []
     """
-    if SETTINGS.offline_mode or not SETTINGS.db_ready:
+    gw = _gateway()
+    if gw is None:
         return []
 
-    conn = None
-    try:
-        conn = _conn()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # esquema y timeout por sentencia
-            cur.execute("SET search_path TO ms, public;")
-            cur.execute(f"SET LOCAL statement_timeout = {SETTINGS.pg_stmt_timeout_ms};")
+    rows = gw.execute_query(
+        sql,
+        params,
+        timeout_ms=SETTINGS.pg_stmt_timeout_ms if timeout_ms is None else timeout_ms,
+        max_rows=max_rows,
+        row_format=row_format,
+    )
+    return rows if isinstance(rows, list) else []
 
-            if params is None:
-                cur.execute(sql)
-            else:
-                cur.execute(sql, params)
 
-            rows = cur.fetchall() if cur.description else []
-            return [dict(r) for r in rows]
-    finally:
-        _put(conn)
+def iter_sql(
+    sql: str,
+    params: Optional[Union[Dict[str, Any], Tuple[Any, ...]]] = None,
+    max_rows: Optional[int] = None,
+    timeout_ms: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Igual que run_sql pero en streaming (cursor de servidor + fetchmany):
+    nunca se leen más de max_rows filas. Sin DB disponible no produce filas.
+    """
+    gw = _gateway()
+    if gw is None:
+        return
+    yield from gw.iter_query(
+        sql,
+        params,
+        max_rows=max_rows,
+        timeout_ms=SETTINGS.pg_stmt_timeout_ms if timeout_ms is None else timeout_ms,
+    )
 
 
 def db_health() -> bool:
@@ -112,7 +113,7 @@ def db_health() -> bool:
     """
     if SETTINGS.offline_mode:
         return True
-    if not SETTINGS.db_ready:
+    if _gateway() is None:
         return False
     try:
         rows = run_sql("SELECT 1 AS ok;")
@@ -124,4 +125,4 @@ def db_health() -> bool:
         return bool(rows)
     except Exception as e:
         log.warning("db_health check failed: %s", e)
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,90 @@
+import asyncio
+
+from app.strands.infrastructure.database.async_connection import AsyncSQLConnectionManager
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetch(self, n):
+        return self.rows[:n]
+
+
+class FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.full_fetches = 0
+
+    def transaction(self, readonly=False):
+        return FakeTransaction()
+
+    async def cursor(self, sql, *args):
+        return FakeCursor(self.rows)
+
+    async def fetch(self, sql, *args):
+        self.full_fetches += 1
+        return self.rows
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+def _manager(monkeypatch, rows, db_max_rows):
+    monkeypatch.setenv("DB_MAX_ROWS", str(db_max_rows))
+    manager = AsyncSQLConnectionManager()
+    manager._reader_resolved = True
+    conn = FakeConnection([{"n": i} for i in range(rows)])
+
+    async def get_pool():
+        return FakePool(conn)
+
+    monkeypatch.setattr(manager, "get_pool", get_pool)
+    return manager, conn
+
+
+def test_db_max_rows_caps_queries_without_max_rows(monkeypatch):
+    manager, conn = _manager(monkeypatch, rows=10, db_max_rows=3)
+
+    rows = asyncio.run(manager.execute_query("SELECT n FROM t"))
+
+    assert rows == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert conn.full_fetches == 0
+    assert manager.truncated_results == 1
+
+
+def test_max_rows_never_exceeds_db_max_rows(monkeypatch):
+    manager, _ = _manager(monkeypatch, rows=10, db_max_rows=3)
+
+    assert len(asyncio.run(manager.execute_query("SELECT n FROM t", max_rows=8))) == 3
+    assert len(asyncio.run(manager.execute_query("SELECT n FROM t", max_rows=2))) == 2
+    assert manager.truncated_results == 2
+
+
+def test_results_within_the_cap_are_not_counted_as_truncated(monkeypatch):
+    manager, _ = _manager(monkeypatch, rows=3, db_max_rows=3)
+
+    assert len(asyncio.run(manager.execute_query("SELECT n FROM t"))) == 3
+    assert manager.truncated_results == 0
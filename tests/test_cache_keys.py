@@ -0,0 +1,34 @@
+from app.strands.infrastructure.cache.query_cache import QueryCache, cached_query
+from app.strands.infrastructure.validators.shared import TOOL_ARG_NORMALIZERS, country_cache_key
+
+
+def _cached_lookup():
+    calls = []
+
+    @cached_query(QueryCache(ttl_minutes=1, max_size=10), normalize=TOOL_ARG_NORMALIZERS)
+    def lookup(country=None):
+        calls.append(country)
+        return [{"country": country}]
+
+    return lookup, calls
+
+
+def test_regions_and_keywords_do_not_collapse_into_countries():
+    keys = {value: country_cache_key(value) for value in ("EU", "all", "RE", "Korea", "KP")}
+    assert len(set(keys.values())) == len(keys)
+
+
+def test_exact_aliases_share_a_key():
+    assert country_cache_key("USA") == country_cache_key("us") == country_cache_key("Estados Unidos") == "US"
+    assert country_cache_key("ue") == country_cache_key("EU")
+
+
+def test_cached_query_keeps_eu_all_and_re_apart():
+    lookup, calls = _cached_lookup()
+    assert lookup("EU") == [{"country": "EU"}]
+    assert lookup("all") == [{"country": "all"}]
+    assert lookup("RE") == [{"country": "RE"}]
+    assert calls == ["EU", "all", "RE"]
+
+    assert lookup(country="eu") == [{"country": "EU"}]
+    assert calls == ["EU", "all", "RE"]
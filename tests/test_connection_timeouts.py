@@ -0,0 +1,98 @@
+import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
+import pytest
+
+from app.strands.infrastructure.database import connection
+from app.strands.infrastructure.database.connection import SQLConnectionManager
+from app.strands.infrastructure.database.routing import reader_health
+
+SLOW_SQL = "SELECT pg_sleep(60)"
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.executed.append(query)
+        raise psycopg2.errors.QueryCanceled("canceling statement due to statement timeout")
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.autocommit = True
+        self.executed = []
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def get_transaction_status(self):
+        return psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _manager(monkeypatch, role="writer"):
+    monkeypatch.setattr(connection, "resolve_db_config", lambda force_refresh=False: {
+        "host": f"{role}.local", "port": 5432, "db": "test", "user": "u", "password": "p",
+    })
+    monkeypatch.delenv("DB_READER_HOST", raising=False)
+    manager = SQLConnectionManager(min_size=0, max_size=2, role=role)
+    manager.opened = []
+
+    def connect():
+        conn = FakeConnection()
+        manager.opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(manager, "_connect", connect)
+    return manager
+
+
+def _executed(manager):
+    return [q for conn in manager.opened for q in conn.executed]
+
+
+def test_canceled_read_runs_once_and_keeps_the_connection(monkeypatch):
+    db = _manager(monkeypatch)
+
+    with pytest.raises(psycopg2.errors.QueryCanceled):
+        db.execute_query(SLOW_SQL, retry_count=2)
+
+    assert _executed(db) == [SLOW_SQL]
+    stats = db.get_pool_stats()
+    assert stats["retries"] == 0
+    assert stats["connections_discarded"] == 0
+    assert stats["idle"] == 1
+
+
+def test_canceled_reader_query_is_not_rerun(monkeypatch):
+    writer = _manager(monkeypatch)
+    writer.reader = _manager(monkeypatch, role="reader")
+    marked_down = []
+    monkeypatch.setattr(reader_health, "is_down", lambda: False)
+    monkeypatch.setattr(reader_health, "lag_check_due", lambda: False)
+    monkeypatch.setattr(reader_health, "usable", lambda: True)
+    monkeypatch.setattr(reader_health, "mark_down", marked_down.append)
+
+    with pytest.raises(psycopg2.errors.QueryCanceled):
+        writer.execute_query(SLOW_SQL, retry_count=2)
+
+    assert _executed(writer.reader) == [SLOW_SQL]
+    assert _executed(writer) == []
+    assert marked_down == []
+    assert writer.reader.get_pool_stats()["idle"] == 1
@@ -0,0 +1,22 @@
+from app.strands.infrastructure.database import connection
+from app.strands.infrastructure.database.connection import SQLConnectionManager
+from app.strands.infrastructure.database.instrumentation import template_hash
+
+
+def test_statement_names_hash_the_exact_sql(monkeypatch):
+    monkeypatch.setattr(connection, "resolve_db_config", lambda force_refresh=False: {
+        "host": "writer.local", "port": 5432, "db": "test", "user": "u", "password": "p",
+    })
+    manager = SQLConnectionManager(min_size=0, max_size=1)
+    upper = "SELECT * FROM t WHERE status = 'A'"
+    lower = "SELECT * FROM t WHERE status = 'a'"
+    spaced = "SELECT * FROM t WHERE status = 'a  b'"
+    single = "SELECT * FROM t WHERE status = 'a b'"
+
+    # Stats still group these templates together...
+    assert template_hash(upper) == template_hash(lower)
+    assert template_hash(spaced) == template_hash(single)
+    # ...but each one gets its own prepared statement.
+    assert manager._statement_name(upper) != manager._statement_name(lower)
+    assert manager._statement_name(spaced) != manager._statement_name(single)
+    assert manager._statement_name(upper) == manager._statement_name(upper)